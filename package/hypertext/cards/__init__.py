@@ -7,6 +7,7 @@ submodules directly with `python -m hypertext.cards.<module>`.
 __all__ = [
     # render.py
     "render_post",
+    "render_post_text",
     "POST_TEMPLATE",
     # composite.py
     "composite_card",
@@ -26,7 +27,7 @@ __all__ = [
 
 def __getattr__(name: str):
     """Lazy import for module exports."""
-    if name in ("render_post", "POST_TEMPLATE"):
+    if name in ("render_post", "render_post_text", "POST_TEMPLATE"):
         from hypertext.cards import render
         return getattr(render, name)
     elif name in ("composite_card", "CARD_WIDTH", "CARD_HEIGHT", "COLORS", "REGIONS"):
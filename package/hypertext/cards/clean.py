@@ -7,6 +7,8 @@ import os
 import sys
 import time
 
+from hypertext.gemini.transport import get_client
+
 try:
     from google import genai
     from google.genai import types
@@ -16,6 +18,46 @@ except Exception as e:  # pragma: no cover
     _IMPORT_ERROR = e
 
 
+def _detect_inline_attr() -> str | None:
+    """Return the name the installed SDK uses for a Part's inline data, if it can be told."""
+    if types is None:
+        return None
+    try:
+        sentinel = types.Part()
+    except Exception:
+        return None
+    for name in ("inline_data", "inlineData"):
+        if hasattr(sentinel, name):
+            return name
+    return None
+
+
+_INLINE_ATTR = _detect_inline_attr()
+
+
+def _inline_of(part):
+    if _INLINE_ATTR is not None:
+        return getattr(part, _INLINE_ATTR, None)
+    inline = getattr(part, "inline_data", None)
+    if inline is None:
+        inline = getattr(part, "inlineData", None)
+    return inline
+
+
+def _extract_first_image_bytes(parts) -> bytes | None:
+    """Return the first part's inline image bytes, stopping at the first hit."""
+    for part in parts:
+        inline = _inline_of(part)
+        if inline is None:
+            continue
+        data = getattr(inline, "data", None)
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, str):
+            return base64.b64decode(data)
+    return None
+
+
 def _text_part(text: str):
     fn = getattr(types.Part, "from_text", None)
     if callable(fn):
@@ -77,7 +119,7 @@ def clean_template(
     with open(in_path, "rb") as f:
         img_bytes = f.read()
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
 
     image_part = types.Part.from_bytes(data=img_bytes, mime_type="image/png")
 
@@ -105,7 +147,6 @@ def clean_template(
     if last_error is not None or resp is None:
         raise RuntimeError("Gemini request failed after retries.") from last_error
 
-    out_bytes: bytes | None = None
     parts = getattr(resp, "parts", None)
     if parts is None and getattr(resp, "candidates", None):
         try:
@@ -116,22 +157,7 @@ def clean_template(
     if not parts:
         raise RuntimeError(f"No parts returned. Response: {resp}")
 
-    for part in parts:
-        inline = getattr(part, "inline_data", None)
-        if inline is None:
-            inline = getattr(part, "inlineData", None)
-        if inline is None:
-            continue
-
-        data = getattr(inline, "data", None)
-        if data is None:
-            continue
-        if isinstance(data, bytes):
-            out_bytes = data
-            break
-        if isinstance(data, str):
-            out_bytes = base64.b64decode(data)
-            break
+    out_bytes = _extract_first_image_bytes(parts)
 
     if not out_bytes:
         raise RuntimeError(f"No image inline_data found. Response: {resp}")
@@ -9,14 +9,12 @@ import sys
 from hypertext.cards.clean import clean_template
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Remove brackets from generated card image")
-    parser.add_argument("in_path", help="Input image path")
-    parser.add_argument("out_path", nargs="?", help="Output image path (defaults to overwrite input)")
+def polish_image(in_path: str, out_path: str | None = None) -> int:
+    """Remove brackets from a generated card image.
 
-    args = parser.parse_args()
-    in_path = args.in_path
-    out_path = args.out_path or in_path
+    Returns 0 on success, 1 on failure (mirrors the CLI exit code).
+    """
+    out_path = out_path or in_path
 
     if not os.path.exists(in_path):
         print(f"Error: {in_path} not found.")
@@ -53,5 +51,14 @@ def main() -> int:
 
     return 0
 
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Remove brackets from generated card image")
+    parser.add_argument("in_path", help="Input image path")
+    parser.add_argument("out_path", nargs="?", help="Output image path (defaults to overwrite input)")
+
+    args = parser.parse_args()
+    return polish_image(args.in_path, args.out_path)
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -22,12 +22,15 @@ POST_TEMPLATE = """# Hypertext — {word}
 """
 
 
+# Bound once at import; the template is fixed for the life of the process
+_format_post = POST_TEMPLATE.format
+
+
 def bullet_lines(items):
     return "\n".join([f"- {x}" for x in items])
 
 
-def render_post(
-    out_path: str,
+def render_post_text(
     *,
     word: str,
     gloss: str,
@@ -37,8 +40,9 @@ def render_post(
     nt_snip: str,
     trivia_items: list[str],
     image_rel_path: str,
-):
-    content = POST_TEMPLATE.format(
+) -> str:
+    """Return the post.md markdown for a card."""
+    return _format_post(
         word=word,
         gloss=gloss,
         ot_ref=ot_ref,
@@ -48,9 +52,26 @@ def render_post(
         trivia=bullet_lines(trivia_items),
         image_rel_path=image_rel_path,
     )
+
+
+def render_post(out_path: str, **fields) -> bool:
+    """Write post.md to out_path; see render_post_text for the fields.
+
+    The file is left untouched when it already holds the same markdown
+    (revise and rebuild often re-render an unchanged post). Returns True if
+    the file was written.
+    """
+    content = render_post_text(**fields)
+    try:
+        with open(out_path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(content)
+    return True
 
 
 if __name__ == "__main__":
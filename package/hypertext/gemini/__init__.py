@@ -8,10 +8,13 @@ __all__ = [
     # text.py
     "generate_text",
     "generate_text_with_grounding",
+    "generate_texts",
     # image.py
     "generate_image",
+    "generate_images",
     # style.py
     "generate_with_styles",
+    "generate_many_with_styles",
     "generate_with_style",
     # review.py
     "CardDescription",
@@ -20,6 +23,9 @@ __all__ = [
     "describe_card_style_references",
     "score_against_rubric",
     "review_card",
+    "review_card_async",
+    "review_cards",
+    "review_cards_batch",
     "format_description_report",
     "format_review_report",
 ]
@@ -27,13 +33,13 @@ __all__ = [
 
 def __getattr__(name: str):
     """Lazy import for module exports."""
-    if name in ("generate_text", "generate_text_with_grounding"):
+    if name in ("generate_text", "generate_text_with_grounding", "generate_texts"):
         from hypertext.gemini import text
         return getattr(text, name)
-    elif name == "generate_image":
+    elif name in ("generate_image", "generate_images"):
         from hypertext.gemini import image
         return getattr(image, name)
-    elif name in ("generate_with_styles", "generate_with_style"):
+    elif name in ("generate_with_styles", "generate_many_with_styles", "generate_with_style"):
         from hypertext.gemini import style
         return getattr(style, name)
     elif name in (
@@ -42,6 +48,9 @@ def __getattr__(name: str):
         "describe_card",
         "score_against_rubric",
         "review_card",
+        "review_card_async",
+        "review_cards",
+        "review_cards_batch",
         "format_description_report",
         "format_review_report",
     ):
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""On-disk cache of generated images, keyed by the exact request.
+
+Image generation is sampled, so the same request normally yields a new image
+each time; the pipeline relies on that when it regenerates a card that failed
+review. The cache is therefore opt-in: set HYPERTEXT_CACHE_DIR to a directory
+and identical requests (same prompt, reference image bytes and settings) are
+served from there instead of calling Gemini again.
+
+Prompts are compared after whitespace normalization only. Near-duplicate
+prompts are deliberately not matched: two card prompts that differ in a
+single field (the word, a verse) must not share an image.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+
+_WS_RE = re.compile(r"\s+")
+
+
+def cache_dir() -> Path | None:
+    """Return the image cache directory, or None if caching is disabled."""
+    value = os.environ.get("HYPERTEXT_CACHE_DIR", "").strip()
+    return Path(value) if value else None
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace runs so prompts differing only in spacing or line endings share a key."""
+    return _WS_RE.sub(" ", prompt).strip()
+
+
+def request_key(*chunks: str | bytes) -> str:
+    """Hash the request inputs (prompt text, image bytes, settings) into a cache key."""
+    h = hashlib.sha256()
+    for chunk in chunks:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        # Length-prefix each chunk so ("ab", "c") and ("a", "bc") differ
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def load_cached_image(key: str, out_path: str) -> bool:
+    """Copy the cached image for key to out_path. Returns False on a miss."""
+    root = cache_dir()
+    if root is None:
+        return False
+    cached = root / f"{key}.png"
+    if not cached.is_file():
+        return False
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    shutil.copyfile(cached, out_path)
+    return True
+
+
+def store_cached_image(key: str, image_bytes: bytes) -> None:
+    """Save image_bytes under key (no-op when caching is disabled)."""
+    root = cache_dir()
+    if root is None:
+        return
+    root.mkdir(parents=True, exist_ok=True)
+    tmp = root / f".{key}.{os.getpid()}.tmp"
+    tmp.write_bytes(image_bytes)
+    os.replace(tmp, root / f"{key}.png")
+
+
+def store_cached_file(key: str, path: str) -> None:
+    """Copy an already-written image file into the cache under key (no-op when disabled)."""
+    root = cache_dir()
+    if root is None:
+        return
+    root.mkdir(parents=True, exist_ok=True)
+    tmp = root / f".{key}.{os.getpid()}.tmp"
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, root / f"{key}.png")
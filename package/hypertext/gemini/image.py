@@ -1,44 +1,76 @@
 #!/usr/bin/env python3
-"""Gemini image generation using pure urllib.
+"""Gemini image generation over the stdlib keep-alive transport.
 
 This module provides basic image generation from text prompts
 without style references. For style-referenced generation,
 use hypertext.gemini.style instead.
 """
 
-import base64
 import json
 import os
-import random
+import re
+import shutil
 import sys
 import time
 import urllib.error
-import urllib.request
-
-GEMINI_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/gemini-3-pro-image-preview:generateContent"
-
-
-def _parse_retry_after_seconds(headers) -> int | None:
-    if not headers:
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from hypertext.gemini.cache import load_cached_image, normalize_prompt, request_key, store_cached_file
+from hypertext.gemini.ratelimit import close_gate, gate_key, wait_for_gate
+from hypertext.gemini.transport import (
+    API_HOST,
+    RETRIABLE_STATUSES,
+    backoff_delay,
+    decode_json,
+    encode_json,
+    parse_retry_after_seconds,
+    post_bytes,
+    read_http_error_body,
+    write_image_atomic,
+)
+
+GEMINI_PATH = "/v1beta/models/gemini-3-pro-image-preview:generateContent"
+GEMINI_ENDPOINT = f"https://{API_HOST}{GEMINI_PATH}"
+
+# First image inlineData in a response, in the field order the API emits.
+# Lets generate_image pull the base64 payload out of a multi-MB response
+# without building the whole JSON tree; anything else falls back to parsing.
+_INLINE_IMAGE_RE = re.compile(rb'"inlineData"\s*:\s*\{\s*"mimeType"\s*:\s*"image/[^"]*"\s*,\s*"data"\s*:\s*"')
+
+
+def _extract_image_b64_fast(raw: bytes) -> memoryview | None:
+    """Return the first image's base64 data (a zero-copy view of raw), or None if not found."""
+    match = _INLINE_IMAGE_RE.search(raw)
+    if match is None:
         return None
-    value = headers.get("Retry-After")
-    if not value:
-        return None
-    try:
-        return int(value)
-    except ValueError:
+    start = match.end()
+    end = raw.find(b'"', start)
+    # JSON escapes would need real decoding, and an empty payload is not an
+    # image; leave both to the parser
+    if end <= start or raw.find(b"\\", start, end) >= 0:
         return None
+    return memoryview(raw)[start:end]
 
 
-def _read_http_error_body(e: urllib.error.HTTPError) -> str:
+def _find_image_b64(raw: bytes) -> str:
+    """Parse the full response and return the first image's base64 data."""
+    text = raw.decode("utf-8", errors="replace")
     try:
-        body = e.read()
-    except Exception:
-        return ""
-    try:
-        return body.decode("utf-8", errors="replace")
-    except Exception:
-        return ""
+        data = decode_json(raw)
+    except ValueError as e:
+        raise RuntimeError(f"Gemini returned invalid JSON. Raw: {text[:500]}") from e
+
+    candidates = data.get("candidates", [])
+    if not candidates:
+        raise RuntimeError(f"No candidates returned. Raw: {text[:500]}")
+
+    parts = candidates[0].get("content", {}).get("parts", [])
+    for p in parts:
+        inline = p.get("inlineData")
+        if inline and inline.get("mimeType", "").startswith("image/") and inline.get("data"):
+            return inline["data"]
+
+    raise RuntimeError(f"No image inlineData found. Raw: {text[:800]}")
 
 
 def generate_image(
@@ -47,6 +79,7 @@ def generate_image(
     *,
     aspect_ratio: str = "2:3",
     image_size: str = "2K",
+    use_cache: bool = True,
 ) -> None:
     """Generate an image from a text prompt using Gemini.
 
@@ -55,6 +88,8 @@ def generate_image(
         out_path: Path where the generated PNG will be saved.
         aspect_ratio: Aspect ratio for the image (default "2:3" for cards).
         image_size: Image size setting (default "2K").
+        use_cache: If False, always call Gemini even when HYPERTEXT_CACHE_DIR
+            holds an image for this request (the new image replaces it).
 
     Raises:
         RuntimeError: If the API call fails or no image is returned.
@@ -84,37 +119,51 @@ def generate_image(
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": generation_config,
     }
+    request_body = encode_json(payload)
+
+    cache_key = request_key(GEMINI_ENDPOINT, normalize_prompt(prompt), json.dumps(generation_config, sort_keys=True))
+    if use_cache and load_cached_image(cache_key, out_path):
+        print(f"Using cached image for {out_path}", file=sys.stderr)
+        return
 
-    req = urllib.request.Request(
-        GEMINI_ENDPOINT,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json", "x-goog-api-key": api_key},
-        method="POST",
-    )
+    headers = {"Content-Type": "application/json", "x-goog-api-key": api_key}
 
     max_attempts = int(os.environ.get("GEMINI_MAX_ATTEMPTS", "6"))
     base_delay_s = float(os.environ.get("GEMINI_RETRY_BASE_DELAY_S", "2"))
     timeout_s = float(os.environ.get("GEMINI_HTTP_TIMEOUT_S", "120"))
+    max_gate_wait_s = float(os.environ.get("GEMINI_RATELIMIT_MAX_WAIT_S", "300"))
+    gate = gate_key("gemini_image", api_key, GEMINI_PATH)
 
     last_error: Exception | None = None
-    raw = ""
-    data: dict | None = None
+    raw = b""
 
     for attempt in range(1, max_attempts + 1):
+        wait_for_gate(gate, max_gate_wait_s)
         try:
-            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-                raw = resp.read().decode("utf-8")
-                data = json.loads(raw)
+            raw = post_bytes(GEMINI_PATH, request_body, headers, timeout_s)
             last_error = None
             break
+        except TimeoutError as e:
+            if attempt < max_attempts:
+                delay = backoff_delay(attempt, base_delay_s)
+                print(
+                    f"Gemini request timed out. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
+                    file=sys.stderr,
+                )
+                time.sleep(delay)
+                last_error = e
+                continue
+            raise
         except urllib.error.HTTPError as e:
-            body = _read_http_error_body(e)
-            retry_after = _parse_retry_after_seconds(getattr(e, "headers", None))
-            retriable = e.code in (429, 500, 502, 503, 504)
+            body = read_http_error_body(e)
+            retry_after = parse_retry_after_seconds(getattr(e, "headers", None))
+            retriable = e.code in RETRIABLE_STATUSES
+            if e.code == 429 and retry_after is not None:
+                # Let other workers and processes hold off too
+                close_gate(gate, retry_after)
 
             if retriable and attempt < max_attempts:
-                delay = retry_after if retry_after is not None else (base_delay_s * (2 ** (attempt - 1)))
-                delay = delay + random.random()
+                delay = backoff_delay(attempt, base_delay_s, retry_after)
                 print(
                     f"Gemini request failed with HTTP {e.code}. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
                     file=sys.stderr,
@@ -131,7 +180,7 @@ def generate_image(
             raise RuntimeError(msg) from e
         except urllib.error.URLError as e:
             if attempt < max_attempts:
-                delay = base_delay_s * (2 ** (attempt - 1)) + random.random()
+                delay = backoff_delay(attempt, base_delay_s)
                 print(
                     f"Gemini request failed with URLError: {e}. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
                     file=sys.stderr,
@@ -141,28 +190,72 @@ def generate_image(
                 continue
             raise
 
-    if last_error is not None or data is None:
+    if last_error is not None or not raw:
         raise RuntimeError("Gemini request failed after retries.") from last_error
 
-    candidates = data.get("candidates", [])
-    if not candidates:
-        raise RuntimeError(f"No candidates returned. Raw: {raw[:500]}")
+    image_b64 = _extract_image_b64_fast(raw)
+    if image_b64 is None:
+        image_b64 = memoryview(_find_image_b64(raw).encode("ascii"))
 
-    parts = candidates[0].get("content", {}).get("parts", [])
-    image_b64 = None
-    for p in parts:
-        inline = p.get("inlineData")
-        if inline and inline.get("mimeType", "").startswith("image/"):
-            image_b64 = inline.get("data")
-            break
+    write_image_atomic(image_b64, out_path)
+    store_cached_file(cache_key, out_path)
 
-    if not image_b64:
-        raise RuntimeError(f"No image inlineData found. Raw: {raw[:800]}")
 
-    img_bytes = base64.b64decode(image_b64)
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    with open(out_path, "wb") as f:
-        f.write(img_bytes)
+def generate_images(
+    jobs: list[tuple[str, str]],
+    *,
+    concurrency: int = 4,
+    aspect_ratio: str = "2:3",
+    image_size: str = "2K",
+) -> None:
+    """Generate several images concurrently.
+
+    Args:
+        jobs: (prompt, out_path) pairs. Jobs whose prompts differ only in
+            whitespace share one request; its image is copied to each out_path.
+        concurrency: Maximum requests in flight. Each worker thread keeps its
+            own keep-alive connection, and every request retries 429/5xx
+            with the same backoff as generate_image.
+        aspect_ratio: Aspect ratio for every image.
+        image_size: Image size setting for every image.
+
+    Raises:
+        RuntimeError: If any image fails; the others are still written.
+    """
+    # Identical prompts (e.g. the same card listed twice) are generated once
+    # and copied to the other out paths
+    groups: dict[str, list[str]] = {}
+    prompts: dict[str, str] = {}
+    for prompt, out_path in jobs:
+        key = request_key(normalize_prompt(prompt))
+        groups.setdefault(key, []).append(out_path)
+        prompts.setdefault(key, prompt)
+
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(groups) or 1))) as executor:
+        futures = {
+            executor.submit(generate_image, prompts[key], paths[0], aspect_ratio=aspect_ratio, image_size=image_size): key
+            for key, paths in groups.items()
+        }
+        for future in as_completed(futures):
+            first, *duplicates = groups[futures[future]]
+            try:
+                future.result()
+            except Exception as e:
+                failures.extend(f"{p}: {e}" for p in (first, *duplicates))
+                continue
+            for out_path in duplicates:
+                # The same job listed twice already has its image
+                if os.path.abspath(out_path) == os.path.abspath(first):
+                    continue
+                try:
+                    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+                    shutil.copyfile(first, out_path)
+                except OSError as e:
+                    failures.append(f"{out_path}: {e}")
+
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(jobs)} images failed:\n" + "\n".join(sorted(failures)))
 
 
 def main() -> int:
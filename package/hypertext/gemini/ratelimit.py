@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Cross-process "don't call before" gate for Gemini rate limits.
+
+When Gemini answers 429 with a Retry-After, the deadline is written to a small
+marker file. Every client (including other processes in the same batch) checks
+the marker before sending, and waits it out instead of spending a request on
+another 429. Markers live under HYPERTEXT_RATELIMIT_DIR when set, otherwise under
+the system temp directory, one per endpoint, model and API key (see gate_key).
+They are kept apart from the image cache so clearing one leaves the other alone.
+
+TokenBucket paces requests within one process so concurrent workers stay
+under a requests-per-minute limit instead of discovering it through 429s.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+def gate_key(endpoint: str, api_key: str, model: str) -> str:
+    """Name the gate for one endpoint, model and API key.
+
+    Quotas are per key and model, so a 429 for one key must not hold back
+    another key (or user) sharing the marker directory. The key is hashed so
+    it never appears in a file name.
+    """
+    digest = hashlib.blake2b(f"{api_key}\0{model}".encode("utf-8"), digest_size=8).hexdigest()
+    return f"{endpoint}-{digest}"
+
+
+def _gate_path(endpoint_key: str) -> Path:
+    root = os.environ.get("HYPERTEXT_RATELIMIT_DIR", "").strip()
+    base = Path(root) if root else Path(tempfile.gettempdir()) / "hypertext" / ".ratelimit"
+    return base / f"{endpoint_key}.json"
+
+
+def check_gate(endpoint_key: str) -> float:
+    """Return seconds to wait before calling endpoint_key (0 if it is open)."""
+    try:
+        with open(_gate_path(endpoint_key), "r", encoding="utf-8") as f:
+            not_before = float(json.load(f).get("not_before", 0))
+    except (OSError, ValueError, AttributeError, TypeError):
+        return 0.0
+    return max(0.0, not_before - time.time())
+
+
+def close_gate(endpoint_key: str, retry_after_s: float) -> None:
+    """Record that endpoint_key should not be called for retry_after_s seconds."""
+    if retry_after_s <= check_gate(endpoint_key):
+        return
+    path = _gate_path(endpoint_key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"not_before": time.time() + retry_after_s}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # The gate is an optimization; never fail a request over it
+        pass
+
+
+def wait_for_gate(endpoint_key: str, max_wait_s: float) -> None:
+    """Sleep until endpoint_key's gate opens.
+
+    Raises:
+        RuntimeError: If the gate stays closed for max_wait_s or longer.
+    """
+    gate = check_gate(endpoint_key)
+    if gate <= 0:
+        return
+    if gate >= max_wait_s:
+        raise RuntimeError(f"Gemini is rate-limited for another {gate:.0f}s; try again later.")
+    print(f"Gemini rate limit in effect. Waiting {gate:.1f}s before sending.", file=sys.stderr)
+    time.sleep(gate)
+
+
+class TokenBucket:
+    """Thread-safe requests-per-minute limiter allowing short bursts.
+
+    An rpm of 0 or less disables limiting.
+    """
+
+    def __init__(self, rpm: float, burst: int = 2):
+        self.rate = rpm / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_s = (1 - self.tokens) / self.rate
+            time.sleep(wait_s)
+
+    def drain(self) -> None:
+        """Empty the bucket (after a 429) so every waiting thread pauses."""
+        with self._lock:
+            self.tokens = 0.0
+            self.last_refill = time.monotonic()
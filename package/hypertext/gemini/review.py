@@ -10,14 +10,28 @@ to first observe, then judge.
 """
 
 import argparse
+import asyncio
 import base64
+import dataclasses
+import functools
+import hashlib
+import io
 import json
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from hypertext.gemini.cache import cache_dir
+from hypertext.gemini.ratelimit import TokenBucket
+from hypertext.gemini.style import _image_part_from_bytes
+from hypertext.gemini.transport import decode_json, encode_json, get_client
+
 try:
     from google import genai
     from google.genai import types
@@ -25,6 +39,19 @@ except ImportError:
     genai = None
     types = None
 
+# Pillow is optional; only needed for HYPERTEXT_REVIEW_DOWNSCALE=1
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# SDK API errors carry an HTTP status in .code; only these are worth retrying.
+# Errors without a code (connection drops, empty responses) are retried too.
+_RETRIABLE_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Client-side pacing for review requests; HYPERTEXT_GEMINI_RPM=0 (the default) disables it
+_BUCKET = TokenBucket(float(os.environ.get("HYPERTEXT_GEMINI_RPM", "0") or 0))
+
 
 @dataclass
 class CardDescription:
@@ -291,10 +318,10 @@ Return ONLY JSON in this exact format:
 ```
 """
 
-# Stage 2: Scoring prompt - compare description against expected content
-SCORE_PROMPT_TEMPLATE = """You are scoring a trading card based on a description of what was observed.
-
-## EXPECTED CONTENT:
+# Stage 2: Scoring prompt - compare description against expected content.
+# The per-card section and the rubric are kept apart so review_cards_batch
+# can send several cards with one copy of the rubric.
+SCORE_CARD_TEMPLATE = """## EXPECTED CONTENT:
 - Card Number: #{number} (format must be #XXX, not [#XXX] or XXX)
 - Word: {word}
 - Gloss: {gloss}
@@ -306,8 +333,9 @@ SCORE_PROMPT_TEMPLATE = """You are scoring a trading card based on a description
 
 ## OBSERVED DESCRIPTION:
 {description_json}
+"""
 
-## SCORING RUBRIC (100 points total):
+SCORE_RUBRIC_TEMPLATE = """## SCORING RUBRIC (100 points total):
 
 ### 1. FORMATTING & STRUCTURE (35 points max)
 - Card frame intact (5 pts) - deduct if frame broken or incomplete
@@ -374,6 +402,32 @@ Return ONLY JSON:
 ```
 """
 
+_SCORE_PREAMBLE = "You are scoring a trading card based on a description of what was observed.\n\n"
+
+SCORE_PROMPT_TEMPLATE = _SCORE_PREAMBLE + SCORE_CARD_TEMPLATE + "\n" + SCORE_RUBRIC_TEMPLATE
+
+# The rubric has no fields; resolve its escaped braces once so each prompt
+# only formats the per-card section
+_SCORE_RUBRIC = SCORE_RUBRIC_TEMPLATE.format()
+
+# Review batches: several card images share one describe request and one
+# score request. Kept small to stay within per-request image limits.
+REVIEW_BATCH_MAX = 4
+
+DESCRIBE_BATCH_SUFFIX = """
+## MULTIPLE CARDS
+
+You are given {count} card images, in order. Describe each card separately, following the instructions above for every card.
+Return ONLY a JSON array of {count} objects, one per card in image order, each in the format above.
+"""
+
+SCORE_BATCH_SUFFIX = """
+## MULTIPLE CARDS
+
+Score each of the {count} cards above (CARD 1 to CARD {count}) separately against its own expected content.
+Return ONLY a JSON array of {count} objects, one per card in order, each in the format above.
+"""
+
 RARITY_COLORS = {
     "COMMON": "white",
     "UNCOMMON": "green",
@@ -382,10 +436,52 @@ RARITY_COLORS = {
 }
 
 
+# Long side of images sent for review with HYPERTEXT_REVIEW_DOWNSCALE=1;
+# enough to read card text and check layout
+REVIEW_MAX_DIM = 1536
+REVIEW_JPEG_QUALITY = 85
+
+
+def _downscale_for_review(img_bytes: bytes, mime_type: str) -> tuple[bytes, str]:
+    """Shrink to REVIEW_MAX_DIM and re-encode as JPEG, keeping the original if that isn't smaller."""
+    if Image is None:
+        return img_bytes, mime_type
+    try:
+        with Image.open(io.BytesIO(img_bytes)) as img:
+            img.thumbnail((REVIEW_MAX_DIM, REVIEW_MAX_DIM), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, "JPEG", quality=REVIEW_JPEG_QUALITY)
+    except Exception:
+        return img_bytes, mime_type
+    out = buf.getvalue()
+    return (out, "image/jpeg") if len(out) < len(img_bytes) else (img_bytes, mime_type)
+
+
+@functools.lru_cache(maxsize=4)
+def _review_image_cached(path: str, mtime_ns: int, size: int, downscale: bool) -> tuple[bytes, str]:
+    # Style refs are re-sent for every card and every review attempt; the
+    # stat-derived key makes a regenerated image miss the cache, and the small
+    # size lets the stale versions of regenerated cards fall out quickly.
+    with open(path, "rb") as f:
+        img_bytes = f.read()
+    mime_type = _get_mime_type(Path(path))
+    return _downscale_for_review(img_bytes, mime_type) if downscale else (img_bytes, mime_type)
+
+
+def _review_image_key(image_path: Path) -> tuple[str, int, int, bool]:
+    st = os.stat(image_path)
+    downscale = os.environ.get("HYPERTEXT_REVIEW_DOWNSCALE", "").strip() == "1"
+    return str(image_path), st.st_mtime_ns, st.st_size, downscale
+
+
+def _read_review_image(image_path: Path) -> tuple[bytes, str]:
+    """Return the (bytes, mime type) sent for an image (cached while the file is unchanged)."""
+    return _review_image_cached(*_review_image_key(image_path))
+
+
 def _encode_image(image_path: Path) -> str:
     """Read and base64 encode an image file."""
-    with open(image_path, "rb") as f:
-        return base64.standard_b64encode(f.read()).decode("utf-8")
+    return base64.standard_b64encode(_read_review_image(image_path)[0]).decode("utf-8")
 
 
 def _get_mime_type(image_path: Path) -> str:
@@ -399,63 +495,91 @@ def _get_mime_type(image_path: Path) -> str:
     }.get(ext, "image/png")
 
 
+# Fenced JSON payloads in a model reply ("```json ... ```"); an unclosed final
+# fence runs to the end of the text
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\[{].*?)\s*(?:```|\Z)", re.DOTALL)
+
+
+def _fenced_json(raw: str, opener: str) -> list[str]:
+    """Return the fenced payloads in raw that start with opener, in order."""
+    return [m.group(1) for m in _JSON_FENCE_RE.finditer(raw) if m.group(1).startswith(opener)]
+
+
 def _parse_json_response(text: str) -> dict:
     """Parse JSON response from model, handling markdown fences."""
     raw = text.strip()
 
     # Try to extract from markdown code fence
-    if "```" in raw:
-        parts = raw.split("```")
-        for part in parts:
-            part = part.strip()
-            if part.startswith("json"):
-                part = part[4:].strip()
-            if part.startswith("{"):
-                try:
-                    return json.loads(part)
-                except json.JSONDecodeError:
-                    continue
+    for part in _fenced_json(raw, "{"):
+        try:
+            return decode_json(part)
+        except ValueError:
+            continue
 
     # Try direct parse
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as e:
+        return decode_json(raw)
+    except ValueError as e:
         raise RuntimeError(f"Failed to parse response as JSON: {e}\nResponse: {raw[:500]}")
 
 
-def _image_part_from_path(image_path: Path):
-    """Create an image part from a file path using the SDK."""
-    if types is None:
-        raise RuntimeError("google-genai package required. Install with: pip install google-genai")
-
-    with open(image_path, "rb") as f:
-        img_bytes = f.read()
-    mime_type = _get_mime_type(image_path)
-
-    image_part = None
-    if hasattr(types.Part, "from_bytes"):
+def _parse_json_list_response(text: str, count: int) -> list[dict] | None:
+    """Parse a batched JSON array response, or None unless it holds exactly count objects."""
+    raw = text.strip()
+    for candidate in [*_fenced_json(raw, "["), raw]:
         try:
-            image_part = types.Part.from_bytes(data=img_bytes, mime_type=mime_type)
-        except Exception:
-            pass
+            data = decode_json(candidate)
+        except ValueError:
+            continue
+        if isinstance(data, list) and len(data) == count and all(isinstance(d, dict) for d in data):
+            return data
+        return None
+    return None
+
+
+# With HYPERTEXT_REVIEW_FILE_API=1, review images at least this large are
+# uploaded once through the File API and referenced by URI, so retries and
+# repeat reviews don't resend them. Uploads expire after 48h; reuse them for 47.
+REVIEW_UPLOAD_MIN_BYTES = 1 << 20
+_UPLOAD_TTL_S = 47 * 3600
+_uploaded: dict[tuple[str, int, int, bool], tuple[str, str, float]] = {}
+_uploaded_lock = threading.Lock()
+
+
+def _uploaded_file_uri(client, image_path: Path, img_bytes: bytes, mime_type: str) -> tuple[str, str] | None:
+    """Return (file_uri, mime type) for an uploaded copy of the image, uploading it if needed."""
+    key = _review_image_key(image_path)
+    with _uploaded_lock:
+        hit = _uploaded.get(key)
+    if hit is not None and hit[2] > time.time():
+        return hit[0], hit[1]
+    try:
+        uploaded = client.files.upload(file=io.BytesIO(img_bytes), config=types.UploadFileConfig(mime_type=mime_type))
+    except Exception as e:
+        print(f"File upload failed for {image_path} ({e}); sending the image inline")
+        return None
+    entry = (uploaded.uri, uploaded.mime_type or mime_type, time.time() + _UPLOAD_TTL_S)
+    with _uploaded_lock:
+        _uploaded[key] = entry
+    return entry[0], entry[1]
 
-    if image_part is None and hasattr(types.Part, "from_image"):
-        try:
-            image_part = types.Part.from_image(image=img_bytes, mime_type=mime_type)
-        except Exception:
-            pass
 
-    if image_part is None:
-        try:
-            blob_cls = getattr(types, "Blob", None)
-            if blob_cls:
-                image_part = types.Part(inline_data=blob_cls(data=img_bytes, mime_type=mime_type))
-            else:
-                image_part = types.Part(inline_data={"mime_type": mime_type, "data": img_bytes})
-        except Exception as e:
-            raise RuntimeError(f"Failed to construct image part: {e}")
+def _image_part_from_path(image_path: Path, client=None):
+    """Create an image part from a file path using the SDK.
 
-    return image_part
+    Given a client and HYPERTEXT_REVIEW_FILE_API=1, large images are
+    referenced through the File API instead of inlined.
+    """
+    img_bytes, mime_type = _read_review_image(image_path)
+    if (
+        client is not None
+        and len(img_bytes) >= REVIEW_UPLOAD_MIN_BYTES
+        and os.environ.get("HYPERTEXT_REVIEW_FILE_API", "").strip() == "1"
+    ):
+        uploaded = _uploaded_file_uri(client, image_path, img_bytes, mime_type)
+        if uploaded is not None:
+            return types.Part.from_uri(file_uri=uploaded[0], mime_type=uploaded[1])
+    return _image_part_from_bytes(img_bytes, mime_type)
 
 
 def _call_gemini(
@@ -466,6 +590,8 @@ def _call_gemini(
     model: str = "gemini-3-pro-preview",
     max_attempts: int = 3,
     base_delay_s: float = 2.0,
+    max_delay_s: float = 30.0,
+    max_total_s: float = 120.0,
 ) -> str:
     """Make a Gemini API call using the SDK, optionally with image(s).
 
@@ -475,7 +601,9 @@ def _call_gemini(
         image_paths: List of image paths (for multi-image comparison)
         model: Model to use
         max_attempts: Number of retry attempts
-        base_delay_s: Base delay for exponential backoff
+        base_delay_s: Minimum delay between retries
+        max_delay_s: Maximum delay between retries
+        max_total_s: Retry budget; no retry is scheduled past it (monotonic clock)
     """
     if genai is None:
         raise RuntimeError("google-genai package required. Install with: pip install google-genai")
@@ -484,15 +612,15 @@ def _call_gemini(
     if not api_key:
         raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY environment variable required")
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
 
     contents = []
     # Handle multiple images first (for reference comparison)
     if image_paths:
         for img_path in image_paths:
-            contents.append(_image_part_from_path(img_path))
+            contents.append(_image_part_from_path(img_path, client))
     elif image_path:
-        contents.append(_image_part_from_path(image_path))
+        contents.append(_image_part_from_path(image_path, client))
     contents.append(types.Part.from_text(text=prompt))
 
     config = types.GenerateContentConfig(
@@ -501,7 +629,12 @@ def _call_gemini(
     )
 
     last_error: Exception | None = None
+    attempts_made = 0
+    delay_s = base_delay_s
+    deadline = time.monotonic() + max_total_s
     for attempt in range(max_attempts):
+        attempts_made += 1
+        _BUCKET.acquire()
         try:
             response = client.models.generate_content(
                 model=model,
@@ -526,10 +659,21 @@ def _call_gemini(
 
         except Exception as e:
             last_error = e
+            code = getattr(e, "code", None)
+            if isinstance(code, int) and code not in _RETRIABLE_CODES:
+                # Bad request, bad key, etc.: retrying cannot help
+                raise RuntimeError(f"API call failed with HTTP {code}: {e}") from e
+            if code == 429:
+                # Rate limited: make the other review threads back off too
+                _BUCKET.drain()
             if attempt < max_attempts - 1:
-                time.sleep(base_delay_s * (2 ** attempt))
+                # Decorrelated jitter: concurrent reviews retry at different times
+                delay_s = min(max_delay_s, random.uniform(base_delay_s, delay_s * 3))
+                if time.monotonic() + delay_s >= deadline:
+                    break
+                time.sleep(delay_s)
 
-    raise RuntimeError(f"API call failed after {max_attempts} attempts: {last_error}")
+    raise RuntimeError(f"API call failed after {attempts_made} attempts: {last_error}")
 
 
 def describe_card_style_references(
@@ -585,67 +729,20 @@ def describe_card_style_references(
         return f"Error analyzing style references: {e}"
 
 
-def describe_card(
-    image_path: Path,
-    *,
-    style_refs: list[str | Path] | None = None,
-    style_rubric: str | None = None,
-    model: str | None = None,
-) -> CardDescription:
-    """Stage 1: Have the LLM describe what it sees on the card.
-
-    This is a pure observation step - no judgment or scoring.
-    When style_refs are provided, also checks if card matches reference style.
-
-    Args:
-        image_path: Path to the card image to describe
-        style_refs: Optional list of reference image paths for style comparison
-        style_rubric: Optional pre-generated description of correct style (from describe_card_style_references)
-        model: Gemini model to use
-    """
-    model = model or os.environ.get("GEMINI_REVIEW_MODEL", "gemini-3-pro-preview")
-
-    if style_refs:
-        # Build image list: refs first, then test card
-        image_paths = []
-        labels = []
-
-        for i, ref_path in enumerate(style_refs, 1):
-            ref_p = Path(ref_path)
-            if ref_p.exists():
-                image_paths.append(ref_p)
-                labels.append(f"[{i}] REFERENCE: {ref_p.name}")
-
-        # Add the test card
-        test_idx = len(image_paths) + 1
-        image_paths.append(Path(image_path))
-        labels.append(f"[{test_idx}] TEST CARD: {Path(image_path).name}")
-
-        # Use the reference comparison prompt with style rubric
-        ref_count = len(style_refs)
-        rubric_text = style_rubric or "No pre-analyzed rubric available. Compare visually to reference images."
-        prompt = DESCRIBE_WITH_REFS_PROMPT.format(
-            style_rubric=rubric_text,
-            image_labels="\n".join(labels),
-            ref_count=ref_count if ref_count > 0 else 1,
-            test_idx=test_idx,
-        )
-
-        response_text = _call_gemini(
-            prompt,
-            image_paths=image_paths,
-            model=model,
-        )
-    else:
-        # No refs, use simple describe prompt
-        response_text = _call_gemini(
-            DESCRIBE_PROMPT,
-            image_path=image_path,
-            model=model,
-        )
+@functools.lru_cache(maxsize=64)
+def _describe_with_refs_prompt(style_rubric: str, image_labels: str, ref_count: int, test_idx: int) -> str:
+    # The review loop re-describes the same card against the same refs and
+    # multi-KB rubric on every attempt; format that prompt once per card
+    return DESCRIBE_WITH_REFS_PROMPT.format(
+        style_rubric=style_rubric,
+        image_labels=image_labels,
+        ref_count=ref_count,
+        test_idx=test_idx,
+    )
 
-    data = _parse_json_response(response_text)
 
+def _description_from_data(data: dict, response_text: str) -> CardDescription:
+    """Build a CardDescription from one parsed describe response, applying the automatic style checks."""
     # Check for automatic style mismatch based on specific fields
     verse_style = data.get("verse_label_style", "centered_above")
     frame_corners = data.get("frame_corner_style", "chamfered").lower()
@@ -732,18 +829,71 @@ def describe_card(
     )
 
 
-def score_against_rubric(
-    description: CardDescription,
-    card_json: dict,
+def describe_card(
+    image_path: Path,
     *,
+    style_refs: list[str | Path] | None = None,
+    style_rubric: str | None = None,
     model: str | None = None,
-) -> ReviewResult:
-    """Stage 2: Score the description against the expected content and rubric.
+) -> CardDescription:
+    """Stage 1: Have the LLM describe what it sees on the card.
 
-    This is a pure judgment step - comparing observations to expectations.
+    This is a pure observation step - no judgment or scoring.
+    When style_refs are provided, also checks if card matches reference style.
+
+    Args:
+        image_path: Path to the card image to describe
+        style_refs: Optional list of reference image paths for style comparison
+        style_rubric: Optional pre-generated description of correct style (from describe_card_style_references)
+        model: Gemini model to use
     """
     model = model or os.environ.get("GEMINI_REVIEW_MODEL", "gemini-3-pro-preview")
 
+    if style_refs:
+        # Build image list: refs first, then test card
+        image_paths = []
+        labels = []
+
+        for i, ref_path in enumerate(style_refs, 1):
+            ref_p = Path(ref_path)
+            if ref_p.exists():
+                image_paths.append(ref_p)
+                labels.append(f"[{i}] REFERENCE: {ref_p.name}")
+
+        # Add the test card
+        test_idx = len(image_paths) + 1
+        image_paths.append(Path(image_path))
+        labels.append(f"[{test_idx}] TEST CARD: {Path(image_path).name}")
+
+        # Use the reference comparison prompt with style rubric
+        ref_count = len(style_refs)
+        rubric_text = style_rubric or "No pre-analyzed rubric available. Compare visually to reference images."
+        prompt = _describe_with_refs_prompt(
+            rubric_text,
+            "\n".join(labels),
+            ref_count if ref_count > 0 else 1,
+            test_idx,
+        )
+
+        response_text = _call_gemini(
+            prompt,
+            image_paths=image_paths,
+            model=model,
+        )
+    else:
+        # No refs, use simple describe prompt
+        response_text = _call_gemini(
+            DESCRIBE_PROMPT,
+            image_path=image_path,
+            model=model,
+        )
+
+    data = _parse_json_response(response_text)
+    return _description_from_data(data, response_text)
+
+
+def _score_fields(description: CardDescription, card_json: dict) -> dict:
+    """Return the SCORE_CARD_TEMPLATE fields for one card."""
     # Extract expected content
     content = card_json.get("content", {})
     word = content.get("WORD", "UNKNOWN")
@@ -790,7 +940,7 @@ def score_against_rubric(
         "garbled_text_locations": description.garbled_text_locations,
     }
 
-    prompt = SCORE_PROMPT_TEMPLATE.format(
+    return dict(
         number=number,
         word=word,
         gloss=gloss,
@@ -804,9 +954,9 @@ def score_against_rubric(
         description_json=json.dumps(description_dict, indent=2),
     )
 
-    response_text = _call_gemini(prompt, model=model)
-    review_data = _parse_json_response(response_text)
 
+def _review_result_from_data(review_data: dict, description: CardDescription, response_text: str) -> ReviewResult:
+    """Build a ReviewResult from one parsed score response."""
     total_score = review_data.get("total_score", 0)
 
     categories = {
@@ -829,6 +979,30 @@ def score_against_rubric(
     )
 
 
+def score_against_rubric(
+    description: CardDescription,
+    card_json: dict,
+    *,
+    model: str | None = None,
+) -> ReviewResult:
+    """Stage 2: Score the description against the expected content and rubric.
+
+    This is a pure judgment step - comparing observations to expectations.
+    """
+    model = model or os.environ.get("GEMINI_REVIEW_MODEL", "gemini-3-pro-preview")
+
+    prompt = "".join([
+        _SCORE_PREAMBLE,
+        SCORE_CARD_TEMPLATE.format(**_score_fields(description, card_json)),
+        "\n",
+        _SCORE_RUBRIC,
+    ])
+
+    response_text = _call_gemini(prompt, model=model)
+    review_data = _parse_json_response(response_text)
+    return _review_result_from_data(review_data, description, response_text)
+
+
 def review_card(
     image_path: Path,
     card_json: dict,
@@ -845,16 +1019,234 @@ def review_card(
 
     This separation ensures more accurate evaluation.
     """
-    model = model or os.environ.get("GEMINI_REVIEW_MODEL", "gemini-3-pro-preview")
+    return review_cards_batch([(image_path, card_json)], model=model, pass_threshold=pass_threshold)[0]
 
+
+def _review_single(image_path: Path, card_json: dict, *, model: str) -> ReviewResult:
     # Stage 1: Describe
     description = describe_card(image_path, model=model)
 
     # Stage 2: Score
-    result = score_against_rubric(description, card_json, model=model)
-    result.passed = result.score >= pass_threshold
+    return score_against_rubric(description, card_json, model=model)
+
+
+def _review_chunk(chunk: list[tuple[Path, dict]], *, model: str) -> list[ReviewResult]:
+    """Review up to REVIEW_BATCH_MAX cards with one describe and one score request."""
+    if len(chunk) == 1:
+        return [_review_single(chunk[0][0], chunk[0][1], model=model)]
+
+    n = len(chunk)
+    describe_text = _call_gemini(
+        DESCRIBE_PROMPT + DESCRIBE_BATCH_SUFFIX.format(count=n),
+        image_paths=[Path(image_path) for image_path, _ in chunk],
+        model=model,
+    )
+    described = _parse_json_list_response(describe_text, n)
+    if described is None:
+        print(f"Batch describe did not return {n} descriptions; reviewing cards one by one")
+        return [_review_single(image_path, card_json, model=model) for image_path, card_json in chunk]
+    descriptions = [_description_from_data(data, describe_text) for data in described]
+
+    prompt = "".join([
+        f"You are scoring {n} trading cards, each based on a description of what was observed.\n\n",
+        *(
+            f"# CARD {i}\n\n" + SCORE_CARD_TEMPLATE.format(**_score_fields(description, card_json)) + "\n"
+            for i, (description, (_, card_json)) in enumerate(zip(descriptions, chunk), 1)
+        ),
+        _SCORE_RUBRIC,
+        SCORE_BATCH_SUFFIX.format(count=n),
+    ])
+    score_text = _call_gemini(prompt, model=model)
+    scored = _parse_json_list_response(score_text, n)
+    if scored is None:
+        print(f"Batch scoring did not return {n} results; scoring cards one by one")
+        return [
+            score_against_rubric(description, card_json, model=model)
+            for description, (_, card_json) in zip(descriptions, chunk)
+        ]
+    return [
+        _review_result_from_data(review_data, description, score_text)
+        for review_data, description in zip(scored, descriptions)
+    ]
+
+
+# Fingerprint of every review prompt; editing any of them invalidates cached reviews
+_REVIEW_PROMPT_VERSION = hashlib.blake2b(
+    "\0".join([DESCRIBE_PROMPT, SCORE_PROMPT_TEMPLATE, DESCRIBE_BATCH_SUFFIX, SCORE_BATCH_SUFFIX]).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+def _review_cache_dir() -> Path | None:
+    """Directory for cached review results, or None unless HYPERTEXT_REVIEW_CACHE=1."""
+    if os.environ.get("HYPERTEXT_REVIEW_CACHE", "").strip() != "1":
+        return None
+    return (cache_dir() or Path(".cache")) / "reviews"
+
+
+def _review_cache_key(image_path: Path, card_json: dict, model: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_read_review_image(Path(image_path))[0])
+    h.update(json.dumps(card_json.get("content", {}), sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    h.update(f"{model}\0{_REVIEW_PROMPT_VERSION}".encode("utf-8"))
+    return h.hexdigest()
 
-    return result
+
+def _load_cached_review(path: Path) -> ReviewResult | None:
+    try:
+        data = decode_json(path.read_bytes())
+        description = data.pop("description", None)
+        return ReviewResult(**data, description=CardDescription(**description) if description else None)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_review(path: Path, result: ReviewResult) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(encode_json(dataclasses.asdict(result)))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# Card images are 2:3 portrait; a generation at another aspect ratio fails
+# layout review outright, so it is rejected before spending API calls on it
+CARD_ASPECT_RATIO = 2 / 3
+CARD_ASPECT_TOLERANCE = 0.02
+
+
+def _image_size(image_path: Path) -> tuple[int, int] | None:
+    """Return (width, height) from the image header, or None if it can't be read."""
+    if Image is not None:
+        try:
+            with Image.open(image_path) as img:
+                return img.size
+        except Exception:
+            return None
+    # Without Pillow, read a PNG's IHDR chunk directly
+    try:
+        with open(image_path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or not header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return None
+    return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+
+
+def _quick_validate(image_path: Path) -> list[str]:
+    """Local checks that fail a card image without a review call."""
+    try:
+        if os.path.getsize(image_path) == 0:
+            return [f"Card image is empty: {image_path}"]
+    except OSError:
+        return [f"Card image is missing: {image_path}"]
+    size = _image_size(Path(image_path))
+    if size is not None and size[1] > 0:
+        ratio = size[0] / size[1]
+        if abs(ratio - CARD_ASPECT_RATIO) > CARD_ASPECT_RATIO * CARD_ASPECT_TOLERANCE:
+            return [f"Card image is {size[0]}x{size[1]}; regenerate at a 2:3 aspect ratio"]
+    return []
+
+
+def review_cards_batch(
+    items: list[tuple[Path, dict]],
+    *,
+    model: str | None = None,
+    pass_threshold: int = 90,
+    batch_size: int = REVIEW_BATCH_MAX,
+) -> list[ReviewResult]:
+    """Two-stage review of several card images, batch_size cards per request.
+
+    Each batch is described in one request (all card images, one JSON
+    description per card) and scored in another (the rubric sent once for
+    every card). If the model returns the wrong number of entries, that
+    batch falls back to reviewing each card on its own.
+
+    With HYPERTEXT_REVIEW_CACHE=1, results are stored under the cache
+    directory keyed by image bytes, card content, model and prompt version,
+    so unchanged cards are not reviewed again. Missing, empty or wrongly
+    proportioned images fail with score 0 without any request.
+
+    Args:
+        items: (image_path, card_json) pairs.
+        model: Gemini model to use.
+        pass_threshold: Minimum score to pass.
+        batch_size: Cards per request, capped at REVIEW_BATCH_MAX.
+
+    Returns:
+        One ReviewResult per item, in order.
+    """
+    model = model or os.environ.get("GEMINI_REVIEW_MODEL", "gemini-3-pro-preview")
+    batch_size = max(1, min(batch_size, REVIEW_BATCH_MAX))
+
+    results: list[ReviewResult | None] = [None] * len(items)
+    for i, (image_path, _) in enumerate(items):
+        issues = _quick_validate(image_path)
+        if issues:
+            results[i] = ReviewResult(score=0, passed=False, categories={}, corrections=issues, needs_rebuild=True)
+
+    # With HYPERTEXT_REVIEW_CACHE=1, an unchanged image reviewed against the
+    # same content, model and prompts reuses the stored result
+    cache_paths: list[Path | None] = [None] * len(items)
+    root = _review_cache_dir()
+    if root is not None:
+        for i, (image_path, card_json) in enumerate(items):
+            if results[i] is None:
+                cache_paths[i] = root / f"{_review_cache_key(image_path, card_json, model)}.json"
+                results[i] = _load_cached_review(cache_paths[i])
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    for start in range(0, len(pending), batch_size):
+        indices = pending[start:start + batch_size]
+        for i, result in zip(indices, _review_chunk([items[i] for i in indices], model=model)):
+            results[i] = result
+            if cache_paths[i] is not None:
+                _store_cached_review(cache_paths[i], result)
+
+    for result in results:
+        result.passed = result.score >= pass_threshold
+    return results
+
+
+def review_cards(
+    items: list[tuple[Path, dict]],
+    *,
+    model: str | None = None,
+    pass_threshold: int = 90,
+    max_workers: int = 8,
+) -> list[ReviewResult]:
+    """Review several card images concurrently, one review_card per image.
+
+    Reviews are network-bound, so a thread pool overlaps their waits; keep
+    max_workers within the API's requests-per-minute limit.
+
+    Returns:
+        One ReviewResult per item, in order. The first failed review is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items) or 1))) as executor:
+        futures = [
+            executor.submit(review_card, image_path, card_json, model=model, pass_threshold=pass_threshold)
+            for image_path, card_json in items
+        ]
+        return [future.result() for future in futures]
+
+
+async def review_card_async(
+    image_path: Path,
+    card_json: dict,
+    *,
+    model: str | None = None,
+    pass_threshold: int = 90,
+) -> ReviewResult:
+    """review_card as a coroutine, so an asyncio caller can gather it with other work.
+
+    The review runs on the default executor's worker thread (the SDK client
+    is synchronous), leaving the event loop free meanwhile.
+    """
+    return await asyncio.to_thread(review_card, image_path, card_json, model=model, pass_threshold=pass_threshold)
 
 
 def format_description_report(description: CardDescription) -> str:
@@ -918,13 +1310,11 @@ def format_review_report(result: ReviewResult) -> str:
         status = "✓" if score == max_score else "⚠" if score >= max_score * 0.7 else "✗"
         lines.append(f"- {status} {name.replace('_', ' ').title()}: {score}/{max_score}")
 
-        for issue in issues:
-            lines.append(f"  - {issue}")
+        lines.extend(f"  - {issue}" for issue in issues)
 
     if result.corrections:
         lines.extend(["", "### Corrections Needed:"])
-        for i, correction in enumerate(result.corrections, 1):
-            lines.append(f"{i}. {correction}")
+        lines.extend(f"{i}. {correction}" for i, correction in enumerate(result.corrections, 1))
 
     lines.extend([
         "",
@@ -947,7 +1337,8 @@ def describe_palette(image_path: Path, model: str | None = None) -> str:
     if genai is None:
         raise ImportError("google-genai package required")
 
-    client = genai.Client()
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+    client = get_client(api_key) if api_key else genai.Client()
     model_name = model or os.environ.get("GEMINI_MODEL", "gemini-2.0-flash")
 
     with open(image_path, "rb") as f:
@@ -997,8 +1388,8 @@ def main() -> int:
             print("ERROR: card_json_path is required for full review (use --describe-only for description only)")
             return 1
 
-        with open(args.card_json_path, "r", encoding="utf-8") as f:
-            card_data = json.load(f)
+        with open(args.card_json_path, "rb") as f:
+            card_data = decode_json(f.read())
 
         result = review_card(
             Path(args.image_path),
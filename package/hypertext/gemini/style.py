@@ -6,11 +6,18 @@ images that follow the visual style of provided reference images.
 """
 
 import argparse
-import base64
+import functools
+import glob
+import hashlib
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from hypertext.gemini.cache import load_cached_image, normalize_prompt, request_key, store_cached_file
+from hypertext.gemini.transport import get_client, write_image_atomic
+
 try:
     from google import genai
     from google.genai import types
@@ -19,92 +26,151 @@ except ImportError:
     types = None
 
 
-def _read_image_bytes(path: str) -> bytes:
-    """Read image file as bytes."""
+# Pillow is optional; only needed for HYPERTEXT_TEMPLATE_TRANSCODE=1
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+_MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}
+
+
+@functools.lru_cache(maxsize=16)
+def _load_image_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    # The template and example refs are the same files for every card in a
+    # batch; the stat-derived key makes edited files miss the cache.
     with open(path, "rb") as f:
         return f.read()
 
 
-def _image_part_from_bytes(img_bytes: bytes):
-    """Create a Gemini Part from image bytes with SDK compatibility fallbacks."""
+def _mime_type_for_path(path: str) -> str:
+    return _MIME_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+
+
+# Reference images above either limit are re-encoded before upload when
+# HYPERTEXT_TEMPLATE_TRANSCODE=1 (they are base64-ed into every request)
+_TRANSCODE_MIN_BYTES = 1 << 20
+_TRANSCODE_MAX_SIDE = 2048
+
+
+def _maybe_transcode(img_bytes: bytes, mime_type: str, max_side: int = _TRANSCODE_MAX_SIDE) -> tuple[bytes, str]:
+    """Downscale to max_side and re-encode as lossless WebP if that makes the upload smaller."""
+    if Image is None:
+        return img_bytes, mime_type
+    try:
+        with Image.open(io.BytesIO(img_bytes)) as img:
+            img.load()
+            too_large = max(img.size) > max_side
+            if not too_large and len(img_bytes) <= _TRANSCODE_MIN_BYTES:
+                return img_bytes, mime_type
+            if too_large:
+                img.thumbnail((max_side, max_side), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, format="WEBP", lossless=True)
+    except Exception:
+        # Unreadable image or no WebP support in this Pillow build
+        return img_bytes, mime_type
+    out = buf.getvalue()
+    if not too_large and len(out) >= len(img_bytes):
+        return img_bytes, mime_type
+    return out, "image/webp"
+
+
+@functools.lru_cache(maxsize=16)
+def _load_transcoded_cached(path: str, mtime_ns: int, size: int) -> tuple[bytes, str]:
+    return _maybe_transcode(_load_image_cached(path, mtime_ns, size), _mime_type_for_path(path))
+
+
+def _read_reference_image(path: str) -> tuple[bytes, str]:
+    """Return (bytes, mime type) to upload for a reference image."""
+    st = os.stat(path)
+    if os.environ.get("HYPERTEXT_TEMPLATE_TRANSCODE", "").strip() == "1":
+        return _load_transcoded_cached(str(path), st.st_mtime_ns, st.st_size)
+    return _load_image_cached(str(path), st.st_mtime_ns, st.st_size), _mime_type_for_path(path)
+
+
+@functools.cache
+def _image_part_builder():
+    """Pick the image Part constructor this google-genai version supports.
+
+    SDK releases differ (Part.from_bytes, Part.from_image, or a Blob-backed
+    Part), so try each once on an empty payload and reuse the winner rather
+    than re-probing for every reference image.
+    """
     if types is None:
         raise RuntimeError("google-genai package not found. Install with: pip install google-genai")
 
-    image_part = None
-
+    candidates = []
     if hasattr(types.Part, "from_bytes"):
-        try:
-            image_part = types.Part.from_bytes(data=img_bytes, mime_type="image/png")
-        except Exception:
-            pass
-
-    if image_part is None and hasattr(types.Part, "from_image"):
-        try:
-            image_part = types.Part.from_image(image=img_bytes, mime_type="image/png")
-        except Exception:
-            pass
+        candidates.append(lambda data, mime_type: types.Part.from_bytes(data=data, mime_type=mime_type))
+    if hasattr(types.Part, "from_image"):
+        candidates.append(lambda data, mime_type: types.Part.from_image(image=data, mime_type=mime_type))
+    blob_cls = getattr(types, "Blob", None)
+    if blob_cls:
+        candidates.append(lambda data, mime_type: types.Part(inline_data=blob_cls(data=data, mime_type=mime_type)))
+    else:
+        candidates.append(lambda data, mime_type: types.Part(inline_data={"mime_type": mime_type, "data": data}))
 
-    if image_part is None:
+    last_error: Exception | None = None
+    for build in candidates:
         try:
-            blob_cls = getattr(types, "Blob", None)
-            if blob_cls:
-                image_part = types.Part(inline_data=blob_cls(data=img_bytes, mime_type="image/png"))
-            else:
-                image_part = types.Part(
-                    inline_data={"mime_type": "image/png", "data": img_bytes}
-                )
+            build(b"", "image/png")
         except Exception as e:
-            raise RuntimeError(f"Failed to construct image part. SDK version might be incompatible. Error: {e}")
+            last_error = e
+            continue
+        return build
+    raise RuntimeError(f"Failed to construct image part. SDK version might be incompatible. Error: {last_error}")
 
-    return image_part
 
+def _image_part_from_bytes(img_bytes: bytes, mime_type: str = "image/png"):
+    """Create a Gemini Part from image bytes with the SDK's supported constructor."""
+    return _image_part_builder()(img_bytes, mime_type)
 
-def generate_with_styles(
-    prompt_text: str,
-    style_image_paths: list[str],
-    out_path: str,
-    *,
-    model: str = "gemini-3-pro-preview",
-    aspect_ratio: str = "2:3",
-    guidance_scale: float | None = None,
-    num_inference_steps: int | None = None,
-    rarity_labels: dict[int, str] | None = None,
-    target_rarity: str | None = None,
-    fix_mode: bool = False,
-) -> None:
-    """Generate an image with style references.
 
-    Args:
-        prompt_text: The text prompt describing the desired image.
-        style_image_paths: List of paths to style reference images.
-        out_path: Path where the generated PNG will be saved.
-        model: Gemini model ID to use.
-        aspect_ratio: Aspect ratio for the image (default "2:3" for cards).
-        guidance_scale: Optional guidance scale parameter.
-        num_inference_steps: Optional inference steps parameter.
-        rarity_labels: Optional dict mapping 1-indexed image position to rarity name
-                      e.g. {2: "COMMON", 3: "UNCOMMON", 4: "RARE", 5: "GLORIOUS"}
-        target_rarity: Optional target rarity - the matching reference will be highlighted.
-        fix_mode: If True, [1] is the card being fixed, [2] is template, [3+] are examples.
-                  If False, [1] is template, [2+] are examples.
+# Static preamble sections, shared by every style instruction
+_TYPE_ICON_INSTRUCTION = (
+    "\n🎯 TYPE ICON (REQUIRED): The top-left navy circle MUST contain the correct WHITE type icon:\n"
+    "   - NOUN = closed book\n"
+    "   - VERB = pencil\n"
+    "   - ADJECTIVE = sparkle pencil (pencil with small stars)\n"
+    "   - NAME = feather quill\n"
+    "   - TITLE = crown\n"
+    "   Match the icon style from the type-specific template reference.\n"
+)
 
-    Raises:
-        RuntimeError: If the API call fails or no image is returned.
-    """
-    if genai is None:
-        raise RuntimeError("google-genai package not found. Install with: pip install google-genai")
-
-    if not style_image_paths:
-        raise RuntimeError("At least one style image is required.")
-    if len(style_image_paths) > 16:
-        raise RuntimeError("At most 16 style images are supported.")
+_LEGACY_INSTRUCTION = (
+    "\n⚠️ LEGACY REFS: Some example cards are MISSING TYPE ICONS - ignore their type circle area. "
+    "Always use the type icon from the TYPE-SPECIFIC TEMPLATE instead.\n"
+)
 
-    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GEMINI_TEXT_API_KEY")
-    if not api_key:
-        raise RuntimeError("GEMINI_API_KEY (or GEMINI_TEXT_API_KEY) env var is not set.")
+_CONFLICTING_REF_LINE = "Generate a trading card following the EXACT layout, frame, and geometry of the reference style [1]."
 
-    client = genai.Client(api_key=api_key)
 
+def _build_style_instruction(
+    n_refs: int,
+    *,
+    aspect_ratio: str,
+    rarity_labels: dict[int, str] | None,
+    target_rarity: str | None,
+    fix_mode: bool,
+) -> str:
+    """Build the image-roles / structure / style preamble for n_refs reference images."""
+    rarity_items = tuple(sorted(rarity_labels.items())) if rarity_labels else ()
+    return _style_instruction_cached(n_refs, aspect_ratio, rarity_items, target_rarity, fix_mode)
+
+
+@functools.lru_cache(maxsize=256)
+def _style_instruction_cached(
+    n_refs: int,
+    aspect_ratio: str,
+    rarity_items: tuple[tuple[int, str], ...],
+    target_rarity: str | None,
+    fix_mode: bool,
+) -> str:
+    # A deck run reuses a handful of (refs, rarity) combinations, so the
+    # preamble is built once per combination rather than once per card
+    rarity_labels = dict(rarity_items)
     orientation = "portrait (2:3 aspect ratio, taller than wide)" if aspect_ratio == "2:3" else f"aspect ratio {aspect_ratio}"
 
     # Build clear labeling for each reference image
@@ -122,7 +188,7 @@ def generate_with_styles(
 
     primary_ref = None
     has_legacy_refs = False
-    for i in range(example_start, len(style_image_paths) + 1):
+    for i in range(example_start, n_refs + 1):
         rarity = rarity_labels.get(i) if rarity_labels else None
         if rarity:
             # Check if this is a legacy reference (missing type icon)
@@ -139,19 +205,13 @@ def generate_with_styles(
         else:
             ref_labels.append(f"[{i}] = Example card (style/formatting reference)")
 
-    # Remove conflicting "[1]" reference from prompt if present
-    cleaned_prompt = prompt_text.replace(
-        "Generate a trading card following the EXACT layout, frame, and geometry of the reference style [1].",
-        ""
-    ).strip()
-
     # Build example refs string based on mode
     if fix_mode:
         template_ref = "2"
-        example_refs = "/".join(str(i) for i in range(3, len(style_image_paths) + 1)) if len(style_image_paths) > 2 else "2"
+        example_refs = "/".join(str(i) for i in range(3, n_refs + 1)) if n_refs > 2 else "2"
     else:
         template_ref = "1"
-        example_refs = "/".join(str(i) for i in range(2, len(style_image_paths) + 1)) if len(style_image_paths) > 1 else "1"
+        example_refs = "/".join(str(i) for i in range(2, n_refs + 1)) if n_refs > 1 else "1"
 
     # Build primary rarity instruction if we have a match
     primary_instruction = ""
@@ -161,24 +221,9 @@ def generate_with_styles(
             f"Pay CLOSEST attention to [{primary_ref}] for the rarity badge style and any rarity-specific formatting.\n"
         )
 
-    # Always include type icon instruction
-    type_icon_instruction = (
-        "\n🎯 TYPE ICON (REQUIRED): The top-left navy circle MUST contain the correct WHITE type icon:\n"
-        "   - NOUN = closed book\n"
-        "   - VERB = pencil\n"
-        "   - ADJECTIVE = sparkle pencil (pencil with small stars)\n"
-        "   - NAME = feather quill\n"
-        "   - TITLE = crown\n"
-        "   Match the icon style from the type-specific template reference.\n"
-    )
-
     # Add extra warning when using legacy references that may be missing icons
-    legacy_instruction = ""
-    if has_legacy_refs:
-        legacy_instruction = (
-            "\n⚠️ LEGACY REFS: Some example cards are MISSING TYPE ICONS - ignore their type circle area. "
-            "Always use the type icon from the TYPE-SPECIFIC TEMPLATE instead.\n"
-        )
+    legacy_instruction = _LEGACY_INSTRUCTION if has_legacy_refs else ""
+    type_icon_instruction = _TYPE_ICON_INSTRUCTION
 
     if fix_mode:
         style_instruction = f"""IMAGE ROLES:
@@ -233,17 +278,126 @@ AVOID:
 - Inconsistent element styling
 
 """
+    return style_instruction
 
-    full_prompt = style_instruction + cleaned_prompt
 
-    image_parts = []
-    for p in style_image_paths:
-        img_bytes = _read_image_bytes(p)
-        image_parts.append(_image_part_from_bytes(img_bytes))
+def _clean_prompt(prompt_text: str) -> str:
+    # Remove conflicting "[1]" reference from prompt if present
+    return prompt_text.replace(_CONFLICTING_REF_LINE, "").strip()
+
+
+def _extract_image_data(candidate) -> list[bytes | str]:
+    """Return every inline image payload (raw bytes or base64 text) in a response candidate, in order."""
+    parts = (candidate.content.parts if candidate.content and candidate.content.parts else [])
+    images: list[bytes | str] = []
+    for part in parts:
+        if part.inline_data and part.inline_data.mime_type.startswith("image/"):
+            images.append(part.inline_data.data)
+    return images
+
+
+def _dedupe_style_refs(
+    style_image_paths: list[str],
+    rarity_labels: dict[int, str] | None,
+) -> tuple[list[str], list[tuple[bytes, str]], dict[int, str] | None]:
+    """Read the reference images, dropping any whose bytes repeat an earlier one.
+
+    Returns the kept paths, their (bytes, mime type) and rarity_labels renumbered
+    to the kept positions. A first occurrence is never dropped, so the
+    positional roles ([1] template, or [1] fixed card and [2] template) hold.
+    """
+    seen: set[bytes] = set()
+    paths: list[str] = []
+    refs: list[tuple[bytes, str]] = []
+    labels: dict[int, str] = {}
+    for i, path in enumerate(style_image_paths, 1):
+        ref = _read_reference_image(path)
+        digest = hashlib.blake2b(ref[0], digest_size=16).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        paths.append(path)
+        refs.append(ref)
+        if rarity_labels and i in rarity_labels:
+            labels[len(refs)] = rarity_labels[i]
+    return paths, refs, (labels if rarity_labels else rarity_labels)
+
 
+def generate_with_styles(
+    prompt_text: str,
+    style_image_paths: list[str],
+    out_path: str,
+    *,
+    model: str = "gemini-3-pro-preview",
+    aspect_ratio: str = "2:3",
+    guidance_scale: float | None = None,
+    num_inference_steps: int | None = None,
+    rarity_labels: dict[int, str] | None = None,
+    target_rarity: str | None = None,
+    fix_mode: bool = False,
+    use_cache: bool = True,
+) -> None:
+    """Generate an image with style references.
+
+    Args:
+        prompt_text: The text prompt describing the desired image.
+        style_image_paths: List of paths to style reference images.
+        out_path: Path where the generated PNG will be saved.
+        model: Gemini model ID to use.
+        aspect_ratio: Aspect ratio for the image (default "2:3" for cards).
+        guidance_scale: Optional guidance scale parameter.
+        num_inference_steps: Optional inference steps parameter.
+        rarity_labels: Optional dict mapping 1-indexed image position to rarity name
+                      e.g. {2: "COMMON", 3: "UNCOMMON", 4: "RARE", 5: "GLORIOUS"}
+        target_rarity: Optional target rarity - the matching reference will be highlighted.
+        fix_mode: If True, [1] is the card being fixed, [2] is template, [3+] are examples.
+                  If False, [1] is template, [2+] are examples.
+        use_cache: If False, always call Gemini even when HYPERTEXT_CACHE_DIR holds
+                   an image for this request (the new image replaces it).
+
+    Raises:
+        RuntimeError: If the API call fails or no image is returned.
+    """
+    if genai is None:
+        raise RuntimeError("google-genai package not found. Install with: pip install google-genai")
+
+    if not style_image_paths:
+        raise RuntimeError("At least one style image is required.")
+    if len(style_image_paths) > 16:
+        raise RuntimeError("At most 16 style images are supported.")
+
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GEMINI_TEXT_API_KEY")
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY (or GEMINI_TEXT_API_KEY) env var is not set.")
+
+    client = get_client(api_key)
+
+    # The same image passed twice (e.g. a repeated --style) is sent once
+    style_image_paths, style_refs, rarity_labels = _dedupe_style_refs(style_image_paths, rarity_labels)
+
+    style_instruction = _build_style_instruction(
+        len(style_image_paths),
+        aspect_ratio=aspect_ratio,
+        rarity_labels=rarity_labels,
+        target_rarity=target_rarity,
+        fix_mode=fix_mode,
+    )
+    card_prompt = _clean_prompt(prompt_text)
+    full_prompt = style_instruction + card_prompt
+
+    cache_key = request_key(model, aspect_ratio, normalize_prompt(full_prompt), *(b for b, _ in style_refs))
+    if use_cache and load_cached_image(cache_key, out_path):
+        print(f"Using cached image for {out_path}")
+        return
+
+    image_parts = [_image_part_from_bytes(img_bytes, mime_type) for img_bytes, mime_type in style_refs]
+
+    # Reference images and the style preamble only change with the reference
+    # set, so they lead; the card-specific content goes in its own trailing part.
     contents = [
         *image_parts,
-        types.Part.from_text(text=full_prompt),
+        types.Part.from_text(text=style_instruction),
+        types.Part.from_text(text=card_prompt),
     ]
 
     print("Generating with style references:")
@@ -268,25 +422,187 @@ AVOID:
         raise RuntimeError("No candidates returned from Gemini.")
 
     candidate = response.candidates[0]
-    parts = (candidate.content.parts if candidate.content and candidate.content.parts else [])
+    images = _extract_image_data(candidate)
+    if not images:
+        raise RuntimeError(f"No image data found in response. Content: {candidate.content}")
 
-    image_bytes = None
-    for part in parts:
-        if part.inline_data and part.inline_data.mime_type.startswith("image/"):
-            image_bytes = part.inline_data.data
-            break
+    write_image_atomic(images[0], out_path)
+    store_cached_file(cache_key, out_path)
 
-    if not image_bytes:
-        raise RuntimeError(f"No image data found in response. Content: {candidate.content}")
+    print(f"Saved generated image to: {out_path}")
 
-    if isinstance(image_bytes, str):
-        image_bytes = base64.b64decode(image_bytes)
 
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    with open(out_path, "wb") as f:
-        f.write(image_bytes)
+def generate_many_with_styles(
+    prompt_texts: list[str],
+    style_image_paths: list[str],
+    out_paths: list[str],
+    *,
+    model: str = "gemini-3-pro-preview",
+    aspect_ratio: str = "2:3",
+    rarity_labels: dict[int, str] | None = None,
+    target_rarities: list[str | None] | None = None,
+    fix_modes: list[bool] | None = None,
+    use_cache: bool = True,
+) -> None:
+    """Generate several cards that share the same style references.
 
-    print(f"Saved generated image to: {out_path}")
+    Cards with the same target rarity and fix mode share one style preamble,
+    so each such group is sent as one request: the reference images and
+    preamble once, followed by one section per card. The response's images
+    are written to the group's out_paths in order and stored in the image
+    cache under the same key generate_with_styles uses for that card.
+
+    Args:
+        target_rarities: Per-card target rarity (see generate_with_styles).
+        fix_modes: Per-card fix mode (see generate_with_styles).
+        use_cache: If False, never serve a card from HYPERTEXT_CACHE_DIR.
+
+    Raises:
+        RuntimeError: If a batched response holds a different number of
+            images than cards requested (they could not be matched to their
+            cards), or if the per-card fallback after a failed request fails.
+    """
+    n = len(prompt_texts)
+    if len(out_paths) != n:
+        raise ValueError("prompt_texts and out_paths must have the same length.")
+    target_rarities = list(target_rarities) if target_rarities is not None else [None] * n
+    fix_modes = list(fix_modes) if fix_modes is not None else [False] * n
+    if len(target_rarities) != n or len(fix_modes) != n:
+        raise ValueError("target_rarities and fix_modes must match prompt_texts in length.")
+
+    groups: dict[tuple[str | None, bool], list[int]] = {}
+    for i in range(n):
+        groups.setdefault((target_rarities[i], bool(fix_modes[i])), []).append(i)
+    for (target_rarity, fix_mode), idxs in groups.items():
+        _generate_style_batch(
+            [prompt_texts[i] for i in idxs],
+            style_image_paths,
+            [out_paths[i] for i in idxs],
+            model=model,
+            aspect_ratio=aspect_ratio,
+            rarity_labels=rarity_labels,
+            target_rarity=target_rarity,
+            fix_mode=fix_mode,
+            use_cache=use_cache,
+        )
+
+
+def _generate_style_batch(
+    prompt_texts: list[str],
+    style_image_paths: list[str],
+    out_paths: list[str],
+    *,
+    model: str,
+    aspect_ratio: str,
+    rarity_labels: dict[int, str] | None,
+    target_rarity: str | None,
+    fix_mode: bool,
+    use_cache: bool,
+) -> None:
+    """Generate cards sharing one style preamble in a single request (see generate_many_with_styles)."""
+    single_opts = dict(
+        model=model,
+        aspect_ratio=aspect_ratio,
+        rarity_labels=rarity_labels,
+        target_rarity=target_rarity,
+        fix_mode=fix_mode,
+        use_cache=use_cache,
+    )
+    if len(prompt_texts) == 1:
+        generate_with_styles(
+            prompt_text=prompt_texts[0],
+            style_image_paths=style_image_paths,
+            out_path=out_paths[0],
+            **single_opts,
+        )
+        return
+
+    if genai is None:
+        raise RuntimeError("google-genai package not found. Install with: pip install google-genai")
+    if not style_image_paths:
+        raise RuntimeError("At least one style image is required.")
+    if len(style_image_paths) > 16:
+        raise RuntimeError("At most 16 style images are supported.")
+
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GEMINI_TEXT_API_KEY")
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY (or GEMINI_TEXT_API_KEY) env var is not set.")
+
+    style_image_paths, style_refs, rarity_labels = _dedupe_style_refs(style_image_paths, rarity_labels)
+    single_opts["rarity_labels"] = rarity_labels
+    style_instruction = _build_style_instruction(
+        len(style_image_paths),
+        aspect_ratio=aspect_ratio,
+        rarity_labels=rarity_labels,
+        target_rarity=target_rarity,
+        fix_mode=fix_mode,
+    )
+
+    # Same key as generate_with_styles, so either path serves the other's images
+    ref_bytes = [b for b, _ in style_refs]
+    pending: list[tuple[str, str, str]] = []
+    for text, out_path in zip(prompt_texts, out_paths):
+        card_prompt = _clean_prompt(text)
+        cache_key = request_key(model, aspect_ratio, normalize_prompt(style_instruction + card_prompt), *ref_bytes)
+        if use_cache and load_cached_image(cache_key, out_path):
+            print(f"Using cached image for {out_path}")
+            continue
+        pending.append((card_prompt, out_path, cache_key))
+    if len(pending) <= 1:
+        for card_prompt, out_path, _ in pending:
+            generate_with_styles(
+                prompt_text=card_prompt,
+                style_image_paths=style_image_paths,
+                out_path=out_path,
+                **single_opts,
+            )
+        return
+
+    n = len(pending)
+    cards_prompt = (
+        f"OUTPUT: Generate {n} separate images, one complete card per CARD section below, in order. "
+        "Apply the same references and rules to each card.\n\n"
+        + "".join(f"=== CARD {i} of {n} ===\n{card_prompt}\n\n" for i, (card_prompt, _, _) in enumerate(pending, 1))
+    )
+
+    image_parts = [_image_part_from_bytes(img_bytes, mime_type) for img_bytes, mime_type in style_refs]
+
+    print(f"Generating {n} cards in one request with style references:")
+    for p in style_image_paths:
+        print(f"- {p}")
+
+    try:
+        response = get_client(api_key).models.generate_content(
+            model=model,
+            contents=[
+                *image_parts,
+                types.Part.from_text(text=style_instruction),
+                types.Part.from_text(text=cards_prompt),
+            ],
+            config=types.GenerateContentConfig(response_modalities=["IMAGE"]),
+        )
+    except Exception as e:
+        # Nothing was written, so each card can still be generated on its own
+        print(f"Warning: batched generation failed ({e}); generating one at a time", file=sys.stderr)
+        for card_prompt, out_path, _ in pending:
+            generate_with_styles(
+                prompt_text=card_prompt,
+                style_image_paths=style_image_paths,
+                out_path=out_path,
+                **single_opts,
+            )
+        return
+
+    images = _extract_image_data(response.candidates[0]) if response.candidates else []
+    if len(images) != n:
+        # Images are matched to cards by position; with one missing or extra,
+        # every later card would get another card's art
+        raise RuntimeError(f"Batched generation returned {len(images)} images for {n} cards; none were written.")
+
+    for image_data, (_, out_path, cache_key) in zip(images, pending):
+        write_image_atomic(image_data, out_path)
+        store_cached_file(cache_key, out_path)
+        print(f"Saved generated image to: {out_path}")
 
 
 def generate_with_style(
@@ -311,13 +627,52 @@ def generate_with_style(
     )
 
 
+def _generate_from_glob(args: argparse.Namespace, rarity_labels: dict[int, str] | None) -> int:
+    """Generate one card per prompt file matching args.prompts_glob, args.workers at a time."""
+    prompt_paths = sorted(glob.glob(args.prompts_glob))
+    if not prompt_paths:
+        print(f"Error: No prompt files match {args.prompts_glob}", file=sys.stderr)
+        return 1
+
+    def _run_one(prompt_path: str) -> None:
+        with open(prompt_path, "r", encoding="utf-8") as f:
+            prompt_text = f.read().strip()
+        out_path = os.path.join(args.out, os.path.splitext(os.path.basename(prompt_path))[0] + ".png")
+        generate_with_styles(
+            prompt_text=prompt_text,
+            style_image_paths=args.style,
+            out_path=out_path,
+            model=args.model,
+            rarity_labels=rarity_labels,
+            target_rarity=args.target_rarity,
+            fix_mode=args.fix_mode,
+        )
+
+    # Each request is network-bound, so threads scale up to the API rate limit
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(prompt_paths)))) as executor:
+        futures = {executor.submit(_run_one, p): p for p in prompt_paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures.append(f"{futures[future]}: {e}")
+
+    print(f"Generated {len(prompt_paths) - len(failures)}/{len(prompt_paths)} cards")
+    for failure in sorted(failures):
+        print(f"Error: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
 def main() -> int:
     """CLI entrypoint for style-referenced image generation."""
     parser = argparse.ArgumentParser(description="Generate image with Gemini Style Reference")
     parser.add_argument("--prompt", help="Text description of the image content")
     parser.add_argument("--prompt-file", help="Path to text file containing the prompt")
     parser.add_argument("--style", required=True, action="append", help="Path to reference style image (repeatable)")
-    parser.add_argument("--out", required=True, help="Output PNG path")
+    parser.add_argument("--prompts-glob", help="Glob of prompt files to generate in one run (each <name>.txt -> <out>/<name>.png)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests with --prompts-glob (default: 4)")
+    parser.add_argument("--out", required=True, help="Output PNG path (output directory with --prompts-glob)")
     parser.add_argument("--model", default="gemini-3-pro-image-preview", help="Gemini model ID")
     parser.add_argument("--rarity-label", action="append", help="Rarity label for style image at position (format: POS:RARITY e.g. 2:COMMON)")
     parser.add_argument("--target-rarity", help="Target rarity for this card (highlights matching reference)")
@@ -325,6 +680,18 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    # Parse rarity labels
+    rarity_labels = None
+    if args.rarity_label:
+        rarity_labels = {}
+        for label in args.rarity_label:
+            if ":" in label:
+                pos, rarity = label.split(":", 1)
+                rarity_labels[int(pos)] = rarity.upper()
+
+    if args.prompts_glob:
+        return _generate_from_glob(args, rarity_labels)
+
     prompt_text = args.prompt
     if args.prompt_file:
         if not os.path.exists(args.prompt_file):
@@ -337,15 +704,6 @@ def main() -> int:
         print("Error: Must provide either --prompt or --prompt-file", file=sys.stderr)
         return 1
 
-    # Parse rarity labels
-    rarity_labels = None
-    if args.rarity_label:
-        rarity_labels = {}
-        for label in args.rarity_label:
-            if ":" in label:
-                pos, rarity = label.split(":", 1)
-                rarity_labels[int(pos)] = rarity.upper()
-
     try:
         generate_with_styles(
             prompt_text=prompt_text,
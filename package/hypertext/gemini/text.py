@@ -1,40 +1,58 @@
 #!/usr/bin/env python3
 """Gemini text generation with optional Google Search grounding.
 
-This module provides a pure urllib-based implementation for Gemini text
-generation, with retry logic and grounding metadata extraction.
+This module provides a pure stdlib implementation for Gemini text
+generation, with retry logic and grounding metadata extraction. Requests
+go through the shared keep-alive transport (hypertext.gemini.transport).
 """
 
-import json
 import os
-import random
 import sys
 import time
 import urllib.error
-import urllib.request
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from hypertext.gemini.cache import cache_dir, request_key
+from hypertext.gemini.ratelimit import TokenBucket, close_gate, gate_key, wait_for_gate
+from hypertext.gemini.transport import (
+    RETRIABLE_STATUSES,
+    backoff_delay,
+    decode_json,
+    encode_json,
+    parse_retry_after_seconds,
+    post_bytes,
+    read_http_error_body,
+)
+
+# Client-side pacing for text requests; GEMINI_TEXT_RPM=0 (the default) disables it
+_BUCKET = TokenBucket(float(os.environ.get("GEMINI_TEXT_RPM", "0") or 0))
+
+
+def _text_cache_path(model_id: str, prompt: str, temperature: float | None, use_google_search: bool) -> Path | None:
+    """Where the response for this request is cached, or None unless GEMINI_TEXT_CACHE=1."""
+    if os.environ.get("GEMINI_TEXT_CACHE", "").strip() != "1":
+        return None
+    key = request_key(model_id, prompt, repr(temperature), "google_search" if use_google_search else "")
+    return (cache_dir() or Path(".cache")) / "text" / key[:2] / f"{key}.json"
 
 
-def _parse_retry_after_seconds(headers) -> int | None:
-    if not headers:
-        return None
-    value = headers.get("Retry-After")
-    if not value:
-        return None
+def _load_cached_text(path: Path) -> tuple[str, dict] | None:
     try:
-        return int(value)
-    except ValueError:
+        data = decode_json(path.read_bytes())
+        return data["text"], data["grounding"]
+    except (OSError, ValueError, KeyError, TypeError):
         return None
 
 
-def _read_http_error_body(e: urllib.error.HTTPError) -> str:
+def _store_cached_text(path: Path, text: str, grounding: dict) -> None:
     try:
-        body = e.read()
-    except Exception:
-        return ""
-    try:
-        return body.decode("utf-8", errors="replace")
-    except Exception:
-        return ""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(encode_json({"text": text, "grounding": grounding}))
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
 def generate_text(
@@ -82,13 +100,22 @@ def generate_text_with_grounding(
     Returns:
         Tuple of (generated_text, grounding_metadata).
         Grounding metadata includes 'queries' and 'sources' lists.
+
+    With GEMINI_TEXT_CACHE=1, a request identical in model, prompt,
+    temperature and grounding is answered from the on-disk cache.
     """
     api_key = os.environ.get("GEMINI_TEXT_API_KEY") or os.environ.get("GEMINI_API_KEY")
     if not api_key:
         raise RuntimeError("GEMINI_TEXT_API_KEY (or GEMINI_API_KEY) env var is not set.")
 
     model_id = model or os.environ.get("GEMINI_TEXT_MODEL", "gemini-3-pro-preview")
-    endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}:generateContent"
+    endpoint_path = f"/v1beta/models/{model_id}:generateContent"
+
+    cache_path = _text_cache_path(model_id, prompt, temperature, use_google_search)
+    if cache_path is not None:
+        cached = _load_cached_text(cache_path)
+        if cached is not None:
+            return cached
 
     payload: dict = {
         "contents": [{"parts": [{"text": prompt}]}],
@@ -101,31 +128,29 @@ def generate_text_with_grounding(
         payload["tools"] = [{"google_search": {}}]
 
     headers = {"Content-Type": "application/json", "x-goog-api-key": api_key}
-    req = urllib.request.Request(
-        endpoint,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
+    request_body = encode_json(payload)
 
     max_attempts = int(os.environ.get("GEMINI_TEXT_MAX_ATTEMPTS", "6"))
     base_delay_s = float(os.environ.get("GEMINI_TEXT_RETRY_BASE_DELAY_S", "2"))
     timeout_s = float(os.environ.get("GEMINI_TEXT_HTTP_TIMEOUT_S", "240"))
+    max_gate_wait_s = float(os.environ.get("GEMINI_RATELIMIT_MAX_WAIT_S", "300"))
+    gate = gate_key("gemini_text", api_key, model_id)
 
     last_error: Exception | None = None
-    raw = ""
+    raw = b""
     data: dict | None = None
 
     for attempt in range(1, max_attempts + 1):
+        wait_for_gate(gate, max_gate_wait_s)
+        _BUCKET.acquire()
         try:
-            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-                raw = resp.read().decode("utf-8")
-                data = json.loads(raw)
+            raw = post_bytes(endpoint_path, request_body, headers, timeout_s)
+            data = decode_json(raw)
             last_error = None
             break
         except TimeoutError as e:
             if attempt < max_attempts:
-                delay = base_delay_s * (2 ** (attempt - 1)) + random.random()
+                delay = backoff_delay(attempt, base_delay_s)
                 print(
                     f"Gemini text request timed out. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
                     file=sys.stderr,
@@ -135,13 +160,18 @@ def generate_text_with_grounding(
                 continue
             raise
         except urllib.error.HTTPError as e:
-            body = _read_http_error_body(e)
-            retry_after = _parse_retry_after_seconds(getattr(e, "headers", None))
-            retriable = e.code in (429, 500, 502, 503, 504)
+            body = read_http_error_body(e)
+            retry_after = parse_retry_after_seconds(getattr(e, "headers", None))
+            retriable = e.code in RETRIABLE_STATUSES
+            if e.code == 429:
+                # The pacing was too loose; make the other threads wait too
+                _BUCKET.drain()
+                if retry_after is not None:
+                    # Let other workers and processes hold off too
+                    close_gate(gate, retry_after)
 
             if retriable and attempt < max_attempts:
-                delay = retry_after if retry_after is not None else (base_delay_s * (2 ** (attempt - 1)))
-                delay = delay + random.random()
+                delay = backoff_delay(attempt, base_delay_s, retry_after)
                 print(
                     f"Gemini text request failed with HTTP {e.code}. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
                     file=sys.stderr,
@@ -158,7 +188,7 @@ def generate_text_with_grounding(
             raise RuntimeError(msg) from e
         except urllib.error.URLError as e:
             if attempt < max_attempts:
-                delay = base_delay_s * (2 ** (attempt - 1)) + random.random()
+                delay = backoff_delay(attempt, base_delay_s)
                 print(
                     f"Gemini text request failed with URLError: {e}. Retrying in {delay:.1f}s (attempt {attempt}/{max_attempts}).",
                     file=sys.stderr,
@@ -173,7 +203,7 @@ def generate_text_with_grounding(
 
     candidates = data.get("candidates", [])
     if not candidates:
-        raise RuntimeError(f"No candidates returned. Raw: {raw[:500]}")
+        raise RuntimeError(f"No candidates returned. Raw: {raw[:500].decode('utf-8', errors='replace')}")
 
     first = candidates[0]
     finish_reason = first.get("finishReason", "")
@@ -191,12 +221,10 @@ def generate_text_with_grounding(
         }
         if temperature is not None:
             payload_no_ground["generationConfig"] = {"temperature": temperature}
-        body_no_ground = json.dumps(payload_no_ground).encode("utf-8")
-        req_no_ground = urllib.request.Request(endpoint, data=body_no_ground, headers=headers, method="POST")
+        body_no_ground = encode_json(payload_no_ground)
         try:
-            with urllib.request.urlopen(req_no_ground, timeout=timeout_s) as resp:
-                raw = resp.read().decode("utf-8")
-                data = json.loads(raw)
+            raw = post_bytes(endpoint_path, body_no_ground, headers, timeout_s)
+            data = decode_json(raw)
             candidates = data.get("candidates", [])
             if candidates:
                 first = candidates[0]
@@ -211,7 +239,7 @@ def generate_text_with_grounding(
             texts.append(t)
 
     if not texts:
-        raise RuntimeError(f"No text parts found. Raw: {raw[:800]}")
+        raise RuntimeError(f"No text parts found. Raw: {raw[:800].decode('utf-8', errors='replace')}")
 
     grounding_meta = first.get("groundingMetadata", {}) if isinstance(first.get("groundingMetadata"), dict) else {}
     queries = grounding_meta.get("webSearchQueries", [])
@@ -236,7 +264,46 @@ def generate_text_with_grounding(
             sources.append({"uri": uri, "title": title})
 
     text_out = "\n".join(texts).strip()
-    return text_out, {"queries": queries, "sources": sources}
+    grounding = {"queries": queries, "sources": sources}
+    if cache_path is not None:
+        _store_cached_text(cache_path, text_out, grounding)
+    return text_out, grounding
+
+
+def generate_texts(
+    prompts: list[str],
+    *,
+    concurrency: int = 8,
+    model: str | None = None,
+    temperature: float | None = None,
+    use_google_search: bool = False,
+) -> list[str]:
+    """Generate text for several prompts concurrently.
+
+    Args:
+        prompts: Prompts to send; one request each.
+        concurrency: Maximum requests in flight. Each worker thread keeps its
+            own keep-alive connection, and every request retries and honours
+            the rate-limit gate exactly as generate_text does.
+        model: Optional model ID override for every prompt.
+        temperature: Optional temperature for every prompt.
+        use_google_search: Whether to enable Google Search grounding.
+
+    Returns:
+        The generated texts, in prompt order. The first failure is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(prompts) or 1))) as executor:
+        futures = [
+            executor.submit(
+                generate_text,
+                prompt,
+                model=model,
+                temperature=temperature,
+                use_google_search=use_google_search,
+            )
+            for prompt in prompts
+        ]
+        return [future.result() for future in futures]
 
 
 def main() -> int:
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Keep-alive HTTPS transport shared by the Gemini REST clients.
+
+Each thread keeps one persistent connection to the Gemini API host, so
+back-to-back requests skip the TCP/TLS handshake. Errors are surfaced as
+urllib exceptions so callers keep their urllib-style retry handling.
+
+get_client is the equivalent for the google-genai SDK callers, and
+write_image_atomic is the one place generated images are written to disk.
+"""
+
+import base64
+import binascii
+import functools
+import http.client
+import io
+import json
+import os
+import random
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# orjson is optional; it encodes request payloads and decodes the (often
+# multi-MB, base64-heavy) responses faster than the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+API_HOST = "generativelanguage.googleapis.com"
+
+@functools.lru_cache(maxsize=4)
+def get_client(api_key: str):
+    """Return a shared genai.Client for api_key, keeping its connection pool warm across calls.
+
+    Callers check that google-genai is installed before calling this.
+    """
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+# Base64 chars decoded per write; a multiple of 4 so chunks decode independently
+_B64_CHUNK = 1 << 18
+
+
+def write_image_atomic(data: bytes | str | memoryview, out_path: str) -> None:
+    """Write an image to out_path through a temp file in the same directory.
+
+    Raw bytes are written as-is; str or memoryview payloads are base64 text and are
+    decoded chunk by chunk straight into the file, never holding the whole
+    image. The rename means a crash never leaves a half-written PNG behind.
+    """
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            if isinstance(data, (bytes, bytearray)):
+                f.write(data)
+            else:
+                for i in range(0, len(data), _B64_CHUNK):
+                    f.write(binascii.a2b_base64(data[i:i + _B64_CHUNK]))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# One keep-alive connection per thread (http.client connections are not thread-safe)
+_local = threading.local()
+
+
+def _https_proxy() -> urllib.parse.SplitResult | None:
+    """Return the HTTPS proxy to tunnel through for the API host, if any."""
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(API_HOST):
+        return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _new_connection(proxy: urllib.parse.SplitResult | None, timeout_s: float) -> http.client.HTTPSConnection:
+    if proxy is None:
+        return http.client.HTTPSConnection(API_HOST, timeout=timeout_s)
+    # CONNECT tunnel through the proxy; the tunnel stays open for keep-alive
+    conn = http.client.HTTPSConnection(proxy.hostname, proxy.port or 80, timeout=timeout_s)
+    tunnel_headers = {}
+    if proxy.username:
+        credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    conn.set_tunnel(API_HOST, 443, headers=tunnel_headers)
+    return conn
+
+
+def _get_connection(proxy: urllib.parse.SplitResult | None, timeout_s: float) -> http.client.HTTPSConnection:
+    """Return this thread's keep-alive connection to the Gemini API, creating it if needed."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "proxy", None) != proxy:
+        # Proxy settings changed since the connection was opened
+        _drop_connection()
+        conn = None
+    if conn is None:
+        conn = _new_connection(proxy, timeout_s)
+        _local.conn = conn
+        _local.proxy = proxy
+        _local.reused = False
+    else:
+        conn.timeout = timeout_s
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout_s)
+    return conn
+
+
+def _drop_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
+def post_bytes(path: str, body: bytes, headers: dict, timeout_s: float) -> bytes:
+    """POST body to the Gemini API and return the raw response body.
+
+    Errors are raised as urllib.error.HTTPError / URLError / TimeoutError so
+    callers keep urllib's error handling. An HTTPS proxy from the environment
+    (honouring no_proxy) is used through a kept-open CONNECT tunnel; only a
+    proxy that itself speaks TLS falls back to urllib.request.
+    """
+    url = f"https://{API_HOST}{path}"
+    proxy = _https_proxy()
+    if proxy is not None and proxy.scheme == "https":
+        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return resp.read()
+
+    for _ in range(2):
+        conn = _get_connection(proxy, timeout_s)
+        reused = getattr(_local, "reused", False)
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except TimeoutError:
+            _drop_connection()
+            raise
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+            _drop_connection()
+            if reused:
+                # The server closed an idle keep-alive connection; reconnect once
+                continue
+            raise urllib.error.URLError(e) from e
+        except (OSError, http.client.HTTPException) as e:
+            _drop_connection()
+            raise urllib.error.URLError(e) from e
+
+        _local.reused = True
+        if resp.will_close:
+            _drop_connection()
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        return data
+
+    raise urllib.error.URLError("Gemini API connection closed repeatedly")
+
+
+def encode_json(obj) -> bytes:
+    """Serialize a request payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def decode_json(raw: str | bytes):
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRIABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after_seconds(headers) -> int | None:
+    """Return the server's Retry-After delay in seconds, if it sent one."""
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def read_http_error_body(e: urllib.error.HTTPError) -> str:
+    try:
+        body = e.read()
+    except Exception:
+        return ""
+    try:
+        return body.decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+
+
+def backoff_delay(attempt: int, base_delay_s: float, retry_after: int | None = None, cap_s: float = 60.0) -> float:
+    """Seconds to wait before retrying after the given (1-based) failed attempt.
+
+    Honours the server's Retry-After when present; otherwise backs off
+    exponentially from base_delay_s, capped at cap_s. Up to a second of
+    jitter keeps concurrent workers from retrying in lockstep.
+    """
+    if retry_after is not None:
+        delay = float(retry_after)
+    else:
+        delay = min(base_delay_s * (2 ** (attempt - 1)), cap_s)
+    return delay + random.random()
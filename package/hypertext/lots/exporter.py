@@ -30,6 +30,12 @@ try:
 except ImportError:
     Image = None  # type: ignore
 
+# numpy is optional; with it, bleed is added in one vectorized pad
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 # Project paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
@@ -93,37 +99,42 @@ def _add_bleed(img: Any, bleed_pixels: int) -> Any:
     if bleed_pixels <= 0:
         return img
 
+    # Both paths keep the image's mode (alpha, grayscale, palette) and pixels
+    if np is not None:
+        arr = np.asarray(img)
+        b = bleed_pixels
+        pad = ((b, b), (b, b)) + ((0, 0),) * (arr.ndim - 2)
+        new_img = Image.fromarray(np.pad(arr, pad, mode="edge"), img.mode)
+        if img.mode == "P":
+            new_img.putpalette(img.getpalette())
+        return new_img
+
     orig_width, orig_height = img.size
     new_width = orig_width + bleed_pixels * 2
     new_height = orig_height + bleed_pixels * 2
 
     # Create new image with extended size
-    new_img = Image.new("RGB", (new_width, new_height))
+    new_img = Image.new(img.mode, (new_width, new_height))
+    if img.mode == "P":
+        new_img.putpalette(img.getpalette())
 
     # Paste original in center
     new_img.paste(img, (bleed_pixels, bleed_pixels))
 
-    # Extend edges by mirroring edge pixels
+    # Extend edges by stretching the 1px edge strips across the bleed;
+    # NEAREST keeps the replicated pixels exact
 
-    # Top edge
+    # Top and bottom edges
     top_strip = img.crop((0, 0, orig_width, 1))
-    for y in range(bleed_pixels):
-        new_img.paste(top_strip, (bleed_pixels, y))
-
-    # Bottom edge
+    new_img.paste(top_strip.resize((orig_width, bleed_pixels), Image.NEAREST), (bleed_pixels, 0))
     bottom_strip = img.crop((0, orig_height - 1, orig_width, orig_height))
-    for y in range(new_height - bleed_pixels, new_height):
-        new_img.paste(bottom_strip, (bleed_pixels, y))
+    new_img.paste(bottom_strip.resize((orig_width, bleed_pixels), Image.NEAREST), (bleed_pixels, new_height - bleed_pixels))
 
-    # Left edge (including corners)
+    # Left and right edges (including corners)
     left_strip = new_img.crop((bleed_pixels, 0, bleed_pixels + 1, new_height))
-    for x in range(bleed_pixels):
-        new_img.paste(left_strip, (x, 0))
-
-    # Right edge (including corners)
+    new_img.paste(left_strip.resize((bleed_pixels, new_height), Image.NEAREST), (0, 0))
     right_strip = new_img.crop((new_width - bleed_pixels - 1, 0, new_width - bleed_pixels, new_height))
-    for x in range(new_width - bleed_pixels, new_width):
-        new_img.paste(right_strip, (x, 0))
+    new_img.paste(right_strip.resize((bleed_pixels, new_height), Image.NEAREST), (new_width - bleed_pixels, 0))
 
     return new_img
 
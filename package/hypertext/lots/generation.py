@@ -38,6 +38,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from hypertext.gemini.style import _image_part_from_bytes
+from hypertext.gemini.transport import decode_json, get_client
+
 try:
     from google import genai
     from google.genai import types
@@ -229,42 +232,10 @@ def _read_image_bytes(path: str) -> bytes:
         return f.read()
 
 
-def _image_part_from_bytes(img_bytes: bytes):
-    """Create a Gemini Part from image bytes."""
-    if types is None:
-        raise RuntimeError("google-genai package not found. Install with: pip install google-genai")
-
-    image_part = None
-
-    if hasattr(types.Part, "from_bytes"):
-        try:
-            image_part = types.Part.from_bytes(data=img_bytes, mime_type="image/png")
-        except Exception:
-            pass
-
-    if image_part is None and hasattr(types.Part, "from_image"):
-        try:
-            image_part = types.Part.from_image(image=img_bytes, mime_type="image/png")
-        except Exception:
-            pass
-
-    if image_part is None:
-        try:
-            blob_cls = getattr(types, "Blob", None)
-            if blob_cls:
-                image_part = types.Part(inline_data=blob_cls(data=img_bytes, mime_type="image/png"))
-            else:
-                image_part = types.Part(
-                    inline_data={"mime_type": "image/png", "data": img_bytes}
-                )
-        except Exception as e:
-            raise RuntimeError(f"Failed to construct image part: {e}")
-
-    return image_part
-
-
 GRADING_MODEL = "gemini-3-pro-preview"  # Vision model for grading
 
+_LOT_TEMPLATE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "templates" / "lot"
+
 
 def _get_template_rubric() -> str | None:
     """Check for a pre-generated template rubric.
@@ -272,14 +243,13 @@ def _get_template_rubric() -> str | None:
     Returns:
         Rubric text if found, None otherwise
     """
-    repo_root = Path(__file__).parent.parent.parent.parent
-    template_dir = repo_root / "templates" / "lot"
+    template_dir = _LOT_TEMPLATE_DIR
     meta_path = template_dir / "meta.yml"
 
     # Get current version from meta.yml
     if meta_path.exists():
         with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         try:
             version = int(meta.get("version", 0))
         except (ValueError, TypeError):
@@ -331,7 +301,7 @@ def describe_style_references(series_dir: Path) -> str:
 
     _log("Generating rubric from style references (no template rubric found)")
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
 
     # Build image parts for all refs (max 3)
     refs_to_use = style_refs[:3]
@@ -403,7 +373,7 @@ def describe_lot_card(image_path: Path, style_refs: list[str] | None = None) ->
     if not api_key:
         raise RuntimeError("GEMINI_API_KEY env var not set")
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
 
     # Build image parts: refs first, then test card
     image_parts = []
@@ -471,7 +441,7 @@ def describe_lot_card(image_path: Path, style_refs: list[str] | None = None) ->
         else:
             json_str = text_content.strip()
 
-        data = json.loads(json_str)
+        data = decode_json(json_str)
 
         return LotDescription(
             # Header
@@ -531,7 +501,7 @@ def score_lot_card(
     if not api_key:
         raise RuntimeError("GEMINI_API_KEY env var not set")
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
 
     lot_id = phase_data.get("id", 0)
     phase_name = phase_data.get("name", "UNKNOWN")
@@ -642,7 +612,7 @@ def score_lot_card(
         else:
             json_str = text_content.strip()
 
-        data = json.loads(json_str)
+        data = decode_json(json_str)
 
         return LotGradeResult(
             lot_id=lot_id,
@@ -881,6 +851,13 @@ try:
 except ImportError:
     yaml = None  # type: ignore
 
+# Prefer the libyaml C bindings for lot meta / content I/O when available.
+if yaml is not None:
+    try:
+        from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 # Package paths
 PACKAGE_DIR = Path(__file__).resolve().parent.parent
 TOOLS_DIR = PACKAGE_DIR.parent
@@ -901,7 +878,7 @@ def load_universal_phases() -> list[dict[str, Any]]:
     if not UNIVERSAL_PHASES_PATH.exists():
         raise RuntimeError(f"Universal phases file not found: {UNIVERSAL_PHASES_PATH}")
     with open(UNIVERSAL_PHASES_PATH, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return data.get("phases", [])
 
 
@@ -913,7 +890,7 @@ def load_series_content(series_dir: Path) -> dict[int, dict[str, str]]:
     if not content_path.exists():
         return {}
     with open(content_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
     return data.get("content", {})
 
 
@@ -925,7 +902,7 @@ def get_series_theme(series_dir: Path) -> str:
     if not stats_path.exists():
         return ""
     with open(stats_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
     return data.get("theme", "")
 
 
@@ -959,7 +936,7 @@ def phase_init(series_dir: Path) -> int:
         }
 
     with open(content_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(content, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+        yaml.dump(content, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, default_flow_style=False)
 
     _log(f"Created {content_path} with {len(phases)} empty entries.")
     return 0
@@ -970,10 +947,10 @@ def _save_content(content_path: Path, data: dict, lock: Optional[threading.Lock]
     if lock:
         with lock:
             with open(content_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True, width=80, default_flow_style=False)
+                yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, width=80, default_flow_style=False)
     else:
         with open(content_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True, width=80, default_flow_style=False)
+            yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, width=80, default_flow_style=False)
 
 
 def _generate_single_phase_content(
@@ -1080,17 +1057,7 @@ def phase_generate(series_dir: Path, parallel: int = 1) -> int:
         _log("Error: pyyaml required. Install with: pip install pyyaml")
         return 1
 
-    # Import from package
-    try:
-        from hypertext.gemini.text import generate_text
-    except ImportError:
-        # Fallback to old location
-        sys.path.insert(0, str(TOOLS_DIR))
-        try:
-            from gemini_text import generate_text
-        except ImportError as e:
-            _log(f"Error importing gemini_text: {e}")
-            return 1
+    from hypertext.gemini.text import generate_text
 
     phases = load_universal_phases()
     theme = get_series_theme(series_dir)
@@ -1101,7 +1068,7 @@ def phase_generate(series_dir: Path, parallel: int = 1) -> int:
         return 1
 
     with open(content_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
 
     existing_content = data.get("content", {})
 
@@ -1228,7 +1195,7 @@ def _render_single_lot(
         "context": card_data["context"],
     }
     with open(card_dir / "meta.yml", "w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+        yaml.dump(meta, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, default_flow_style=False)
 
     _log(f"[{pid:02d}] Completed {name}")
     return (pid, None)
@@ -1370,7 +1337,7 @@ def _render_single_lot_with_review(
         "final_score": final_score,
     }
     with open(card_dir / "meta.yml", "w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+        yaml.dump(meta, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, default_flow_style=False)
 
     if final_score >= REVIEW_PASS_THRESHOLD:
         _log(f"[{pid:02d}] Completed {name} (score: {final_score}, attempts: {attempt})")
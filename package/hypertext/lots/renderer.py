@@ -33,7 +33,6 @@ Card Layout:
 
 from __future__ import annotations
 
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Optional
@@ -300,28 +299,19 @@ def render_lot_card(card_data: dict[str, Any], out_path: Path, style_refs: list[
 
     if style_refs:
         _log(f"  Using {len(style_refs)} style reference(s)")
-        # Use subprocess like the main card pipeline does
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(prompt_path),
-        ]
-        for ref in style_refs:
-            cmd.extend(["--style", ref])
-        cmd.extend(["--out", str(out_path)])
-        subprocess.check_call(cmd)
+        # In-process, like the main card pipeline: parallel lot renders share
+        # one interpreter and SDK import instead of a process per card
+        from hypertext.gemini.style import generate_with_styles
+
+        generate_with_styles(
+            prompt_text=prompt.strip(),
+            style_image_paths=list(style_refs),
+            out_path=str(out_path),
+            model="gemini-3-pro-image-preview",
+        )
     else:
         # Fall back to basic image generation without style refs
-        try:
-            from hypertext.gemini.image import generate_image
-        except ImportError:
-            sys.path.insert(0, str(TOOLS_DIR))
-            try:
-                from gemini_image import generate_image
-            except ImportError:
-                raise RuntimeError(
-                    "No style references found and gemini_image not available. "
-                    "Create a LOT template at templates/lot_template.png or generate some LOT cards first."
-                )
+        from hypertext.gemini.image import generate_image
         _log("  No style references found, using basic generation")
         generate_image(prompt, str(out_path), aspect_ratio="2:3")
 
@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 import argparse
-import glob
+import copy
+import functools
+import hashlib
 import json
 import os
+import re
 import random
 import signal
 import subprocess
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
 # Global shutdown flag for Ctrl+C handling
 _shutdown_requested = threading.Event()
@@ -36,13 +41,63 @@ from hypertext.gemini.review import (
     ReviewResult,
     CardDescription,
 )
-from hypertext.cards.render import render_post
+from hypertext.cards.render import render_post, render_post_text
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# Prefer the libyaml C bindings for meta.yml / queue.yml I/O when available.
+if yaml is not None:
+    try:
+        from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+# orjson is optional; it speeds up card.json / meta.json round-trips when present.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fastjsonschema is optional; when present, generated recipes are checked
+# against RECIPE_SCHEMA with a compiled validator and malformed ones retried.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+def _json_dumps(obj, *, indent: bool = False, default=None) -> str:
+    """Serialize obj to a JSON str (2-space indent when indent=True), using orjson if available."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option, default=default).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys; let the stdlib encoder handle it
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def _json_dumps_bytes(obj, *, indent: bool = False, default=None) -> bytes:
+    """Like _json_dumps but returns UTF-8 bytes, skipping a decode/encode round trip with orjson."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option, default=default)
+        except TypeError:
+            pass
+    return _json_dumps(obj, indent=indent, default=default).encode("utf-8")
+
+
+def _json_loads(text: str | bytes):
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 DEFAULT_SERIES_DIR = Path("series/2026-Q1")
 DEFAULT_TEMPLATE_PATH = Path("templates/card_prompt_template.json")
 DEFAULT_DEMO_DIR = Path("demo_cards")
@@ -154,6 +209,22 @@ FORMATTING_RUBRIC = """
 """
 
 
+# JSON Patch ops phase_revise accepts from the model
+_REVISE_PATCH_OPS = frozenset({"replace", "add"})
+
+# Static head of the phase_revise JSON Patch prompt
+_REVISE_PROMPT_HEAD = (
+    "You are revising a Bible word-study trading card JSON. "
+    "Return ONLY a JSON Patch array (RFC 6902) to apply to the provided CARD_JSON.\n"
+    "The patch must only modify keys under: /content or /model_prompt. "
+    "Do NOT modify /render_instructions, /style_guide, or /layout.\n"
+    "Follow game rules: there is ONE shared deck; do not say 'your deck'. "
+    "Allowed ops: add, replace. Do not use remove/move/copy/test.\n\n"
+    "IMPORTANT: Only make changes that are EXPLICITLY requested in the HUMAN_EDIT_INSTRUCTIONS below. "
+    "Do NOT make any other changes, improvements, or reformatting beyond what was asked.\n\n"
+    "GAME RULES (must follow):\n"
+)
+
 # Use absolute path so it works in parallel workers regardless of cwd
 _THIS_DIR = Path(__file__).resolve().parent
 DEFAULT_STYLE_TEMPLATE = _THIS_DIR.parent / "templates" / "card_template.png"
@@ -170,12 +241,16 @@ TYPE_ORDER = ["NOUN", "VERB", "ADJECTIVE", "NAME", "TITLE"]
 TYPE_TARGETS = {"NOUN": 16, "VERB": 20, "ADJECTIVE": 20, "NAME": 16, "TITLE": 18}  # counts for 90-card set
 
 
+@functools.lru_cache(maxsize=None)
 def _get_subtype_template(subtype: str) -> Path | None:
     """Get the template path for a specific subtype (rarity or type).
 
     Checks versioned template folders for matching subtype templates.
     Subtypes: common, uncommon, rare, glorious, noun, name, adjective, verb, title
 
+    The versioned templates are static for the life of a run, so the lookup
+    (meta.yml parse plus existence checks) is memoized per subtype.
+
     Returns:
         Path to template image if exists, None otherwise.
     """
@@ -185,11 +260,10 @@ def _get_subtype_template(subtype: str) -> Path | None:
     # Get current version from meta.yml
     meta_path = _CARD_TEMPLATE_DIR / "meta.yml"
     version = 1
-    if meta_path.exists():
+    if meta_path.exists() and yaml is not None:
         try:
-            import yaml
             with open(meta_path, "r", encoding="utf-8") as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=_SafeLoader) or {}
             version = int(meta.get("version", 1))
         except (ValueError, TypeError):
             version = 1
@@ -222,7 +296,7 @@ def _load_series_stats(series_dir: Path) -> dict:
         }
 
     with open(stats_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
 
     # Handle both old format ("counts"/"targets") and new format ("rarity_counts"/"rarity_targets")
     rarity_counts = data.get("rarity_counts", data.get("counts", {}))
@@ -252,7 +326,7 @@ def _save_series_stats(series_dir: Path, stats: dict) -> None:
     existing = {}
     if stats_path.exists():
         with open(stats_path, "r", encoding="utf-8") as f:
-            existing = yaml.safe_load(f) or {}
+            existing = yaml.load(f, Loader=_SafeLoader) or {}
 
     data = {
         "series": series_dir.name,
@@ -266,8 +340,10 @@ def _save_series_stats(series_dir: Path, stats: dict) -> None:
         "total": stats["total"],
     }
 
-    with open(stats_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    stats_path.write_text(
+        yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True),
+        encoding="utf-8",
+    )
 
 
 # --------------------------------------------------------------------------
@@ -291,7 +367,7 @@ def _load_cards_index(series_dir: Path) -> dict:
         }
 
     with open(index_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
 
     return {
         "words": data.get("words", []),
@@ -313,8 +389,10 @@ def _save_cards_index(series_dir: Path, index: dict) -> None:
         "cards": index.get("cards", []),
     }
 
-    with open(index_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    index_path.write_text(
+        yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True),
+        encoding="utf-8",
+    )
 
 
 def _extract_ability_pattern(ability_text: str) -> str:
@@ -461,7 +539,7 @@ def _rebuild_cards_index(series_dir: Path) -> dict:
 
         try:
             with open(meta_file, "r", encoding="utf-8") as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=_SafeLoader) or {}
         except Exception:
             continue
 
@@ -670,7 +748,7 @@ def _get_series_theme(series_dir: Path) -> str:
     stats_file = series_dir / "stats.yml"
     if stats_file.exists() and yaml:
         with open(stats_file, "r", encoding="utf-8") as f:
-            stats = yaml.safe_load(f) or {}
+            stats = yaml.load(f, Loader=_SafeLoader) or {}
         return stats.get("theme", "").strip()
     return ""
 
@@ -748,7 +826,7 @@ def _build_style_refs(
             card_rarity_meta = ""
             if meta_path.exists() and yaml:
                 with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = yaml.safe_load(f) or {}
+                    meta = yaml.load(f, Loader=_SafeLoader) or {}
                 card_type_meta = (meta.get("card_type") or meta.get("type", "")).upper()
                 card_rarity_meta = meta.get("rarity", "").upper()
 
@@ -792,28 +870,40 @@ def _build_style_refs(
     return refs, rarity_labels, fix_mode
 
 
-def _build_style_cmd_args(
+def _run_imagegen(
+    prompt_file: Path,
+    out_png: Path,
     style_refs: list[str],
     rarity_labels: dict[int, str] | None = None,
     target_rarity: str | None = None,
     fix_mode: bool = False,
-) -> list[str]:
-    """Build CLI args for gemini_style.py from style ref list."""
-    args: list[str] = []
-    for ref in style_refs:
-        args.extend(["--style", ref])
-
-    if rarity_labels:
-        for pos, rarity in rarity_labels.items():
-            args.extend(["--rarity-label", f"{pos}:{rarity}"])
-
-    if target_rarity:
-        args.extend(["--target-rarity", target_rarity])
+    polish: bool = False,
+    *,
+    use_cache: bool = True,
+) -> None:
+    """Generate a card image in-process (optionally followed by polish).
 
-    if fix_mode:
-        args.append("--fix-mode")
+    Uses gemini_style when style refs are available, otherwise falls back
+    to plain gemini_image generation. Imports are deferred so phases that
+    never generate images don't pay for google-genai. Regenerations
+    (revise, rebuild, review) pass use_cache=False so the image cache cannot
+    return the image they are replacing.
+    """
+    from hypertext.pipeline.gen_and_polish import generate_card_image
 
-    return args
+    try:
+        generate_card_image(
+            prompt_file,
+            out_png,
+            style_refs=style_refs,
+            rarity_labels=rarity_labels,
+            target_rarity=target_rarity,
+            fix_mode=fix_mode,
+            polish=polish,
+            use_cache=use_cache,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Image generation failed for {out_png}: {e}") from e
 
 
 def _write_generation_log(
@@ -883,16 +973,15 @@ def _write_generation_log(
 
     lines.append("")  # Trailing newline
 
-    with open(log_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    log_path.write_text("\n".join(lines), encoding="utf-8")
 
     _log(f"[{phase}] wrote generation.log to {log_path}")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_rules_appendix() -> str:
     try:
-        with open(RULES_PATH, "r", encoding="utf-8") as f:
-            rules = f.read().strip()
+        rules = RULES_PATH.read_text(encoding="utf-8").strip()
     except OSError:
         rules = ""
 
@@ -906,7 +995,15 @@ def _log(msg: str) -> None:
     print(msg, flush=True)
 
 
+# ASCII slug table: alphanumerics map to themselves, everything else to "-"
+_SLUG_TABLE = {i: (chr(i) if chr(i).isalnum() else "-") for i in range(0x80)}
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
 def slugify(word: str) -> str:
+    if word.isascii():
+        return _DASH_RUN_RE.sub("-", word.lower().translate(_SLUG_TABLE)).strip("-")
+
     out = []
     prev_dash = False
     for c in word.lower().strip():
@@ -924,7 +1021,7 @@ def load_queue(queue_path: Path) -> list[dict]:
     if yaml is None:
         raise RuntimeError("pyyaml is required. Install with: pip install pyyaml")
     with open(queue_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return data or []
 
 
@@ -932,8 +1029,49 @@ def save_queue(queue_path: Path, queue: list[dict]) -> None:
     if yaml is None:
         raise RuntimeError("pyyaml is required. Install with: pip install pyyaml")
     queue_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(queue_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(queue, f, sort_keys=False)
+    queue_path.write_text(yaml.dump(queue, Dumper=_SafeDumper, sort_keys=False), encoding="utf-8")
+
+
+def append_queue(queue_path: Path, entries: list[dict]) -> None:
+    """Append entries to queue.yml without rewriting the existing ones.
+
+    queue.yml is a top-level block sequence, so dumping just the new items and
+    appending the text keeps the file valid; per-card cost no longer grows
+    with queue length. Falls back to a full save_queue when the file is
+    missing, empty or does not open with an unindented block sequence
+    (e.g. "[]", a leading comment, or an indented list).
+    """
+    if yaml is None:
+        raise RuntimeError("pyyaml is required. Install with: pip install pyyaml")
+    if not entries:
+        return
+    try:
+        with open(queue_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 1))
+            ends_with_newline = f.read(1) == b"\n"
+            f.seek(0)
+            # Only a sequence at column 0 can take unindented items after it
+            is_block_seq = f.read(1) == b"-"
+    except FileNotFoundError:
+        size = 0
+    if size == 0 or not is_block_seq:
+        existing = load_queue(queue_path) if size else []
+        save_queue(queue_path, existing + list(entries))
+        return
+    text = yaml.dump(list(entries), Dumper=_SafeDumper, sort_keys=False)
+    with open(queue_path, "a", encoding="utf-8") as f:
+        if not ends_with_newline:
+            f.write("\n")
+        f.write(text)
+
+
+# Leading code fence around a model reply: any fence length >= 3, any (or no)
+# language tag; the payload runs up to the matching closing fence
+_JSON_FENCE_RE = re.compile(r"\A(`{3,})[\w+.-]*[ \t]*\n?(.*?)\n?\1", re.DOTALL)
+# First character that can open a JSON document
+_JSON_START_RE = re.compile(r"[{\[]")
 
 
 def _parse_json_from_model(text: str) -> dict:
@@ -941,15 +1079,9 @@ def _parse_json_from_model(text: str) -> dict:
     if not raw:
         raise RuntimeError("Model returned empty response; expected JSON.")
 
-    candidates: list[str] = [raw]
-    if raw.startswith("```") and "```" in raw[3:]:
-        parts = raw.split("```")
-        if len(parts) >= 3:
-            fenced = parts[1]
-            fenced = fenced.lstrip()
-            if fenced.lower().startswith("json"):
-                fenced = fenced[4:]
-            candidates.append(fenced.strip())
+    # Try the fenced payload first: when a fence is present the raw text never parses
+    fence = _JSON_FENCE_RE.match(raw)
+    candidates: list[str] = [fence.group(2), raw] if fence else [raw]
 
     decoder = json.JSONDecoder()
     last_err: Exception | None = None
@@ -959,20 +1091,16 @@ def _parse_json_from_model(text: str) -> dict:
         if not s:
             continue
         try:
-            return json.loads(s)
+            return _json_loads(s)
         except Exception as e:
             last_err = e
 
-        start_idx = None
-        for ch in ("{", "["):
-            i = s.find(ch)
-            if i != -1 and (start_idx is None or i < start_idx):
-                start_idx = i
-        if start_idx is None:
+        start = _JSON_START_RE.search(s)
+        if start is None:
             continue
 
         try:
-            obj, _end = decoder.raw_decode(s[start_idx:])
+            obj, _end = decoder.raw_decode(s, start.start())
             return obj
         except Exception as e:
             last_err = e
@@ -1030,7 +1158,7 @@ def _generate_queue_entries(
         stats_file = series_dir / "stats.yml"
         if stats_file.exists():
             with open(stats_file, "r", encoding="utf-8") as f:
-                stats = yaml.safe_load(f) or {}
+                stats = yaml.load(f, Loader=_SafeLoader) or {}
             theme = stats.get("theme", "").strip()
             if theme and theme in SERIES_THEME_PROMPTS:
                 theme_instruction = SERIES_THEME_PROMPTS[theme] + "\n\n"
@@ -1090,16 +1218,20 @@ def _generate_queue_entries(
         "Pick words that FIT the assigned rarity. Don't assign KING as COMMON or WATER as GLORIOUS.\n\n"
     )
 
+    # Sorted, de-duplicated avoid list placed ahead of the per-call parts, so
+    # repeated top-ups in a run share an identical prompt prefix
+    avoid_words = sorted({w.strip().upper() for w in existing_words if w and w.strip()})
     prompt = (
         theme_instruction
         + rarity_weight_guide
+        + "WORDS ALREADY USED (do not reuse any of these): "
+        + (", ".join(avoid_words) if avoid_words else "none")
+        + ".\n\n"
         + specific_assignments
         + "Generate "
         + str(count)
-        + " distinct English words for a daily Biblical word-study trading card project. "
-        "Avoid any words already used: "
-        + (", ".join(existing_words) if existing_words else "none")
-        + ". "
+        + " distinct English words for a daily Biblical word-study trading card project, "
+        "none of which appear in the used list above. "
         "For each item, provide: card_type (NOUN|VERB|ADJECTIVE|NAME|TITLE) and rarity (COMMON|UNCOMMON|RARE|GLORIOUS). "
         + rarity_instruction + " " + type_instruction + " "
         "Return ONLY valid JSON as an array of objects with keys: word, card_type, rarity. "
@@ -1128,6 +1260,93 @@ def _generate_queue_entries(
     return out
 
 
+_STR = {"type": "string"}
+_OBJ = {"type": "object"}
+
+# A stat the card builder can int(): a number or a string of digits
+_STAT = {"anyOf": [{"type": "number"}, {"type": "string", "pattern": "^\\s*[0-9]+\\s*$"}]}
+
+
+# Shape requested from the model by _generate_card_recipe / _generate_card_recipes_batch.
+# Only what _apply_recipe_to_card and _normalize_trivia cannot coerce is
+# enforced: missing stats default to 3 and missing verse/language fields to
+# "", so those near-misses are accepted rather than paid for again.
+RECIPE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "gloss": _STR,
+        "art_prompt": _STR,
+        "ability_text": _STR,
+        "stats": {"type": "object", "properties": {k: _STAT for k in ("lore", "context", "complexity")}},
+        "ot_verse": _OBJ,
+        "nt_verse": _OBJ,
+        "greek": _OBJ,
+        "hebrew": _OBJ,
+        "ot_refs": _STR,
+        "nt_refs": _STR,
+        "trivia": {"type": "array", "minItems": 3},
+    },
+    "required": ["gloss", "art_prompt", "ability_text", "trivia"],
+}
+
+_validate_recipe = fastjsonschema.compile(RECIPE_SCHEMA) if fastjsonschema is not None else None
+
+
+def _recipe_error(recipe) -> str | None:
+    """Return why recipe does not match RECIPE_SCHEMA, or None if it does (or cannot be checked)."""
+    if not isinstance(recipe, dict):
+        return "not a JSON object"
+    if _validate_recipe is None:
+        return None
+    try:
+        _validate_recipe(recipe)
+    except fastjsonschema.JsonSchemaException as e:
+        return e.message
+    return None
+
+
+# Static fragments of the recipe prompts, shared by the single and batch requests
+_RECIPE_FIELDS_TAIL = (
+    "  \"stats\": {\"lore\": int 1-5, \"context\": int 1-5, \"complexity\": int 1-5},\n"
+    "  \"ot_verse\": {\"ref\": string, \"snippet\": string},\n"
+    "  \"nt_verse\": {\"ref\": string, \"snippet\": string},\n"
+    "  \"greek\": {\"text\": string, \"translit\": string},\n"
+    "  \"hebrew\": {\"text\": string, \"translit\": string},\n"
+    "  \"ot_refs\": string (short refs separated by ' • '),\n"
+    "  \"nt_refs\": string (short refs separated by ' • '),\n"
+    "  \"trivia\": [exactly 3 short strings]\n"
+    "}.\n\n"
+)
+
+_RECIPE_PROMPT_HEAD = (
+    "You are generating research-backed metadata for a daily Bible word-study trading card. "
+    "Return ONLY valid JSON with this exact shape: {\n"
+    "  \"gloss\": string,\n"
+    "  \"art_prompt\": string (must NOT mention text/letters/words/writing),\n"
+)
+
+_RECIPE_BATCH_PROMPT_HEAD = (
+    "You are generating research-backed metadata for daily Bible word-study trading cards. "
+    "Return ONLY a valid JSON array with one object per input card, each with this exact shape: {\n"
+    "  \"number\": int (the input card number),\n"
+    "  \"gloss\": string,\n"
+    "  \"art_prompt\": string (must NOT mention text/letters/words/writing),\n"
+    "  \"ability_text\": string (if the input card has \"ability\", USE IT EXACTLY - do not modify),\n"
+    + _RECIPE_FIELDS_TAIL
+    + "GAME RULES (must follow):\n"
+)
+
+_RECIPE_GROUNDING_NOTE = (
+    "Use Google Search grounding to pick appropriate verses and correct language forms. "
+    "Verses/snippets must be short (not full verses). "
+)
+
+_RECIPE_ABILITY_CONSISTENCY = (
+    "Keep ability_text consistent with rarity patterns "
+    "(COMMON simple; UNCOMMON suit-based; RARE references stats; GLORIOUS unique)."
+)
+
+
 def _generate_card_recipe(*, number: int, word: str, card_type: str, rarity: str, ability: str | None = None) -> dict:
     rules_appendix = _load_rules_appendix()
 
@@ -1141,34 +1360,19 @@ def _generate_card_recipe(*, number: int, word: str, card_type: str, rarity: str
         ability_instruction = "  \"ability_text\": string,\n"
         ability_note = ""
 
-    prompt = (
-        "You are generating research-backed metadata for a daily Bible word-study trading card. "
-        "Return ONLY valid JSON with this exact shape: {\n"
-        "  \"gloss\": string,\n"
-        "  \"art_prompt\": string (must NOT mention text/letters/words/writing),\n"
-        + ability_instruction +
-        "  \"stats\": {\"lore\": int 1-5, \"context\": int 1-5, \"complexity\": int 1-5},\n"
-        "  \"ot_verse\": {\"ref\": string, \"snippet\": string},\n"
-        "  \"nt_verse\": {\"ref\": string, \"snippet\": string},\n"
-        "  \"greek\": {\"text\": string, \"translit\": string},\n"
-        "  \"hebrew\": {\"text\": string, \"translit\": string},\n"
-        "  \"ot_refs\": string (short refs separated by ' • '),\n"
-        "  \"nt_refs\": string (short refs separated by ' • '),\n"
-        "  \"trivia\": [exactly 3 short strings]\n"
-        "}.\n\n"
-        f"Card number: {number:03d}\n"
-        f"Word: {word}\n"
-        f"Card type: {card_type}\n"
-        f"Rarity: {rarity}\n\n"
-        + ability_note +
-        "GAME RULES (must follow):\n"
-        + GAME_RULES_SNIPPET
-        + rules_appendix
-        + "\n\n"
-        "Use Google Search grounding to pick appropriate verses and correct language forms. "
-        "Verses/snippets must be short (not full verses). "
-        + ("" if ability else "Keep ability_text consistent with rarity patterns (COMMON simple; UNCOMMON suit-based; RARE references stats; GLORIOUS unique).")
-    )
+    prompt = "".join([
+        _RECIPE_PROMPT_HEAD,
+        ability_instruction,
+        _RECIPE_FIELDS_TAIL,
+        f"Card number: {number:03d}\nWord: {word}\nCard type: {card_type}\nRarity: {rarity}\n\n",
+        ability_note,
+        "GAME RULES (must follow):\n",
+        GAME_RULES_SNIPPET,
+        rules_appendix,
+        "\n\n",
+        _RECIPE_GROUNDING_NOTE,
+        "" if ability else _RECIPE_ABILITY_CONSISTENCY,
+    ])
 
     _log(f"[plan] generating recipe via Gemini (#{number:03d} {word} {card_type} {rarity})")
     text, grounding = generate_text_with_grounding(
@@ -1179,7 +1383,11 @@ def _generate_card_recipe(*, number: int, word: str, card_type: str, rarity: str
     )
     try:
         data = _parse_json_from_model(text)
-    except Exception:
+        problem = _recipe_error(data)
+        if problem:
+            raise RuntimeError(f"Recipe does not match the requested shape: {problem}")
+    except Exception as e:
+        _log(f"[plan] recipe for #{number:03d} {word} unusable ({e}); retrying")
         retry_prompt = prompt + "\n\nIMPORTANT: Return ONLY raw JSON (no markdown, no backticks, no commentary)."
         text, grounding = generate_text_with_grounding(
             retry_prompt,
@@ -1188,21 +1396,293 @@ def _generate_card_recipe(*, number: int, word: str, card_type: str, rarity: str
             use_google_search=True,
         )
         data = _parse_json_from_model(text)
-    if not isinstance(data, dict):
-        raise RuntimeError("Recipe generation did not return a JSON object.")
+        problem = _recipe_error(data)
+        if problem:
+            raise RuntimeError(f"Recipe for #{number:03d} {word} does not match the requested shape: {problem}")
 
     if isinstance(grounding, dict):
         data["grounding"] = grounding
     return data
 
 
+# Max queue entries whose recipes are requested in one Gemini call during batch runs
+PLAN_BATCH_SIZE = int(os.environ.get("HYPERTEXT_PLAN_BATCH", "8"))
+
+# Recipes fetched ahead of phase_plan, keyed by _recipe_key
+_RECIPE_PREFETCH: dict[tuple[int, str, str, str, str], dict] = {}
+
+
+def _recipe_key(number: int, word: str, card_type: str, rarity: str, ability) -> tuple[int, str, str, str, str]:
+    """Key a prefetched recipe by every queue field the recipe prompt uses."""
+    return (number, word, card_type, rarity, str(ability or ""))
+
+
+def _generate_card_recipes_batch(items: list[dict]) -> dict[int, dict]:
+    """Generate recipes for several cards in one grounded Gemini call.
+
+    Each item has number, word, card_type, rarity and optionally ability.
+    Returns recipes keyed by card number; cards the model left out are simply
+    missing, so callers should fall back to _generate_card_recipe for them.
+    """
+    if not items:
+        return {}
+    rules_appendix = _load_rules_appendix()
+    cards = [
+        {
+            "number": int(it["number"]),
+            "word": it["word"],
+            "card_type": it["card_type"],
+            "rarity": it["rarity"],
+            **({"ability": it["ability"]} if it.get("ability") else {}),
+        }
+        for it in items
+    ]
+
+    prompt = "".join([
+        _RECIPE_BATCH_PROMPT_HEAD,
+        GAME_RULES_SNIPPET,
+        rules_appendix,
+        "\n\n",
+        _RECIPE_GROUNDING_NOTE,
+        "Keep generated ability_text consistent with rarity patterns "
+        "(COMMON simple; UNCOMMON suit-based; RARE references stats; GLORIOUS unique).\n\n",
+        "INPUT_CARDS:\n",
+        _json_dumps(cards),
+    ])
+
+    _log(f"[plan] generating {len(cards)} recipes via Gemini in one request")
+    text, grounding = generate_text_with_grounding(
+        prompt,
+        model="gemini-3-pro-preview",
+        temperature=0.2,
+        use_google_search=True,
+    )
+    try:
+        data = _parse_json_from_model(text)
+    except Exception:
+        retry_prompt = prompt + "\n\nIMPORTANT: Return ONLY raw JSON (no markdown, no backticks, no commentary)."
+        text, grounding = generate_text_with_grounding(
+            retry_prompt,
+            model="gemini-3-pro-preview",
+            temperature=0.2,
+            use_google_search=True,
+        )
+        data = _parse_json_from_model(text)
+    if not isinstance(data, list):
+        raise RuntimeError("Batch recipe generation did not return a JSON array.")
+
+    wanted = {c["number"] for c in cards}
+    recipes: dict[int, dict] = {}
+    for rec in data:
+        if not isinstance(rec, dict):
+            continue
+        try:
+            number = int(rec.pop("number"))
+        except (KeyError, TypeError, ValueError):
+            continue
+        problem = _recipe_error(rec)
+        if problem:
+            # Left out so the caller regenerates this card on its own
+            _log(f"[plan] batch recipe for #{number:03d} rejected: {problem}")
+            continue
+        if number in wanted:
+            if isinstance(grounding, dict):
+                # One search served the whole batch; its sources are not
+                # specific to this card
+                rec["grounding"] = {**grounding, "scope": "batch"}
+            recipes[number] = rec
+    return recipes
+
+
+def _prefetch_queue_recipes(series_dir: Path, *, count: int, in_progress: set[str] | None = None) -> int:
+    """Fetch recipes for the next `count` incomplete queue entries in one request.
+
+    Results land in _RECIPE_PREFETCH, where phase_plan picks them up. Entries
+    already prefetched or in progress are skipped. Returns how many were fetched.
+    """
+    in_progress = in_progress or set()
+    cards_dir = series_dir / "cards"
+    existing_dirs = _existing_card_dir_names(cards_dir)
+    items: list[dict] = []
+    for idx, q_entry in enumerate(load_queue(series_dir / "deck" / "queue.yml")):
+        if len(items) >= count:
+            break
+        if not isinstance(q_entry, dict):
+            continue
+        number = idx + 1
+        word = str(q_entry.get("word", "")).upper()
+        card_name = f"{number:03d}-{slugify(word)}"
+        if card_name in in_progress:
+            continue
+        if card_name in existing_dirs and (cards_dir / card_name / "outputs" / "card_1024x1536.png").exists():
+            continue
+        card_type = str(q_entry.get("card_type", "NOUN")).upper()
+        rarity = str(q_entry.get("rarity", "COMMON")).upper()
+        if _recipe_key(number, word, card_type, rarity, q_entry.get("ability")) in _RECIPE_PREFETCH:
+            continue
+        items.append({
+            "number": number,
+            "word": word,
+            "card_type": card_type,
+            "rarity": rarity,
+            "ability": q_entry.get("ability"),
+        })
+    if len(items) < 2:
+        # A single card gains nothing from batching; phase_plan fetches it itself
+        return 0
+
+    try:
+        recipes = _generate_card_recipes_batch(items)
+    except Exception as e:
+        _log(f"[plan] batch recipe request failed, falling back to per-card requests: {e}")
+        return 0
+    for it in items:
+        recipe = recipes.get(it["number"])
+        if recipe is not None:
+            key = _recipe_key(it["number"], it["word"], it["card_type"], it["rarity"], it["ability"])
+            _RECIPE_PREFETCH[key] = recipe
+    _log(f"[plan] prefetched {len(recipes)}/{len(items)} recipes")
+    return len(recipes)
+
+
+@dataclass
+class _CardContentCtx:
+    """Resolved recipe values for one card, consumed by _CONTENT_FIELDS."""
+    number: int
+    series: str
+    word: str
+    gloss: str
+    card_type: str
+    rarity: str
+    art_prompt: str
+    ability_text: str
+    stats: dict
+    ot_ref: str
+    ot_snip: str
+    nt_ref: str
+    nt_snip: str
+    greek: dict
+    hebrew: dict
+    ot_refs: str
+    nt_refs: str
+    trivia: list[str]
+    quotes: tuple[str, str] = ('"', '"')
+
+
+# card["content"] keys filled from a recipe, in template order
+_CONTENT_FIELDS: tuple[tuple[str, Callable[[_CardContentCtx], Any]], ...] = (
+    ("NUMBER", lambda c: f"{c.number:03d}"),
+    ("SERIES", lambda c: c.series),
+    ("WORD", lambda c: c.word),
+    ("GLOSS", lambda c: c.gloss),
+    ("CARD_TYPE", lambda c: c.card_type),
+    ("RARITY_TEXT", lambda c: c.rarity),
+    ("RARITY_ICON", lambda c: c.rarity),
+    ("ART_PROMPT", lambda c: c.art_prompt),
+    ("ABILITY_TEXT", lambda c: c.ability_text),
+    ("STAT_LORE", lambda c: int(c.stats.get("lore", 3))),
+    ("STAT_CONTEXT", lambda c: int(c.stats.get("context", 3))),
+    ("STAT_COMPLEXITY", lambda c: int(c.stats.get("complexity", 3))),
+    ("OT_VERSE_REF", lambda c: c.ot_ref),
+    ("OT_VERSE_SNIPPET", lambda c: c.ot_snip),
+    ("NT_VERSE_REF", lambda c: c.nt_ref),
+    ("NT_VERSE_SNIPPET", lambda c: c.nt_snip),
+    ("OT_VERSE_LINE", lambda c: f"{c.ot_ref} — {c.quotes[0]}{c.ot_snip}{c.quotes[1]}"),
+    ("NT_VERSE_LINE", lambda c: f"{c.nt_ref} — {c.quotes[0]}{c.nt_snip}{c.quotes[1]}"),
+    ("GREEK", lambda c: str(c.greek.get("text", "")).strip()),
+    ("GREEK_TRANSLIT", lambda c: str(c.greek.get("translit", "")).strip()),
+    ("HEBREW", lambda c: str(c.hebrew.get("text", "")).strip()),
+    ("HEBREW_TRANSLIT", lambda c: str(c.hebrew.get("translit", "")).strip()),
+    ("OT_REFS", lambda c: c.ot_refs),
+    ("NT_REFS", lambda c: c.nt_refs),
+    ("TRIVIA_BULLETS", lambda c: c.trivia),
+)
+
+
+def _fill_card_content(content: dict, ctx: _CardContentCtx) -> dict:
+    """Set every recipe-derived field of card["content"] in one update."""
+    content.update({key: fn(ctx) for key, fn in _CONTENT_FIELDS})
+    return content
+
+
+def _apply_recipe_to_card(
+    card: dict,
+    recipe: dict,
+    *,
+    number: int,
+    series: str,
+    word: str,
+    card_type: str,
+    rarity: str,
+    trivia: list[str] | None = None,
+    overrides: dict | None = None,
+    quotes: tuple[str, str] = ('"', '"'),
+) -> _CardContentCtx:
+    """Fill card["content"] and card["grounding"] from a generated recipe.
+
+    overrides holds queue-supplied values keyed like the recipe; truthy ones
+    win over the recipe. trivia, when given, replaces the recipe's trivia
+    list as-is; otherwise the recipe's items are stripped of blanks.
+    Returns the resolved values so callers can build meta.yml and post.md.
+    """
+    values = dict(recipe)
+    if overrides:
+        values.update((k, v) for k, v in overrides.items() if v)
+
+    def _dict(key: str) -> dict:
+        value = values.get(key)
+        return value if isinstance(value, dict) else {}
+
+    def _str(key: str) -> str:
+        return str(values.get(key, "")).strip()
+
+    ot_verse = _dict("ot_verse")
+    nt_verse = _dict("nt_verse")
+    if trivia is None:
+        raw_trivia = values.get("trivia", [])
+        trivia = [str(x).strip() for x in raw_trivia if str(x).strip()] if isinstance(raw_trivia, list) else []
+
+    ctx = _CardContentCtx(
+        number=number,
+        series=series,
+        word=word,
+        gloss=_str("gloss"),
+        card_type=card_type,
+        rarity=rarity,
+        art_prompt=_str("art_prompt"),
+        ability_text=_str("ability_text"),
+        stats=_dict("stats"),
+        ot_ref=str(ot_verse.get("ref", "")).strip(),
+        ot_snip=str(ot_verse.get("snippet", "")).strip(),
+        nt_ref=str(nt_verse.get("ref", "")).strip(),
+        nt_snip=str(nt_verse.get("snippet", "")).strip(),
+        greek=_dict("greek"),
+        hebrew=_dict("hebrew"),
+        ot_refs=_str("ot_refs"),
+        nt_refs=_str("nt_refs"),
+        trivia=trivia,
+        quotes=quotes,
+    )
+    _fill_card_content(card.setdefault("content", {}), ctx)
+    card["grounding"] = recipe.get("grounding", {}) if isinstance(recipe.get("grounding"), dict) else {}
+    return ctx
+
+
 def _normalize_trivia(items: list[str]) -> list[str]:
-    cleaned = [str(x).strip() for x in items if str(x).strip()]
-    if len(cleaned) < 3:
-        raise RuntimeError(f"Expected at least 3 trivia items, got {len(cleaned)}")
-    if len(cleaned) > 3:
-        cleaned = cleaned[:3]
-    return cleaned
+    # Strip each item once and stop as soon as three are collected
+    cleaned: list[str] = []
+    for x in items:
+        s = str(x).strip()
+        if s:
+            cleaned.append(s)
+            if len(cleaned) == 3:
+                return cleaned
+    raise RuntimeError(f"Expected at least 3 trivia items, got {len(cleaned)}")
+
+
+# Unused candidates from earlier _pick_demo_entry calls in this process
+_DEMO_ENTRY_POOL: list[dict] = []
+_DEMO_ENTRY_POOL_LOCK = threading.Lock()
 
 
 def _pick_demo_entry(demo_dir: Path | None = None) -> dict:
@@ -1229,32 +1709,210 @@ def _pick_demo_entry(demo_dir: Path | None = None) -> dict:
                 if len(parts) > 1:
                     existing_words.append(parts[1].upper())
 
+    existing = set(existing_words)
+    with _DEMO_ENTRY_POOL_LOCK:
+        # Reuse candidates left over from an earlier call before asking the model again
+        _DEMO_ENTRY_POOL[:] = [e for e in _DEMO_ENTRY_POOL if e["word"] not in existing]
+        if _DEMO_ENTRY_POOL:
+            return _DEMO_ENTRY_POOL.pop(random.randrange(len(_DEMO_ENTRY_POOL)))
+
     candidates = _generate_queue_entries(count=5, existing_words=existing_words)
-    return random.choice(candidates)
+    pick = candidates.pop(random.randrange(len(candidates)))
+    with _DEMO_ENTRY_POOL_LOCK:
+        _DEMO_ENTRY_POOL.extend(candidates)
+    return pick
+
+
+# Numbered card dir names: "NNN-slug"
+_CARD_DIR_RE = re.compile(r"[0-9]{3}-")
+
+
+def _iter_card_dirs(cards_dir: Path):
+    """Yield os.DirEntry objects for numbered card dirs ("NNN-slug") in one scandir pass."""
+    match = _CARD_DIR_RE.match
+    try:
+        with os.scandir(cards_dir) as it:
+            for entry in it:
+                if match(entry.name) and entry.is_dir():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def _list_card_dirs(cards_dir: Path) -> list[Path]:
+    """Return numbered card dirs in cards_dir, sorted by name."""
+    return [cards_dir / name for name in sorted(e.name for e in _iter_card_dirs(cards_dir))]
 
 
 def next_number(cards_dir: Path) -> int:
-    existing = sorted(glob.glob(str(cards_dir / "[0-9][0-9][0-9]-*")))
-    if not existing:
-        return 1
-    last = os.path.basename(existing[-1]).split("-")[0]
-    return int(last) + 1
+    return max((int(e.name[:3]) for e in _iter_card_dirs(cards_dir)), default=0) + 1
 
 
 def read_json(path: Path) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Both orjson and json accept UTF-8 bytes, so skip the str decode
+    return _json_loads(Path(path).read_bytes())
+
+
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    """Write data via a sibling temp file + os.replace so readers never see a torn file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if isinstance(data, bytes):
+            tmp.write_bytes(data)
+        else:
+            tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def write_json(path: Path, obj: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    _atomic_write(path, _json_dumps_bytes(obj, indent=True))
 
 
 def _read_text(path: Path) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _write_text_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds exactly this text.
+
+    Skipping identical rewrites keeps mtimes stable for anything that keys off
+    them. Returns True if the file was written.
+    """
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    _atomic_write(path, text)
+    return True
+
+
+def _dump_meta_yaml(meta: dict) -> str:
+    """Serialize card metadata to YAML exactly as the committed meta.yml files are.
+
+    Uses the pure-Python SafeDumper (yaml.safe_dump): libyaml wraps long
+    non-ASCII strings at different points, which would rewrite unchanged
+    files on their next save.
+    """
+    return yaml.safe_dump(meta, sort_keys=False, allow_unicode=True)
+
+
+# Last meta dict written per meta.yml (abs path -> (meta.yml mtime_ns, meta)), so a
+# later phase in the same process can skip re-parsing what it just wrote.
+_META_CACHE: dict[str, tuple[int, dict]] = {}
+
+
+def _remember_meta(meta_path: Path, meta: dict) -> None:
+    try:
+        mtime = meta_path.stat().st_mtime_ns
+    except OSError:
+        return
+    _META_CACHE[os.path.abspath(meta_path)] = (mtime, copy.deepcopy(meta))
+
+
+def _meta_yml_digest(yml_bytes: bytes) -> str:
+    return hashlib.blake2b(yml_bytes, digest_size=16).hexdigest()
+
+
+def _dump_meta_files(meta: dict) -> tuple[bytes, bytes]:
+    """Serialize meta to (meta.yml, meta.json) payloads.
+
+    The meta.json sidecar records a digest of the exact meta.yml bytes it was
+    written with, so _read_meta only trusts it while meta.yml is unchanged.
+    """
+    yml_bytes = _dump_meta_yaml(meta).encode("utf-8")
+    sidecar = {"meta_yml_digest": _meta_yml_digest(yml_bytes), "meta": meta}
+    return yml_bytes, _json_dumps_bytes(sidecar, default=str)
+
+
+def _write_meta(meta_path: Path, meta: dict) -> None:
+    """Write meta.yml plus a meta.json sidecar used for fast machine reloads."""
+    yml_bytes, json_bytes = _dump_meta_files(meta)
+    _atomic_write(meta_path, yml_bytes)
+    _atomic_write(meta_path.with_suffix(".json"), json_bytes)
+    _remember_meta(meta_path, meta)
+
+
+def _read_meta(meta_path: Path) -> dict:
+    """Read card metadata from meta.yml, using meta.json to skip YAML parsing.
+
+    meta.yml is authoritative. The sidecar is only used when its recorded
+    digest matches meta.yml's current content, so a hand edit, another
+    writer or a checkout that leaves it stale falls back to parsing the YAML.
+    A dict this process wrote is served from _META_CACHE while meta.yml's
+    mtime is unchanged.
+    """
+    try:
+        yml_mtime = meta_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _META_CACHE.get(os.path.abspath(meta_path))
+    if cached is not None and cached[0] == yml_mtime:
+        return copy.deepcopy(cached[1])
+    yml_bytes = meta_path.read_bytes()
+    try:
+        sidecar = _json_loads(meta_path.with_suffix(".json").read_bytes())
+        if (
+            isinstance(sidecar, dict)
+            and sidecar.get("meta_yml_digest") == _meta_yml_digest(yml_bytes)
+            and isinstance(sidecar.get("meta"), dict)
+        ):
+            return sidecar["meta"]
+    except (OSError, ValueError):
+        pass
+    meta = yaml.load(yml_bytes.decode("utf-8"), Loader=_SafeLoader) or {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _write_card_bundle(
+    card_dir: Path,
+    *,
+    card: dict,
+    prompt_text: str,
+    meta: dict | None = None,
+) -> None:
+    """Write card.json, prompt.txt and (optionally) meta.yml/meta.json together.
+
+    Every payload is serialized before any file is opened, so the write phase
+    is pure I/O and a serialization error leaves the card dir untouched.
+    """
+    payloads: list[tuple[str, str | bytes]] = [
+        ("card.json", _json_dumps_bytes(card, indent=True)),
+        ("prompt.txt", prompt_text),
+    ]
+    if meta is not None:
+        payloads.extend(zip(("meta.yml", "meta.json"), _dump_meta_files(meta)))
+
+    card_dir.mkdir(parents=True, exist_ok=True)
+    for name, data in payloads:
+        if name == "prompt.txt":
+            _write_text_if_changed(card_dir / name, data)
+        else:
+            _atomic_write(card_dir / name, data)
+    if meta is not None:
+        _remember_meta(card_dir / "meta.yml", meta)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_template(path_str: str, mtime_ns: int) -> dict:
+    """Parse a card template once per (path, mtime); callers must deepcopy."""
+    return read_json(Path(path_str))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_text_template(path_str: str, mtime_ns: int) -> str:
+    """Read a text template once per (path, mtime)."""
+    return _read_text(Path(path_str))
+
+
+def load_card_template(template_path: Path) -> dict:
+    """Return a fresh, mutable copy of the card template at template_path."""
+    mtime_ns = template_path.stat().st_mtime_ns
+    return copy.deepcopy(_load_template(str(template_path), mtime_ns))
 
 
 class ReviseFormResult:
@@ -1638,6 +2296,58 @@ def _seed_revise_file(card_dir: Path, force: bool = False) -> None:
     target.write_text(_read_text(template_path), encoding="utf-8")
 
 
+# Worker threads used to write one planned card's files concurrently
+CARD_IO_WORKERS = int(os.environ.get("HYPERTEXT_CARD_IO_WORKERS", "4"))
+
+
+def _post_fields(card: dict, image_name: str) -> dict:
+    """Build render_post keyword arguments from a card's content."""
+    content = card.get("content", {}) if isinstance(card.get("content"), dict) else {}
+    trivia = content.get("TRIVIA_BULLETS", [])
+    return dict(
+        word=str(content.get("WORD", "")),
+        gloss=str(content.get("GLOSS", "")),
+        ot_ref=str(content.get("OT_VERSE_REF", "")),
+        ot_snip=str(content.get("OT_VERSE_SNIPPET", "")),
+        nt_ref=str(content.get("NT_VERSE_REF", "")),
+        nt_snip=str(content.get("NT_VERSE_SNIPPET", "")),
+        trivia_items=trivia if isinstance(trivia, list) else [],
+        image_rel_path=f"./outputs/{image_name}",
+    )
+
+
+def _materialize_card(
+    card_dir: Path,
+    *,
+    card: dict,
+    prompt_text: str,
+    post: dict,
+    meta: dict | None = None,
+    log_prefix: str = "[plan]",
+) -> None:
+    """Write a planned card's files (bundle, post.md, revise.txt) concurrently.
+
+    post holds the render_post keyword arguments other than the output path.
+    revise.txt is built from the in-memory card rather than via
+    _seed_revise_file, which would re-read card.json mid-write, and is only
+    seeded if missing.
+    """
+    card_dir.mkdir(parents=True, exist_ok=True)
+    revise_path = card_dir / "revise.txt"
+    with ThreadPoolExecutor(max_workers=CARD_IO_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                _write_card_bundle, card_dir, card=card, prompt_text=prompt_text, meta=meta
+            ): "card.json, prompt.txt" + (", meta.yml" if meta is not None else ""),
+            executor.submit(render_post, str(card_dir / "post.md"), **post): "post.md",
+        }
+        if not revise_path.exists():
+            futures[executor.submit(revise_path.write_text, _build_revise_content(card), encoding="utf-8")] = "revise.txt"
+        for future in as_completed(futures):
+            future.result()
+            _log(f"{log_prefix} wrote {futures[future]}")
+
+
 def _json_pointer_tokens(ptr: str) -> list[str]:
     if ptr == "":
         return []
@@ -1713,21 +2423,22 @@ def build_prompt_text(card: dict) -> str:
     if not content:
         # Fallback to old behavior if no content dict
         recipe = card.get("model_prompt", "").strip()
-        payload = json.dumps(card, ensure_ascii=False, indent=2)
+        payload = _json_dumps(card, indent=True)
         return f"{recipe}\n\nCARD_JSON:\n{payload}\n"
 
     # Load the text template
     template_path = Path(__file__).parent.parent / "templates" / "card_style_prompt_template.txt"
-    if not template_path.exists():
+    try:
+        template_mtime = template_path.stat().st_mtime_ns
+    except OSError:
         # Fallback if template missing
         print(f"Warning: Template {template_path} not found. Using legacy JSON prompt.")
         recipe = card.get("model_prompt", "").strip()
-        payload = json.dumps(card, ensure_ascii=False, indent=2)
+        payload = _json_dumps(card, indent=True)
         return f"{recipe}\n\nCARD_JSON:\n{payload}\n"
-        
-    with open(template_path, "r", encoding="utf-8") as f:
-        template_str = f.read()
-    
+
+    template_str = _load_text_template(str(template_path), template_mtime)
+
     # Prepare data for formatting
     data = dict(content)
     
@@ -1749,34 +2460,154 @@ def build_prompt_text(card: dict) -> str:
     except KeyError as e:
         print(f"Warning: Missing key {e} for prompt template. Falling back to legacy.")
         recipe = card.get("model_prompt", "").strip()
-        payload = json.dumps(card, ensure_ascii=False, indent=2)
+        payload = _json_dumps(card, indent=True)
         return f"{recipe}\n\nCARD_JSON:\n{payload}\n"
 
 
-def find_latest_card_dir(cards_dir: Path) -> Path | None:
-    dirs = sorted([Path(p) for p in glob.glob(str(cards_dir / "[0-9][0-9][0-9]-*"))])
-    if not dirs:
-        return None
-    return dirs[-1]
+def find_latest_card_dir(cards_dir: Path) -> Path | None:
+    latest = max((e.name for e in _iter_card_dirs(cards_dir)), default=None)
+    return cards_dir / latest if latest else None
+
+
+def _progress_path(cards_dir: Path) -> Path:
+    return cards_dir.parent / "deck" / "progress.json"
+
+
+def _read_progress(cards_dir: Path) -> dict:
+    try:
+        progress = read_json(_progress_path(cards_dir))
+    except Exception:
+        return {}
+    return progress if isinstance(progress, dict) else {}
+
+
+def _scan_image_targets(
+    cards_dir: Path, out_name: str, *, limit: int | None = None
+) -> tuple[list[Path], str | None]:
+    """Find card dirs that have a prompt but no rendered image, newest first.
+
+    deck/progress.json records the newest card dir at or below which every
+    card had its card.json, prompt.txt and image ("image_done_through").
+    Cards up to that mark only have their image re-checked, so a scan costs
+    one stat per older card; an image removed by hand is still found.
+
+    Returns (targets, mark). mark is where image_done_through should now
+    stand ("" if no card is complete yet), or None when the scan stopped at
+    limit before reaching every card. The scan never writes progress.json;
+    see _save_image_mark.
+    """
+    progress = _read_progress(cards_dir)
+    done_through = str(progress.get("image_done_through") or "")
+    names = sorted((e.name for e in _iter_card_dirs(cards_dir)), reverse=True)
+    targets: list[Path] = []
+    mark: str | None = None
+    for name in names:
+        d = os.path.join(cards_dir, name)
+        rendered = os.path.exists(os.path.join(d, "outputs", out_name))
+        if rendered and name <= done_through:
+            complete = True
+        else:
+            has_inputs = os.path.exists(os.path.join(d, "card.json")) and os.path.exists(
+                os.path.join(d, "prompt.txt")
+            )
+            complete = rendered and has_inputs
+            if has_inputs and not rendered:
+                targets.append(cards_dir / name)
+                if limit is not None and len(targets) >= limit:
+                    return targets, None
+        # The mark is the newest card with only complete cards at or below it
+        if not complete:
+            mark = None
+        elif mark is None:
+            mark = name
+    return targets, mark or ""
+
+
+def _save_image_mark(cards_dir: Path, mark: str) -> None:
+    """Record mark (from _scan_image_targets) as image_done_through in progress.json."""
+    progress = _read_progress(cards_dir)
+    if str(progress.get("image_done_through") or "") == mark:
+        return
+    if mark:
+        progress["image_done_through"] = mark
+    else:
+        progress.pop("image_done_through", None)
+    try:
+        write_json(_progress_path(cards_dir), progress)
+    except OSError as e:
+        _log(f"[imagegen] could not update progress file: {e}")
+
+
+def find_image_targets(cards_dir: Path, out_name: str, *, limit: int | None = None) -> list[Path]:
+    """Return card dirs that have a prompt but no rendered image, newest first."""
+    return _scan_image_targets(cards_dir, out_name, limit=limit)[0]
 
 
 def find_next_image_target(cards_dir: Path, out_name: str) -> Path | None:
-    dirs = sorted([Path(p) for p in glob.glob(str(cards_dir / "[0-9][0-9][0-9]-*"))])
-    for d in reversed(dirs):
-        out_png = d / "outputs" / out_name
-        prompt_txt = d / "prompt.txt"
-        card_json = d / "card.json"
-        if card_json.exists() and prompt_txt.exists() and not out_png.exists():
-            return d
-    return None
+    """Return the newest card dir that has a prompt but no rendered image."""
+    targets = find_image_targets(cards_dir, out_name, limit=1)
+    return targets[0] if targets else None
+
+
+class _CardDirWatcher:
+    """Track numbered card dirs in a cards dir across a batch run.
+
+    Mirrors find_latest_card_dir, but keeps the names it has already seen so
+    each refresh() is a single os.scandir pass and latest() costs nothing.
+    Card dirs are only ever added during a batch, so the maximum is updated
+    incrementally.
+    """
+
+    def __init__(self, cards_dir: Path):
+        self.cards_dir = cards_dir
+        self._names: set[str] = set()
+        self._latest: str | None = None
+        self.refresh()
+
+    def refresh(self) -> list[Path]:
+        """Rescan cards_dir and return any card dirs that appeared since the last scan."""
+        names = [e.name for e in _iter_card_dirs(self.cards_dir)]
+        new = sorted(n for n in names if n not in self._names)
+        if new:
+            self._names.update(new)
+            if self._latest is None or new[-1] > self._latest:
+                self._latest = new[-1]
+        return [self.cards_dir / n for n in new]
+
+    def latest(self) -> Path | None:
+        return self.cards_dir / self._latest if self._latest else None
+
+
+def _existing_card_dir_names(cards_dir: Path) -> set[str]:
+    """Return the names of card directories already present in cards_dir.
 
+    Built once per plan so queue entries can be checked by set membership
+    instead of stat-ing every entry's output path.
+    """
+    return {e.name for e in _iter_card_dirs(cards_dir)}
+
+
+def phase_plan(
+    *,
+    series_dir: Path,
+    template_path: Path,
+    auto: bool,
+    in_progress: set[str] | None = None,
+) -> int:
+    """Plan the next incomplete queue entry into a card directory.
 
-def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
+    in_progress names card dirs (e.g. "003-grace") that were already planned
+    and are still generating images; they are treated as complete so batch
+    runs can plan the next card without waiting for the image.
+    """
+    in_progress = in_progress or set()
     queue_path = series_dir / "deck" / "queue.yml"
     cards_dir = series_dir / "cards"
+    out_name = "card_1024x1536.png"
 
     print(f"Queue path: {queue_path}")
     queue = load_queue(queue_path)
+    existing_dirs = _existing_card_dir_names(cards_dir)
     if auto:
         # Combine words from queue AND from series index (for deduplication)
         queue_words = [str(x.get("word", "")).upper() for x in queue if isinstance(x, dict)]
@@ -1790,9 +2621,10 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
             q_number = idx + 1
             q_word = str(q_entry.get("word", "")).upper() if isinstance(q_entry, dict) else ""
             q_slug = slugify(q_word)
-            q_card_dir = cards_dir / f"{q_number:03d}-{q_slug}"
-            q_out_png = q_card_dir / "outputs" / "card_1024x1536.png"
-            if not q_out_png.exists():
+            q_name = f"{q_number:03d}-{q_slug}"
+            if q_name in in_progress:
+                continue
+            if q_name not in existing_dirs or not (cards_dir / q_name / "outputs" / out_name).exists():
                 incomplete_count += 1
 
         # Add one new entry if all current entries are complete
@@ -1815,14 +2647,15 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
 
             _log(f"[plan] needed rarities: {needed_rarities}")
             _log(f"[plan] needed types: {needed_types}")
-            queue.extend(_generate_queue_entries(
+            new_entries = _generate_queue_entries(
                 count=needed,
                 existing_words=existing_words,
                 needed_rarities=needed_rarities,
                 needed_types=needed_types,
                 series_dir=series_dir,
-            ))
-            save_queue(queue_path, queue)
+            )
+            append_queue(queue_path, new_entries)
+            queue.extend(new_entries)
 
     if not queue:
         print("Queue empty.")
@@ -1837,13 +2670,15 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
         number = idx + 1  # 1-indexed card number from queue position
         word = str(q_entry.get("word", "")).upper()
         slug = slugify(word)
-        card_dir = cards_dir / f"{number:03d}-{slug}"
+        card_name = f"{number:03d}-{slug}"
 
         # Skip if card folder exists with completed output
-        out_png = card_dir / "outputs" / "card_1024x1536.png"
-        if out_png.exists():
+        if card_name in existing_dirs and (cards_dir / card_name / "outputs" / out_name).exists():
             _log(f"[plan] skipping #{number:03d} {word} - already complete")
             continue
+        if card_name in in_progress:
+            _log(f"[plan] skipping #{number:03d} {word} - image in progress")
+            continue
 
         # Found an incomplete entry
         entry = q_entry
@@ -1863,8 +2698,8 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
 
     _log(f"[phase plan] template exists: {template_path}")
 
-    card = read_json(template_path)
-    card.setdefault("content", {})
+    card = load_card_template(template_path)
+    content = card.setdefault("content", {})
 
     card_type = str(entry.get("card_type", "NOUN")).upper()
     rarity = str(entry.get("rarity", "COMMON")).upper()
@@ -1888,82 +2723,58 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
 
     if auto:
         _log("[phase plan] auto mode: generating recipe")
-        recipe = _generate_card_recipe(number=number, word=word, card_type=card_type, rarity=rarity, ability=q_ability)
-        grounding = recipe.get("grounding", {}) if isinstance(recipe.get("grounding"), dict) else {}
-        stats = q_stats if q_stats else (recipe.get("stats", {}) if isinstance(recipe.get("stats"), dict) else {})
-        ot_verse = q_ot_verse if q_ot_verse else (recipe.get("ot_verse", {}) if isinstance(recipe.get("ot_verse"), dict) else {})
-        nt_verse = q_nt_verse if q_nt_verse else (recipe.get("nt_verse", {}) if isinstance(recipe.get("nt_verse"), dict) else {})
-        greek = q_greek if q_greek else (recipe.get("greek", {}) if isinstance(recipe.get("greek"), dict) else {})
-        hebrew = q_hebrew if q_hebrew else (recipe.get("hebrew", {}) if isinstance(recipe.get("hebrew"), dict) else {})
-        trivia = q_trivia if q_trivia else recipe.get("trivia", [])
-        if not isinstance(trivia, list):
-            trivia = []
-
-        gloss = str(q_gloss).strip() if q_gloss else str(recipe.get("gloss", "")).strip()
-        art_prompt = str(q_art_prompt).strip() if q_art_prompt else str(recipe.get("art_prompt", "")).strip()
-        ability_text = str(q_ability).strip() if q_ability else str(recipe.get("ability_text", "")).strip()
-
-        ot_ref = str(ot_verse.get("ref", "")).strip()
-        ot_snip = str(ot_verse.get("snippet", "")).strip()
-        nt_ref = str(nt_verse.get("ref", "")).strip()
-        nt_snip = str(nt_verse.get("snippet", "")).strip()
-
-        card["content"]["NUMBER"] = f"{number:03d}"
-        card["content"]["SERIES"] = _get_series_display_name(series_dir)
-        card["content"]["WORD"] = word
-        card["content"]["GLOSS"] = gloss
-        card["content"]["CARD_TYPE"] = card_type
-        card["content"]["RARITY_TEXT"] = rarity
-        card["content"]["RARITY_ICON"] = rarity
-
-        card["content"]["ART_PROMPT"] = art_prompt
-        card["content"]["ABILITY_TEXT"] = ability_text
-
-        card["content"]["STAT_LORE"] = int(stats.get("lore", 3))
-        card["content"]["STAT_CONTEXT"] = int(stats.get("context", 3))
-        card["content"]["STAT_COMPLEXITY"] = int(stats.get("complexity", 3))
-
-        card["content"]["OT_VERSE_REF"] = ot_ref
-        card["content"]["OT_VERSE_SNIPPET"] = ot_snip
-        card["content"]["NT_VERSE_REF"] = nt_ref
-        card["content"]["NT_VERSE_SNIPPET"] = nt_snip
-
-        card["content"]["OT_VERSE_LINE"] = f"{ot_ref} — “{ot_snip}”"
-        card["content"]["NT_VERSE_LINE"] = f"{nt_ref} — “{nt_snip}”"
-
-        card["content"]["GREEK"] = str(greek.get("text", "")).strip()
-        card["content"]["GREEK_TRANSLIT"] = str(greek.get("translit", "")).strip()
-        card["content"]["HEBREW"] = str(hebrew.get("text", "")).strip()
-        card["content"]["HEBREW_TRANSLIT"] = str(hebrew.get("translit", "")).strip()
-
-        card["content"]["OT_REFS"] = str(q_ot_refs).strip() if q_ot_refs else str(recipe.get("ot_refs", "")).strip()
-        card["content"]["NT_REFS"] = str(q_nt_refs).strip() if q_nt_refs else str(recipe.get("nt_refs", "")).strip()
-        card["content"]["TRIVIA_BULLETS"] = [str(x).strip() for x in trivia if str(x).strip()]
-
-        card["grounding"] = grounding
+        recipe = _RECIPE_PREFETCH.pop(_recipe_key(number, word, card_type, rarity, q_ability), None)
+        if recipe is not None:
+            _log(f"[phase plan] using prefetched recipe for #{number:03d} {word}")
+        else:
+            recipe = _generate_card_recipe(number=number, word=word, card_type=card_type, rarity=rarity, ability=q_ability)
+        ctx = _apply_recipe_to_card(
+            card,
+            recipe,
+            number=number,
+            series=_get_series_display_name(series_dir),
+            word=word,
+            card_type=card_type,
+            rarity=rarity,
+            overrides={
+                "gloss": q_gloss,
+                "art_prompt": q_art_prompt,
+                "ability_text": q_ability,
+                "stats": q_stats,
+                "ot_verse": q_ot_verse,
+                "nt_verse": q_nt_verse,
+                "greek": q_greek,
+                "hebrew": q_hebrew,
+                "ot_refs": q_ot_refs,
+                "nt_refs": q_nt_refs,
+                "trivia": q_trivia,
+            },
+            quotes=("“", "”"),
+        )
+        grounding = card["grounding"]
 
         meta = {
             "number": f"{number:03d}",
             "word": word,
-            "gloss": gloss,
+            "gloss": ctx.gloss,
             "card_type": card_type,
             "rarity": rarity,
             "series": series_dir.name,
             "set": _get_series_theme(series_dir),
-            "art_prompt": art_prompt,
+            "art_prompt": ctx.art_prompt,
             "stats": {
-                "lore": card["content"]["STAT_LORE"],
-                "context": card["content"]["STAT_CONTEXT"],
-                "complexity": card["content"]["STAT_COMPLEXITY"],
+                "lore": content["STAT_LORE"],
+                "context": content["STAT_CONTEXT"],
+                "complexity": content["STAT_COMPLEXITY"],
             },
-            "ability": ability_text,
-            "ot_verse": {"ref": ot_ref, "snippet": ot_snip},
-            "nt_verse": {"ref": nt_ref, "snippet": nt_snip},
-            "greek": {"text": card["content"]["GREEK"], "translit": card["content"]["GREEK_TRANSLIT"]},
-            "hebrew": {"text": card["content"]["HEBREW"], "translit": card["content"]["HEBREW_TRANSLIT"]},
-            "ot_refs": card["content"]["OT_REFS"],
-            "nt_refs": card["content"]["NT_REFS"],
-            "trivia": card["content"]["TRIVIA_BULLETS"],
+            "ability": ctx.ability_text,
+            "ot_verse": {"ref": ctx.ot_ref, "snippet": ctx.ot_snip},
+            "nt_verse": {"ref": ctx.nt_ref, "snippet": ctx.nt_snip},
+            "greek": {"text": content["GREEK"], "translit": content["GREEK_TRANSLIT"]},
+            "hebrew": {"text": content["HEBREW"], "translit": content["HEBREW_TRANSLIT"]},
+            "ot_refs": content["OT_REFS"],
+            "nt_refs": content["NT_REFS"],
+            "trivia": content["TRIVIA_BULLETS"],
             "wild_id": None,
             "wild_counts_as": None,
             "quartet_id": None,
@@ -1973,79 +2784,72 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
             "search_queries": grounding.get("queries", []) if isinstance(grounding.get("queries"), list) else [],
         }
 
-        card_dir.mkdir(parents=True, exist_ok=True)
-        with open(card_dir / "meta.yml", "w", encoding="utf-8") as f:
-            yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
-        _log(f"[phase plan] wrote meta.yml")
     else:
         _log("[phase plan] manual mode: using canned demo content")
-        card["content"]["NUMBER"] = f"{number:03d}"
-        card["content"]["SERIES"] = _get_series_display_name(series_dir)
-        card["content"]["WORD"] = word
-        card["content"]["GLOSS"] = "learned visitors from the East"
-        card["content"]["CARD_TYPE"] = card_type
+        meta = None
+        content["NUMBER"] = f"{number:03d}"
+        content["SERIES"] = _get_series_display_name(series_dir)
+        content["WORD"] = word
+        content["GLOSS"] = "learned visitors from the East"
+        content["CARD_TYPE"] = card_type
 
-        card["content"]["RARITY_TEXT"] = rarity
-        card["content"]["RARITY_ICON"] = rarity
+        content["RARITY_TEXT"] = rarity
+        content["RARITY_ICON"] = rarity
 
-        card["content"]["OT_VERSE_LINE"] = "Dan 2:2 — “summoned the magicians, enchanters, sorcerers, Chaldeans …”"
-        card["content"]["NT_VERSE_LINE"] = "Matt 2:1 — “magi from the east came to Jerusalem …”"
+        content["OT_VERSE_LINE"] = "Dan 2:2 — “summoned the magicians, enchanters, sorcerers, Chaldeans …”"
+        content["NT_VERSE_LINE"] = "Matt 2:1 — “magi from the east came to Jerusalem …”"
 
-        card["content"]["OT_VERSE_REF"] = "Daniel 2:2"
-        card["content"]["OT_VERSE_SNIPPET"] = "summoned the magicians, enchanters, sorcerers, Chaldeans"
-        card["content"]["NT_VERSE_REF"] = "Matthew 2:1"
-        card["content"]["NT_VERSE_SNIPPET"] = "magi from the east came to Jerusalem"
+        content["OT_VERSE_REF"] = "Daniel 2:2"
+        content["OT_VERSE_SNIPPET"] = "summoned the magicians, enchanters, sorcerers, Chaldeans"
+        content["NT_VERSE_REF"] = "Matthew 2:1"
+        content["NT_VERSE_SNIPPET"] = "magi from the east came to Jerusalem"
 
-        card["content"]["TRIVIA_BULLETS"] = [
+        content["TRIVIA_BULLETS"] = [
             "Matthew never calls them kings, and never gives a number.",
             "The same Greek root appears in Acts 13:6 in a negative context.",
             "Daniel’s court vocabulary overlaps with ‘wise/magician’ categories.",
             "This label’s moral weight is decided by context, not the word alone.",
         ]
 
-        card["content"]["ART_PROMPT"] = (
+        content["ART_PROMPT"] = (
             "A moonlit caravan of eastern scholars approaching a distant city beneath a brilliant star; "
             "ancient Near Eastern travel; subtle wonder; parchment-friendly tones; no text in art"
         )
 
-        card["content"]["ABILITY_TEXT"] = (
+        content["ABILITY_TEXT"] = (
             "On draw, you may reveal: spend 1 card from your hand to activate that card’s on-reveal ability. "
             "Then this card is spent."
         )
 
-        card["content"]["STAT_LORE"] = 5
-        card["content"]["STAT_CONTEXT"] = 1
-        card["content"]["STAT_COMPLEXITY"] = 3
+        content["STAT_LORE"] = 5
+        content["STAT_CONTEXT"] = 1
+        content["STAT_COMPLEXITY"] = 3
 
-        card["content"]["GREEK"] = "μάγος / μάγοι"
-        card["content"]["GREEK_TRANSLIT"] = "magos / magoi"
-        card["content"]["NT_REFS"] = "Matt 2:1 • Acts 13:6"
-        card["content"]["HEBREW"] = "חרטמים / חכימין"
-        card["content"]["HEBREW_TRANSLIT"] = "ḥarṭummîm / ḥăkîmîn"
-        card["content"]["OT_REFS"] = "Dan 2:2 • Dan 4:7"
-
-    write_json(card_dir / "card.json", card)
-    _log(f"[phase plan] wrote card.json")
+        content["GREEK"] = "μάγος / μάγοι"
+        content["GREEK_TRANSLIT"] = "magos / magoi"
+        content["NT_REFS"] = "Matt 2:1 • Acts 13:6"
+        content["HEBREW"] = "חרטמים / חכימין"
+        content["HEBREW_TRANSLIT"] = "ḥarṭummîm / ḥăkîmîn"
+        content["OT_REFS"] = "Dan 2:2 • Dan 4:7"
 
     prompt_text = build_prompt_text(card)
-    with open(card_dir / "prompt.txt", "w", encoding="utf-8") as f:
-        f.write(prompt_text)
-    _log(f"[phase plan] wrote prompt.txt")
-
-    _seed_revise_file(card_dir)
-    _log(f"[phase plan] wrote revise.txt")
-
     out_png = card_dir / "outputs" / "card_1024x1536.png"
-    render_post(
-        str(card_dir / "post.md"),
-        word=word,
-        gloss=card["content"]["GLOSS"],
-        ot_ref=card["content"].get("OT_VERSE_REF", ""),
-        ot_snip=card["content"].get("OT_VERSE_SNIPPET", ""),
-        nt_ref=card["content"].get("NT_VERSE_REF", ""),
-        nt_snip=card["content"].get("NT_VERSE_SNIPPET", ""),
-        trivia_items=card["content"]["TRIVIA_BULLETS"],
-        image_rel_path=f"./outputs/{out_png.name}",
+    _materialize_card(
+        card_dir,
+        card=card,
+        prompt_text=prompt_text,
+        meta=meta,
+        post=dict(
+            word=word,
+            gloss=content["GLOSS"],
+            ot_ref=content.get("OT_VERSE_REF", ""),
+            ot_snip=content.get("OT_VERSE_SNIPPET", ""),
+            nt_ref=content.get("NT_VERSE_REF", ""),
+            nt_snip=content.get("NT_VERSE_SNIPPET", ""),
+            trivia_items=content["TRIVIA_BULLETS"],
+            image_rel_path=f"./outputs/{out_png.name}",
+        ),
+        log_prefix="[phase plan]",
     )
 
     # Queue entries are kept (not removed) - card number is based on queue position
@@ -2072,7 +2876,7 @@ def phase_plan(*, series_dir: Path, template_path: Path, auto: bool) -> int:
     _log(f"[phase plan] updated stats.yml: {card_type}/{rarity}, total={stats['total']}")
 
     # Add card to series index for tracking
-    ability_text = card["content"].get("ABILITY_TEXT", "")
+    ability_text = content.get("ABILITY_TEXT", "")
     _add_card_to_index(
         series_dir,
         number=number,
@@ -2126,13 +2930,6 @@ def _plan_demo_card_with_number(
         _log(f"[demo plan] recipe generation failed for #{number:03d} {word}: {e}")
         return None
 
-    grounding = recipe.get("grounding", {}) if isinstance(recipe.get("grounding"), dict) else {}
-    stats = recipe.get("stats", {}) if isinstance(recipe.get("stats"), dict) else {}
-    ot_verse = recipe.get("ot_verse", {}) if isinstance(recipe.get("ot_verse"), dict) else {}
-    nt_verse = recipe.get("nt_verse", {}) if isinstance(recipe.get("nt_verse"), dict) else {}
-    greek = recipe.get("greek", {}) if isinstance(recipe.get("greek"), dict) else {}
-    hebrew = recipe.get("hebrew", {}) if isinstance(recipe.get("hebrew"), dict) else {}
-
     trivia = recipe.get("trivia", [])
     if not isinstance(trivia, list):
         trivia = []
@@ -2141,56 +2938,20 @@ def _plan_demo_card_with_number(
     except Exception:
         trivia_items = ["Trivia item 1", "Trivia item 2", "Trivia item 3"]
 
-    gloss = str(recipe.get("gloss", "")).strip()
-    art_prompt = str(recipe.get("art_prompt", "")).strip()
-    ability_text = str(recipe.get("ability_text", "")).strip()
-
-    ot_ref = str(ot_verse.get("ref", "")).strip()
-    ot_snip = str(ot_verse.get("snippet", "")).strip()
-    nt_ref = str(nt_verse.get("ref", "")).strip()
-    nt_snip = str(nt_verse.get("snippet", "")).strip()
-
-    card = read_json(template_path)
-    card.setdefault("content", {})
-
-    card["content"]["NUMBER"] = f"{number:03d}"
-    card["content"]["SERIES"] = series_display if series_display else _get_series_display_name(series_dir)
-    card["content"]["WORD"] = word
-    card["content"]["GLOSS"] = gloss
-    card["content"]["CARD_TYPE"] = card_type
-    card["content"]["RARITY_TEXT"] = rarity
-    card["content"]["RARITY_ICON"] = rarity
-    card["content"]["ART_PROMPT"] = art_prompt
-    card["content"]["ABILITY_TEXT"] = ability_text
-
-    card["content"]["STAT_LORE"] = int(stats.get("lore", 3))
-    card["content"]["STAT_CONTEXT"] = int(stats.get("context", 3))
-    card["content"]["STAT_COMPLEXITY"] = int(stats.get("complexity", 3))
-
-    card["content"]["OT_VERSE_REF"] = ot_ref
-    card["content"]["OT_VERSE_SNIPPET"] = ot_snip
-    card["content"]["NT_VERSE_REF"] = nt_ref
-    card["content"]["NT_VERSE_SNIPPET"] = nt_snip
-    card["content"]["OT_VERSE_LINE"] = f'{ot_ref} — "{ot_snip}"'
-    card["content"]["NT_VERSE_LINE"] = f'{nt_ref} — "{nt_snip}"'
-
-    card["content"]["GREEK"] = str(greek.get("text", "")).strip()
-    card["content"]["GREEK_TRANSLIT"] = str(greek.get("translit", "")).strip()
-    card["content"]["HEBREW"] = str(hebrew.get("text", "")).strip()
-    card["content"]["HEBREW_TRANSLIT"] = str(hebrew.get("translit", "")).strip()
-    card["content"]["OT_REFS"] = str(recipe.get("ot_refs", "")).strip()
-    card["content"]["NT_REFS"] = str(recipe.get("nt_refs", "")).strip()
-    card["content"]["TRIVIA_BULLETS"] = trivia_items
-
-    card["grounding"] = grounding
-
-    write_json(card_dir / "card.json", card)
+    card = load_card_template(template_path)
+    ctx = _apply_recipe_to_card(
+        card,
+        recipe,
+        number=number,
+        series=series_display if series_display else _get_series_display_name(series_dir),
+        word=word,
+        card_type=card_type,
+        rarity=rarity,
+        trivia=trivia_items,
+    )
+    content = card["content"]
 
     prompt_text = build_prompt_text(card)
-    with open(card_dir / "prompt.txt", "w", encoding="utf-8") as f:
-        f.write(prompt_text)
-
-    _seed_revise_file(card_dir)
 
     # Use provided set_name (defaults to "Demo")
     demo_series = series_dir.name if series_dir else "2026-Q1"
@@ -2199,33 +2960,36 @@ def _plan_demo_card_with_number(
     meta = {
         "number": f"{number:03d}",
         "word": word,
-        "gloss": gloss,
+        "gloss": ctx.gloss,
         "card_type": card_type,
         "rarity": rarity,
         "series": demo_series,
         "set": demo_set,
-        "art_prompt": art_prompt,
+        "art_prompt": ctx.art_prompt,
         "stats": {
-            "lore": card["content"]["STAT_LORE"],
-            "context": card["content"]["STAT_CONTEXT"],
-            "complexity": card["content"]["STAT_COMPLEXITY"],
+            "lore": content["STAT_LORE"],
+            "context": content["STAT_CONTEXT"],
+            "complexity": content["STAT_COMPLEXITY"],
         },
-        "ability": ability_text,
+        "ability": ctx.ability_text,
     }
-    with open(card_dir / "meta.yml", "w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
-
     out_png = card_dir / "outputs" / "card_1024x1536.png"
-    render_post(
-        str(card_dir / "post.md"),
-        word=word,
-        gloss=gloss,
-        ot_ref=ot_ref,
-        ot_snip=ot_snip,
-        nt_ref=nt_ref,
-        nt_snip=nt_snip,
-        trivia_items=trivia_items,
-        image_rel_path=f"./outputs/{out_png.name}",
+    _materialize_card(
+        card_dir,
+        card=card,
+        prompt_text=prompt_text,
+        meta=meta,
+        post=dict(
+            word=word,
+            gloss=ctx.gloss,
+            ot_ref=ctx.ot_ref,
+            ot_snip=ctx.ot_snip,
+            nt_ref=ctx.nt_ref,
+            nt_snip=ctx.nt_snip,
+            trivia_items=trivia_items,
+            image_rel_path=f"./outputs/{out_png.name}",
+        ),
+        log_prefix="[demo plan]",
     )
 
     _log(f"[demo plan] completed: #{number:03d} {word}")
@@ -2268,71 +3032,26 @@ def _plan_demo_card(
 
     _log("[demo plan] generating recipe")
     recipe = _generate_card_recipe(number=number, word=word, card_type=card_type, rarity=rarity)
-    grounding = recipe.get("grounding", {}) if isinstance(recipe.get("grounding"), dict) else {}
-    stats = recipe.get("stats", {}) if isinstance(recipe.get("stats"), dict) else {}
-    ot_verse = recipe.get("ot_verse", {}) if isinstance(recipe.get("ot_verse"), dict) else {}
-    nt_verse = recipe.get("nt_verse", {}) if isinstance(recipe.get("nt_verse"), dict) else {}
-    greek = recipe.get("greek", {}) if isinstance(recipe.get("greek"), dict) else {}
-    hebrew = recipe.get("hebrew", {}) if isinstance(recipe.get("hebrew"), dict) else {}
-
     trivia = recipe.get("trivia", [])
     if not isinstance(trivia, list):
         trivia = []
     trivia_items = _normalize_trivia([str(x) for x in trivia])
 
-    gloss = str(recipe.get("gloss", "")).strip()
-    art_prompt = str(recipe.get("art_prompt", "")).strip()
-    ability_text = str(recipe.get("ability_text", "")).strip()
-
-    ot_ref = str(ot_verse.get("ref", "")).strip()
-    ot_snip = str(ot_verse.get("snippet", "")).strip()
-    nt_ref = str(nt_verse.get("ref", "")).strip()
-    nt_snip = str(nt_verse.get("snippet", "")).strip()
-
-    card = read_json(template_path)
-    card.setdefault("content", {})
-
-    card["content"]["NUMBER"] = f"{number:03d}"
-    card["content"]["SERIES"] = series_display if series_display else _get_series_display_name(series_dir)
-    card["content"]["WORD"] = word
-    card["content"]["GLOSS"] = gloss
-    card["content"]["CARD_TYPE"] = card_type
-    card["content"]["RARITY_TEXT"] = rarity
-    card["content"]["RARITY_ICON"] = rarity
-    card["content"]["ART_PROMPT"] = art_prompt
-    card["content"]["ABILITY_TEXT"] = ability_text
-
-    card["content"]["STAT_LORE"] = int(stats.get("lore", 3))
-    card["content"]["STAT_CONTEXT"] = int(stats.get("context", 3))
-    card["content"]["STAT_COMPLEXITY"] = int(stats.get("complexity", 3))
-
-    card["content"]["OT_VERSE_REF"] = ot_ref
-    card["content"]["OT_VERSE_SNIPPET"] = ot_snip
-    card["content"]["NT_VERSE_REF"] = nt_ref
-    card["content"]["NT_VERSE_SNIPPET"] = nt_snip
-    card["content"]["OT_VERSE_LINE"] = f'{ot_ref} — "{ot_snip}"'
-    card["content"]["NT_VERSE_LINE"] = f'{nt_ref} — "{nt_snip}"'
-
-    card["content"]["GREEK"] = str(greek.get("text", "")).strip()
-    card["content"]["GREEK_TRANSLIT"] = str(greek.get("translit", "")).strip()
-    card["content"]["HEBREW"] = str(hebrew.get("text", "")).strip()
-    card["content"]["HEBREW_TRANSLIT"] = str(hebrew.get("translit", "")).strip()
-    card["content"]["OT_REFS"] = str(recipe.get("ot_refs", "")).strip()
-    card["content"]["NT_REFS"] = str(recipe.get("nt_refs", "")).strip()
-    card["content"]["TRIVIA_BULLETS"] = trivia_items
-
-    card["grounding"] = grounding
-
-    write_json(card_dir / "card.json", card)
-    _log(f"[demo plan] wrote card.json")
+    card = load_card_template(template_path)
+    ctx = _apply_recipe_to_card(
+        card,
+        recipe,
+        number=number,
+        series=series_display if series_display else _get_series_display_name(series_dir),
+        word=word,
+        card_type=card_type,
+        rarity=rarity,
+        trivia=trivia_items,
+    )
+    content = card["content"]
+    grounding = card["grounding"]
 
     prompt_text = build_prompt_text(card)
-    with open(card_dir / "prompt.txt", "w", encoding="utf-8") as f:
-        f.write(prompt_text)
-    _log(f"[demo plan] wrote prompt.txt")
-
-    _seed_revise_file(card_dir)
-    _log(f"[demo plan] wrote revise.txt")
 
     # For demo cards, use "Demo" as the set name
     # Use style series for the series identifier, or fall back to current year-quarter
@@ -2342,24 +3061,24 @@ def _plan_demo_card(
     meta = {
         "number": f"{number:03d}",
         "word": word,
-        "gloss": gloss,
+        "gloss": ctx.gloss,
         "card_type": card_type,
         "rarity": rarity,
         "series": demo_series,
         "set": demo_set,
-        "art_prompt": art_prompt,
+        "art_prompt": ctx.art_prompt,
         "stats": {
-            "lore": card["content"]["STAT_LORE"],
-            "context": card["content"]["STAT_CONTEXT"],
-            "complexity": card["content"]["STAT_COMPLEXITY"],
+            "lore": content["STAT_LORE"],
+            "context": content["STAT_CONTEXT"],
+            "complexity": content["STAT_COMPLEXITY"],
         },
-        "ability": ability_text,
-        "ot_verse": {"ref": ot_ref, "snippet": ot_snip},
-        "nt_verse": {"ref": nt_ref, "snippet": nt_snip},
-        "greek": {"text": card["content"]["GREEK"], "translit": card["content"]["GREEK_TRANSLIT"]},
-        "hebrew": {"text": card["content"]["HEBREW"], "translit": card["content"]["HEBREW_TRANSLIT"]},
-        "ot_refs": card["content"]["OT_REFS"],
-        "nt_refs": card["content"]["NT_REFS"],
+        "ability": ctx.ability_text,
+        "ot_verse": {"ref": ctx.ot_ref, "snippet": ctx.ot_snip},
+        "nt_verse": {"ref": ctx.nt_ref, "snippet": ctx.nt_snip},
+        "greek": {"text": content["GREEK"], "translit": content["GREEK_TRANSLIT"]},
+        "hebrew": {"text": content["HEBREW"], "translit": content["HEBREW_TRANSLIT"]},
+        "ot_refs": content["OT_REFS"],
+        "nt_refs": content["NT_REFS"],
         "trivia": trivia_items,
         "wild_id": None,
         "wild_counts_as": None,
@@ -2369,22 +3088,23 @@ def _plan_demo_card(
         "sources": grounding.get("sources", []) if isinstance(grounding.get("sources"), list) else [],
         "search_queries": grounding.get("queries", []) if isinstance(grounding.get("queries"), list) else [],
     }
-    with open(card_dir / "meta.yml", "w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
-    _log(f"[demo plan] wrote meta.yml")
-
-    # Write post.md
     out_png = card_dir / "outputs" / "card_1024x1536.png"
-    render_post(
-        str(card_dir / "post.md"),
-        word=word,
-        gloss=gloss,
-        ot_ref=ot_ref,
-        ot_snip=ot_snip,
-        nt_ref=nt_ref,
-        nt_snip=nt_snip,
-        trivia_items=trivia_items,
-        image_rel_path=f"./outputs/{out_png.name}",
+    _materialize_card(
+        card_dir,
+        card=card,
+        prompt_text=prompt_text,
+        meta=meta,
+        post=dict(
+            word=word,
+            gloss=ctx.gloss,
+            ot_ref=ctx.ot_ref,
+            ot_snip=ctx.ot_snip,
+            nt_ref=ctx.nt_ref,
+            nt_snip=ctx.nt_snip,
+            trivia_items=trivia_items,
+            image_rel_path=f"./outputs/{out_png.name}",
+        ),
+        log_prefix="[demo plan]",
     )
 
     return card_dir
@@ -2595,7 +3315,7 @@ def phase_demo_batch(
         ability_text = ""
         if meta_file.exists() and yaml:
             with open(meta_file, "r", encoding="utf-8") as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=_SafeLoader) or {}
             ability_text = meta.get("ability", "")
 
         with results_lock:
@@ -2633,7 +3353,7 @@ def phase_demo_batch(
                 # Read score from meta.yml
                 if meta_file.exists() and yaml:
                     with open(meta_file, "r", encoding="utf-8") as f:
-                        meta = yaml.safe_load(f) or {}
+                        meta = yaml.load(f, Loader=_SafeLoader) or {}
                     score = meta.get("review_score", 0)
                 _log(f"[pipeline] #{number:03d} review complete: score={score}")
             except Exception as e:
@@ -2690,12 +3410,7 @@ def phase_demo_batch(
     graded_failed = 0
     failed_card_names = []
 
-    for card_dir in sorted(demo_dir.iterdir()):
-        if not card_dir.is_dir():
-            continue
-        if not card_dir.name[0].isdigit():
-            continue
-
+    for card_dir in _list_card_dirs(demo_dir):
         grade_path = card_dir / "grade.json"
         if grade_path.exists():
             grade = read_json(grade_path)
@@ -2925,20 +3640,56 @@ def phase_example_cards(
     return 0 if len(failed) == 0 else 1
 
 
-def phase_imagegen(*, series_dir: Path) -> int:
+def phase_imagegen(*, series_dir: Path, parallel: int = 1) -> int:
+    """Render the newest card missing its image.
+
+    With parallel > 1, every card missing its image is rendered, up to
+    `parallel` at a time.
+    """
     cards_dir = series_dir / "cards"
     out_name = "card_1024x1536.png"
 
     _log(f"[phase imagegen] cards_dir={cards_dir}")
-    target_dir = find_next_image_target(cards_dir, out_name)
-    if target_dir is None:
+    # Scan every card so the progress mark can be saved once rendering is done;
+    # the mark never passes a card still missing its image
+    targets, mark = _scan_image_targets(cards_dir, out_name)
+    if not targets:
         latest = find_latest_card_dir(cards_dir)
         if latest is None:
             print("No cards found.")
             return 1
+        _save_image_mark(cards_dir, mark)
         print("No missing images found.")
         return 0
 
+    if parallel <= 1:
+        _render_image_target(series_dir, targets[0], out_name)
+        _save_image_mark(cards_dir, mark)
+        return 0
+
+    _log(f"[phase imagegen] rendering {len(targets)} missing images with {parallel} workers")
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        futures = {
+            executor.submit(_render_image_target, series_dir, target_dir, out_name): target_dir
+            for target_dir in targets
+        }
+        for future in as_completed(futures):
+            target_dir = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                _log(f"[phase imagegen] {target_dir.name} failed: {e}")
+                failed.append(target_dir.name)
+
+    if failed:
+        print(f"Failed to render {len(failed)} image(s): {', '.join(sorted(failed))}")
+        return 1
+    _save_image_mark(cards_dir, mark)
+    return 0
+
+
+def _render_image_target(series_dir: Path, target_dir: Path, out_name: str) -> None:
     prompt_file = target_dir / "prompt.txt"
     out_png = target_dir / "outputs" / out_name
 
@@ -2948,7 +3699,7 @@ def phase_imagegen(*, series_dir: Path) -> int:
     meta_file = target_dir / "meta.yml"
     if meta_file.exists() and yaml:
         with open(meta_file, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         target_rarity = meta.get("rarity", "").upper() or None
         target_type = (meta.get("card_type") or meta.get("type", "")).upper() or None
 
@@ -2960,21 +3711,7 @@ def phase_imagegen(*, series_dir: Path) -> int:
         target_type=target_type,
         fix_mode=False,
     )
-    if style_refs:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(prompt_file),
-            *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, fix_mode),
-            "--out", str(out_png)
-        ]
-    else:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.image",
-            str(prompt_file),
-            str(out_png)
-        ]
-        
-    subprocess.check_call(cmd)
+    _run_imagegen(prompt_file, out_png, style_refs, rarity_labels, target_rarity, fix_mode)
 
     # Write generation log with style reference info
     _write_generation_log(
@@ -2995,7 +3732,6 @@ def phase_imagegen(*, series_dir: Path) -> int:
     _run_watermark(card_dir=target_dir, image_path=out_png)
 
     print(f"Rendered image at {out_png}")
-    return 0
 
 
 def _generate_image_for_card_dir(
@@ -3024,7 +3760,7 @@ def _generate_image_for_card_dir(
     meta = {}
     if meta_file.exists() and yaml:
         with open(meta_file, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         target_rarity = meta.get("rarity", "").upper() or None
         target_type = (meta.get("card_type") or meta.get("type", "")).upper() or None
         stored_style_series = meta.get("style_series_dir")
@@ -3037,8 +3773,7 @@ def _generate_image_for_card_dir(
         # Store for future rebuilds (e.g., review phase)
         if yaml and str(style_series_dir) != stored_style_series:
             meta["style_series_dir"] = str(style_series_dir)
-            with open(meta_file, "w", encoding="utf-8") as f:
-                yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
+            _write_meta(meta_file, meta)
     elif stored_style_series:
         series_dir = Path(stored_style_series)
     else:
@@ -3056,21 +3791,13 @@ def _generate_image_for_card_dir(
             fix_mode=False,
             templates_only=templates_only,
         )
-    if style_refs:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(prompt_file),
-            *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, fix_mode),
-            "--out", str(out_png)
-        ]
-    else:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.image",
-            str(prompt_file),
-            str(out_png)
-        ]
-
-    subprocess.check_call(cmd)
+    # Generation and polish run back to back (polish failure is only a warning)
+    if skip_polish:
+        _log(f"[batch] skipping polish step")
+    _run_imagegen(
+        prompt_file, out_png, style_refs, rarity_labels, target_rarity, fix_mode,
+        polish=not skip_polish,
+    )
 
     # Write generation log with style reference info
     _write_generation_log(
@@ -3084,19 +3811,6 @@ def _generate_image_for_card_dir(
         phase="batch",
     )
 
-    # Run polish step (optional)
-    if not skip_polish:
-        polish_cmd = [
-            sys.executable, "-m", "hypertext.cards.polish",
-            str(out_png)
-        ]
-        try:
-            subprocess.check_call(polish_cmd)
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Polish step failed: {e}")
-    else:
-        _log(f"[batch] skipping polish step")
-
     # Run watermark step (optional)
     if not skip_watermark:
         _run_watermark(card_dir=card_dir, image_path=out_png)
@@ -3119,29 +3833,6 @@ def phase_batch(
 ) -> int:
     cards_dir = series_dir / "cards"
     planned_cards: list[Path] = []
-
-    # Phase 1: Plan all cards sequentially (need unique card numbers)
-    _log(f"[batch] planning {batch} cards...")
-    for i in range(batch):
-        _log(f"[batch] planning card {i + 1}/{batch}")
-        before = find_latest_card_dir(cards_dir)
-        rc = phase_plan(series_dir=series_dir, template_path=template_path, auto=auto)
-        if rc != 0:
-            _log(f"[batch] planning failed at card {i + 1}")
-            break
-        after = find_latest_card_dir(cards_dir)
-        if after is None or after == before:
-            _log("[batch] no new card planned; stopping")
-            break
-        planned_cards.append(after)
-
-    if not planned_cards:
-        _log("[batch] no cards were planned")
-        return 0
-
-    _log(f"[batch] planned {len(planned_cards)} cards, generating images with {parallel} parallel workers...")
-
-    # Phase 2: Generate images in parallel
     failed_cards: list[Path] = []
     completed_count = 0
 
@@ -3153,24 +3844,49 @@ def phase_batch(
         )
         return card_dir, rc
 
-    if parallel <= 1:
-        # Sequential execution
-        for card_dir in planned_cards:
-            card_dir, rc = generate_one(card_dir)
+    # Cards are planned sequentially (need unique card numbers), but each one is
+    # handed to the image workers as soon as it is planned so Gemini image
+    # latency overlaps with planning the next card.
+    _log(f"[batch] planning {batch} cards, generating images with {parallel} parallel workers...")
+    watcher = _CardDirWatcher(cards_dir)
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        futures = {}
+        for i in range(batch):
+            _log(f"[batch] planning card {i + 1}/{batch}")
+            if auto and not _RECIPE_PREFETCH:
+                _prefetch_queue_recipes(
+                    series_dir,
+                    count=min(batch - i, PLAN_BATCH_SIZE),
+                    in_progress={cd.name for cd in planned_cards},
+                )
+            before = watcher.latest()
+            rc = phase_plan(
+                series_dir=series_dir,
+                template_path=template_path,
+                auto=auto,
+                in_progress={cd.name for cd in planned_cards},
+            )
+            if rc != 0:
+                _log(f"[batch] planning failed at card {i + 1}")
+                break
+            watcher.refresh()
+            after = watcher.latest()
+            if after is None or after == before:
+                _log("[batch] no new card planned; stopping")
+                break
+            planned_cards.append(after)
+            futures[executor.submit(generate_one, after)] = after
+
+        if not planned_cards:
+            _log("[batch] no cards were planned")
+            return 0
+
+        for future in as_completed(futures):
+            card_dir, rc = future.result()
             completed_count += 1
             if rc != 0:
                 failed_cards.append(card_dir)
-            _log(f"[batch] completed {completed_count}/{len(planned_cards)}")
-    else:
-        # Parallel execution
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            futures = {executor.submit(generate_one, cd): cd for cd in planned_cards}
-            for future in as_completed(futures):
-                card_dir, rc = future.result()
-                completed_count += 1
-                if rc != 0:
-                    failed_cards.append(card_dir)
-                _log(f"[batch] completed {completed_count}/{len(planned_cards)} ({card_dir.name})")
+            _log(f"[batch] completed {completed_count}/{len(planned_cards)} ({card_dir.name})")
 
     if failed_cards:
         _log(f"[batch] {len(failed_cards)} cards failed image generation:")
@@ -3204,8 +3920,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
         # Read existing prompt and append revision
         existing_prompt = _read_text(prompt_path) if prompt_path.exists() else ""
         revised_prompt = existing_prompt + f"\n\nREVISION INSTRUCTIONS:\n{inline_revision}"
-        with open(prompt_path, "w", encoding="utf-8") as f:
-            f.write(revised_prompt)
+        prompt_path.write_text(revised_prompt, encoding="utf-8")
         _log(f"[phase revise] Updated prompt with revision instructions")
 
         target_rarity = card.get("content", {}).get("RARITY_TEXT", "").upper() or None
@@ -3241,21 +3956,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
                     _log(f"[phase revise] Added {len(new_extras)} extra style refs")
 
         use_fix_mode = out_png.exists()
-        if style_refs:
-            cmd = [
-                sys.executable, "-m", "hypertext.gemini.style",
-                "--prompt-file", str(prompt_path),
-                *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, use_fix_mode),
-                "--out", str(out_png)
-            ]
-        else:
-            cmd = [
-                sys.executable, "-m", "hypertext.gemini.image",
-                str(prompt_path),
-                str(out_png)
-            ]
-
-        subprocess.check_call(cmd)
+        _run_imagegen(prompt_path, out_png, style_refs, rarity_labels, target_rarity, use_fix_mode, use_cache=False)
 
         # Write generation log with style reference info
         _write_generation_log(
@@ -3283,8 +3984,8 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
         class InlineFormResult:
             instructions: str
             rebuild: bool = False
-            allowed_paths: list = None
-        form_result = InlineFormResult(instructions=f"General_Revision_Request:\n{inline_revision}", allowed_paths=[])
+            allowed_paths: frozenset = frozenset()
+        form_result = InlineFormResult(instructions=f"General_Revision_Request:\n{inline_revision}")
     else:
         revise_path = revise_file if revise_file is not None else (card_dir / "revise.txt")
         if not revise_path.exists():
@@ -3331,21 +4032,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
                 if new_extras:
                     style_refs = new_extras + style_refs
                     _log(f"[phase revise] Added {len(new_extras)} extra style refs (highest priority)")
-        if style_refs:
-            cmd = [
-                sys.executable, "-m", "hypertext.gemini.style",
-                "--prompt-file", str(card_dir / "prompt.txt"),
-                *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, False),
-                "--out", str(out_png)
-            ]
-        else:
-            cmd = [
-                sys.executable, "-m", "hypertext.gemini.image",
-                str(card_dir / "prompt.txt"),
-                str(out_png)
-            ]
-
-        subprocess.check_call(cmd)
+        _run_imagegen(card_dir / "prompt.txt", out_png, style_refs, rarity_labels, target_rarity, False, use_cache=False)
 
         # Write generation log with style reference info
         _write_generation_log(
@@ -3367,7 +4054,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
         meta_path = card_dir / "meta.yml"
         if meta_path.exists():
             with open(meta_path, "r", encoding="utf-8") as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=_SafeLoader) or {}
             if not isinstance(meta, dict):
                 meta = {}
             prev = meta.get("revision")
@@ -3377,8 +4064,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
                 prev_i = 0
             meta["revision"] = prev_i + 1
             meta["revision_notes"] = "Rebuild (image regenerated from scratch)"
-            with open(meta_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
+            _write_meta(meta_path, meta)
 
         # Write changes file for PR comment
         changes_path = card_dir / ".revision_changes.txt"
@@ -3399,29 +4085,21 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
         return 1
 
     instructions = form_result.instructions
-    allowed_paths = form_result.allowed_paths
-
-    rules_appendix = _load_rules_appendix()
-    prompt = (
-        "You are revising a Bible word-study trading card JSON. "
-        "Return ONLY a JSON Patch array (RFC 6902) to apply to the provided CARD_JSON.\n"
-        "The patch must only modify keys under: /content or /model_prompt. "
-        "Do NOT modify /render_instructions, /style_guide, or /layout.\n"
-        "Follow game rules: there is ONE shared deck; do not say 'your deck'. "
-        "Allowed ops: add, replace. Do not use remove/move/copy/test.\n\n"
-        "IMPORTANT: Only make changes that are EXPLICITLY requested in the HUMAN_EDIT_INSTRUCTIONS below. "
-        "Do NOT make any other changes, improvements, or reformatting beyond what was asked.\n\n"
-        "GAME RULES (must follow):\n"
-        + rules_appendix
-        + "\n\n"
-        + FORMATTING_RUBRIC
-        + "\n\n"
-        "HUMAN_EDIT_INSTRUCTIONS (ONLY make these specific changes):\n"
-        + instructions
-        + "\n\n"
-        "CARD_JSON:\n"
-        + json.dumps(card, ensure_ascii=False, indent=2)
-    )
+    allowed_paths = frozenset(form_result.allowed_paths or ())
+
+    prompt = "".join([
+        _REVISE_PROMPT_HEAD,
+        _load_rules_appendix(),
+        "\n\n",
+        FORMATTING_RUBRIC,
+        "\n\n",
+        "HUMAN_EDIT_INSTRUCTIONS (ONLY make these specific changes):\n",
+        instructions,
+        "\n\n",
+        "CARD_JSON:\n",
+        # Compact separators: the model doesn't need indentation, and it halves the payload
+        _json_dumps(card),
+    ])
 
     _log("[phase revise] requesting JSON Patch from Gemini")
     text = generate_text(prompt, model="gemini-3-pro-preview", temperature=0.2, use_google_search=False)
@@ -3432,20 +4110,27 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
     for op in patch_ops:
         if not isinstance(op, dict):
             raise RuntimeError("Patch operations must be objects")
-        if op.get("op") not in ("replace", "add"):
-            raise RuntimeError(f"Unsupported patch op for revise: {op.get('op')}")
-        if op.get("path") not in allowed_paths:
-            raise RuntimeError(f"Patch attempted to modify unsupported path: {op.get('path')}")
-
-    updated = _apply_json_patch(card, patch_ops)
-
-    write_json(card_path, updated)
-    _log(f"[phase revise] wrote card.json")
-
-    prompt_text = build_prompt_text(updated)
-    with open(card_dir / "prompt.txt", "w", encoding="utf-8") as f:
-        f.write(prompt_text)
-    _log(f"[phase revise] wrote prompt.txt")
+        op_name = op.get("op")
+        path = op.get("path")
+        if op_name not in _REVISE_PATCH_OPS:
+            raise RuntimeError(f"Unsupported patch op for revise: {op_name}")
+        if not isinstance(path, str) or path not in allowed_paths:
+            raise RuntimeError(f"Patch attempted to modify unsupported path: {path}")
+
+    # The patch is applied in place; keep card as the original to compare with
+    updated = _apply_json_patch(copy.deepcopy(card), patch_ops)
+
+    if updated == card:
+        # Patch was a no-op for the card data (e.g. image-only instructions);
+        # prompt.txt is still brought up to date if it has drifted from the card
+        if _write_text_if_changed(card_dir / "prompt.txt", build_prompt_text(card)):
+            _log(f"[phase revise] card unchanged, keeping card.json, rewrote stale prompt.txt")
+        else:
+            _log(f"[phase revise] card unchanged, keeping card.json, prompt.txt")
+    else:
+        prompt_text = build_prompt_text(updated)
+        _write_card_bundle(card_dir, card=updated, prompt_text=prompt_text)
+        _log(f"[phase revise] wrote card.json, prompt.txt")
 
     out_png = card_dir / "outputs" / "card_1024x1536.png"
 
@@ -3465,7 +4150,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
     meta_path = card_dir / "meta.yml"
     if meta_path.exists() and yaml:
         with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         stored_style_series = meta.get("style_series_dir")
 
     # Use stored style_series_dir if available, otherwise infer from card path
@@ -3514,21 +4199,52 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
                 else:
                     style_refs = new_extras + style_refs
                 _log(f"[phase revise] Added {len(new_extras)} extra style refs")
-    if style_refs:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(card_dir / "prompt.txt"),
-            *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, use_fix_mode),
-            "--out", str(out_png)
-        ]
-    else:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.image",
-            str(card_dir / "prompt.txt"),
-            str(out_png)
-        ]
 
-    subprocess.check_call(cmd)
+    # Image generation is network-bound; render post.md and the PR change
+    # summary while it runs, but only write them once the image exists.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        image_future = executor.submit(
+            _run_imagegen,
+            card_dir / "prompt.txt", out_png, style_refs, rarity_labels, target_rarity, use_fix_mode,
+            use_cache=False,
+        )
+
+        post_text = render_post_text(**_post_fields(updated, out_png.name))
+
+        # Build changes summary for PR comment
+        changes_lines: list[str] = []
+        if form_result.rebuild:
+            changes_lines.append("**Mode:** Rebuild (fresh image generation)")
+        else:
+            changes_lines.append("**Mode:** Revise (incremental fix)")
+
+        if form_result.card_changes:
+            changes_lines.append("")
+            changes_lines.append("**Field changes:**")
+            for field, (old_val, new_val) in form_result.card_changes.items():
+                # Truncate long values for readability
+                old_display = old_val[:50] + "..." if len(old_val) > 50 else old_val
+                new_display = new_val[:50] + "..." if len(new_val) > 50 else new_val
+                changes_lines.append(f"- `{field}`: {old_display} → {new_display}")
+
+        if instructions:
+            changes_lines.append("")
+            changes_lines.append("**Instructions:**")
+            # Add first few lines of instructions
+            instr_lines = instructions.split("\n")[:5]
+            for line in instr_lines:
+                if line.strip():
+                    changes_lines.append(f"> {line}")
+            if len(instructions.split("\n")) > 5:
+                changes_lines.append("> ...")
+
+        image_future.result()
+
+    _write_text_if_changed(card_dir / "post.md", post_text)
+
+    # Write changes to file for workflow to read
+    changes_path = card_dir / ".revision_changes.txt"
+    changes_path.write_text("\n".join(changes_lines), encoding="utf-8")
 
     # Write generation log with style reference info
     _write_generation_log(
@@ -3546,54 +4262,10 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
 
     _run_watermark(card_dir=card_dir, image_path=out_png)
 
-    content = updated.get("content", {}) if isinstance(updated.get("content"), dict) else {}
-    render_post(
-        str(card_dir / "post.md"),
-        word=str(content.get("WORD", "")),
-        gloss=str(content.get("GLOSS", "")),
-        ot_ref=str(content.get("OT_VERSE_REF", "")),
-        ot_snip=str(content.get("OT_VERSE_SNIPPET", "")),
-        nt_ref=str(content.get("NT_VERSE_REF", "")),
-        nt_snip=str(content.get("NT_VERSE_SNIPPET", "")),
-        trivia_items=content.get("TRIVIA_BULLETS", []) if isinstance(content.get("TRIVIA_BULLETS"), list) else [],
-        image_rel_path=f"./outputs/{out_png.name}",
-    )
-
-    # Build changes summary for PR comment
-    changes_lines: list[str] = []
-    if form_result.rebuild:
-        changes_lines.append("**Mode:** Rebuild (fresh image generation)")
-    else:
-        changes_lines.append("**Mode:** Revise (incremental fix)")
-
-    if form_result.card_changes:
-        changes_lines.append("")
-        changes_lines.append("**Field changes:**")
-        for field, (old_val, new_val) in form_result.card_changes.items():
-            # Truncate long values for readability
-            old_display = old_val[:50] + "..." if len(old_val) > 50 else old_val
-            new_display = new_val[:50] + "..." if len(new_val) > 50 else new_val
-            changes_lines.append(f"- `{field}`: {old_display} → {new_display}")
-
-    if instructions:
-        changes_lines.append("")
-        changes_lines.append("**Instructions:**")
-        # Add first few lines of instructions
-        instr_lines = instructions.split("\n")[:5]
-        for line in instr_lines:
-            if line.strip():
-                changes_lines.append(f"> {line}")
-        if len(instructions.split("\n")) > 5:
-            changes_lines.append("> ...")
-
-    # Write changes to file for workflow to read
-    changes_path = card_dir / ".revision_changes.txt"
-    changes_path.write_text("\n".join(changes_lines), encoding="utf-8")
-
     meta_path = card_dir / "meta.yml"
     if meta_path.exists():
         with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         if not isinstance(meta, dict):
             meta = {}
         prev = meta.get("revision")
@@ -3605,8 +4277,7 @@ def phase_revise(*, card_dir: Path, revise_file: Path | None, override_style_ref
         meta["revision_notes"] = instructions
         if form_result.rebuild:
             meta["last_rebuild"] = True
-        with open(meta_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
+        _write_meta(meta_path, meta)
 
     # Update revise.txt with new card data for next revision
     _seed_revise_file(card_dir, force=True)
@@ -3632,10 +4303,11 @@ def phase_rebuild(*, card_dir: Path, regen_prompt: bool) -> int:
 
     if regen_prompt or not prompt_txt.exists():
         prompt_text = build_prompt_text(card)
-        with open(prompt_txt, "w", encoding="utf-8") as f:
-            f.write(prompt_text)
+        if _write_text_if_changed(prompt_txt, prompt_text):
+            _log(f"[phase rebuild] wrote prompt.txt")
+        else:
+            _log(f"[phase rebuild] prompt.txt unchanged")
         prompt_path = prompt_txt
-        _log(f"[phase rebuild] wrote prompt.txt")
 
     out_png = card_dir / "outputs" / "card_1024x1536.png"
 
@@ -3650,7 +4322,7 @@ def phase_rebuild(*, card_dir: Path, regen_prompt: bool) -> int:
     meta_path = card_dir / "meta.yml"
     if meta_path.exists() and yaml:
         with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         stored_style_series = meta.get("style_series_dir")
 
     # Use stored style_series_dir if available, otherwise infer from card path
@@ -3672,21 +4344,7 @@ def phase_rebuild(*, card_dir: Path, regen_prompt: bool) -> int:
         target_type=target_type,
         fix_mode=False,
     )
-    if style_refs:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(prompt_path),
-            *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, fix_mode),
-            "--out", str(out_png)
-        ]
-    else:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.image",
-            str(prompt_path),
-            str(out_png)
-        ]
-
-    subprocess.check_call(cmd)
+    _run_imagegen(prompt_path, out_png, style_refs, rarity_labels, target_rarity, fix_mode, use_cache=False)
 
     # Write generation log with style reference info
     _write_generation_log(
@@ -3704,18 +4362,7 @@ def phase_rebuild(*, card_dir: Path, regen_prompt: bool) -> int:
 
     _run_watermark(card_dir=card_dir, image_path=out_png)
 
-    content = card.get("content", {}) if isinstance(card.get("content"), dict) else {}
-    render_post(
-        str(card_dir / "post.md"),
-        word=str(content.get("WORD", "")),
-        gloss=str(content.get("GLOSS", "")),
-        ot_ref=str(content.get("OT_VERSE_REF", "")),
-        ot_snip=str(content.get("OT_VERSE_SNIPPET", "")),
-        nt_ref=str(content.get("NT_VERSE_REF", "")),
-        nt_snip=str(content.get("NT_VERSE_SNIPPET", "")),
-        trivia_items=content.get("TRIVIA_BULLETS", []) if isinstance(content.get("TRIVIA_BULLETS"), list) else [],
-        image_rel_path=f"./outputs/{out_png.name}",
-    )
+    render_post(str(card_dir / "post.md"), **_post_fields(card, out_png.name))
     print(f"Rebuilt card assets at {card_dir}")
     return 0
 
@@ -3737,12 +4384,7 @@ def phase_rebuild_failed(*, cards_dir: Path, parallel: int = 1) -> int:
 
     failed_cards = []
 
-    for card_dir in sorted(cards_dir.iterdir()):
-        if not card_dir.is_dir():
-            continue
-        if not card_dir.name[0].isdigit():
-            continue
-
+    for card_dir in _list_card_dirs(cards_dir):
         grade_path = card_dir / "grade.json"
         if not grade_path.exists():
             continue
@@ -3801,12 +4443,28 @@ def phase_rebuild_failed(*, cards_dir: Path, parallel: int = 1) -> int:
 
 def _generate_image_only(*, card_dir: Path) -> Path:
     """Generate image without polish. Returns path to generated image."""
+    out_png = card_dir / "outputs" / "card_1024x1536.png"
+    log_info = _render_image_only(card_dir=card_dir, out_png=out_png)
+
+    # Write generation log with style reference info
+    _write_generation_log(card_dir, **log_info)
+
+    return out_png
+
+
+def _render_image_only(*, card_dir: Path, out_png: Path) -> dict:
+    """Render the card image into out_png and return its generation log fields.
+
+    The log itself is left to the caller so a speculative render into a
+    staging file does not overwrite outputs/generation.log until it is used;
+    style refs still exclude the card's own image.
+    """
     out_name = "card_1024x1536.png"
     prompt_file = card_dir / "prompt.txt"
     if not prompt_file.exists():
         raise RuntimeError(f"Missing {prompt_file}")
 
-    out_png = card_dir / "outputs" / out_name
+    card_png = card_dir / "outputs" / out_name
     out_png.parent.mkdir(parents=True, exist_ok=True)
 
     # Get target rarity, type, and style_series from meta.yml
@@ -3816,7 +4474,7 @@ def _generate_image_only(*, card_dir: Path) -> Path:
     meta_file = card_dir / "meta.yml"
     if meta_file.exists() and yaml:
         with open(meta_file, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
         target_rarity = meta.get("rarity", "").upper() or None
         target_type = (meta.get("card_type") or meta.get("type", "")).upper() or None
         stored_style_series = meta.get("style_series_dir")
@@ -3843,54 +4501,52 @@ def _generate_image_only(*, card_dir: Path) -> Path:
     # Exclude current card to prevent self-reference during rebuilds
     style_refs, rarity_labels, fix_mode = _build_style_refs(
         series_dir,
-        current_card_path=out_png,
+        current_card_path=card_png,
         target_rarity=target_rarity,
         target_type=target_type,
         fix_mode=False,
         templates_only=is_example_card,
     )
-    if style_refs:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.style",
-            "--prompt-file", str(prompt_file),
-            *_build_style_cmd_args(style_refs, rarity_labels, target_rarity, fix_mode),
-            "--out", str(out_png)
-        ]
-    else:
-        cmd = [
-            sys.executable, "-m", "hypertext.gemini.image",
-            str(prompt_file),
-            str(out_png)
-        ]
+    _run_imagegen(prompt_file, out_png, style_refs, rarity_labels, target_rarity, fix_mode, use_cache=False)
 
-    subprocess.check_call(cmd)
+    return {
+        "style_refs": style_refs,
+        "rarity_labels": rarity_labels,
+        "target_rarity": target_rarity,
+        "target_type": target_type,
+        "fix_mode": fix_mode,
+        "prompt_file": prompt_file,
+        "phase": "imagegen",
+    }
 
-    # Write generation log with style reference info
-    _write_generation_log(
-        card_dir,
-        style_refs=style_refs,
-        rarity_labels=rarity_labels,
-        target_rarity=target_rarity,
-        target_type=target_type,
-        fix_mode=fix_mode,
-        prompt_file=prompt_file,
-        phase="imagegen",
-    )
 
-    return out_png
+def _commit_speculative_image(future, card_dir: Path, staged_png: Path, out_png: Path) -> None:
+    """Wait for a speculative regeneration, move it over the card image and log it."""
+    log_info = future.result()
+    os.replace(staged_png, out_png)
+    _write_generation_log(card_dir, **log_info)
+
+
+def _discard_speculative_image(future, staged_png: Path) -> None:
+    """Drop a speculative regeneration without waiting for it to finish."""
+    if future.cancel():
+        return
+    future.add_done_callback(lambda _f: staged_png.unlink(missing_ok=True))
 
 
 def _run_polish(image_path: Path) -> None:
     """Run polish step to remove brackets."""
-    polish_cmd = [
-        sys.executable, "-m", "hypertext.cards.polish",
-        str(image_path)
-    ]
+    from hypertext.cards.polish import polish_image
+
     try:
-        subprocess.check_call(polish_cmd)
-        _log("[polish] bracket removal complete")
-    except subprocess.CalledProcessError as e:
+        rc = polish_image(str(image_path))
+    except Exception as e:
         _log(f"[polish] Warning: Polish step failed: {e}")
+        return
+    if rc != 0:
+        _log(f"[polish] Warning: Polish step failed (exit {rc})")
+        return
+    _log("[polish] bracket removal complete")
 
 
 def _run_watermark(*, card_dir: Path, image_path: Path) -> None:
@@ -3977,7 +4633,7 @@ def phase_grade(*, card_dir: Path, style_series_dir: Path | None = None) -> int:
         meta_path = card_dir / "meta.yml"
         if meta_path.exists():
             with open(meta_path, "r", encoding="utf-8") as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=_SafeLoader) or {}
             stored_style_series = meta.get("style_series_dir")
 
         if stored_style_series:
@@ -4018,8 +4674,7 @@ def phase_grade(*, card_dir: Path, style_series_dir: Path | None = None) -> int:
     _log("[phase grade] Loading style rubric...")
     style_rubric = None
     if DEFAULT_STYLE_RUBRIC.exists():
-        with open(DEFAULT_STYLE_RUBRIC, "r", encoding="utf-8") as f:
-            style_rubric = f.read()
+        style_rubric = _read_text(DEFAULT_STYLE_RUBRIC)
         _log(f"[phase grade] Loaded style rubric ({len(style_rubric)} chars) from {DEFAULT_STYLE_RUBRIC.name}")
     else:
         _log(f"[phase grade] WARNING: Style rubric not found at {DEFAULT_STYLE_RUBRIC}")
@@ -4093,8 +4748,7 @@ def phase_grade(*, card_dir: Path, style_series_dir: Path | None = None) -> int:
         "style_refs_count": len(style_refs),
         "style_refs": [Path(r).name for r in style_refs],
     }
-    with open(grade_json_path, "w", encoding="utf-8") as f:
-        json.dump(grade_data, f, indent=2)
+    write_json(grade_json_path, grade_data)
     _log(f"[phase grade] Saved {grade_json_path}")
 
     # Save grade.txt - match terminal output format
@@ -4119,8 +4773,7 @@ def phase_grade(*, card_dir: Path, style_series_dir: Path | None = None) -> int:
         for corr in result.corrections:
             lines.append(f"  - {corr}")
     lines.append("=" * 60)
-    with open(grade_txt_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    grade_txt_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     _log(f"[phase grade] Saved {grade_txt_path}")
 
     # Print summary (same format as grade.txt)
@@ -4170,9 +4823,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
     stored_style_series = None
     meta_path = card_dir / "meta.yml"
     if meta_path.exists():
-        with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
-        stored_style_series = meta.get("style_series_dir")
+        stored_style_series = _read_meta(meta_path).get("style_series_dir")
 
     # Use stored style_series_dir if available, otherwise infer from card path
     if stored_style_series:
@@ -4205,8 +4856,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
     # Load static style rubric
     style_rubric = None
     if DEFAULT_STYLE_RUBRIC.exists():
-        with open(DEFAULT_STYLE_RUBRIC, "r", encoding="utf-8") as f:
-            style_rubric = f.read()
+        style_rubric = _read_text(DEFAULT_STYLE_RUBRIC)
         _log(f"[phase review] Loaded style rubric from {DEFAULT_STYLE_RUBRIC.name}")
 
     best_score = 0
@@ -4214,134 +4864,173 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
     all_descriptions: list[CardDescription] = []
     style_mismatch_count = 0
 
-    for attempt in range(1, max_attempts + 1):
-        _log(f"[phase review] === ATTEMPT {attempt}/{max_attempts} for {word} ===")
-
-        # Stage 1: DESCRIBE - Have LLM observe the card (with style refs + rubric for comparison)
-        _log(f"[phase review] Stage 1: Describing card with {len(style_refs)} style refs + rubric...")
-        try:
-            description = describe_card(out_png, style_refs=style_refs, style_rubric=style_rubric)
-            all_descriptions.append(description)
-        except Exception as e:
-            _log(f"[phase review] Description failed: {e}")
-            return 1
-
-        # STYLE MISMATCH CHECK - automatic fail if card doesn't match references
-        if not description.style_matches_reference:
-            style_mismatch_count += 1
-            reason = description.style_mismatch_reason or "Style does not match reference cards"
-            _log(f"[phase review] ⚠️ STYLE MISMATCH (auto-fail): {reason}")
-            print(f"\n{'='*60}")
-            print(f"⚠️ STYLE MISMATCH DETECTED - AUTOMATIC FAIL")
-            print(f"Reason: {reason}")
-            print(f"{'='*60}\n")
+    # Once a score calls for a rebuild or revision, the next attempt's image is
+    # started right away into a staging file, overlapping the score report; it
+    # only replaces the card image (and generation.log) when it is used.
+    staged_png = out_png.with_name(f"{out_png.stem}.next{out_png.suffix}")
+    regen_executor = ThreadPoolExecutor(max_workers=1)
+    pending_regen = None
 
-            # If this is the last attempt, we're done
-            if attempt >= max_attempts:
-                _log(f"[phase review] Max attempts reached with style mismatch. Failing card.")
-                best_score = 0
-                break
+    try:
+        for attempt in range(1, max_attempts + 1):
+            _log(f"[phase review] === ATTEMPT {attempt}/{max_attempts} for {word} ===")
 
-            # Rebuild the card with fresh generation
-            _log(f"[phase review] Rebuilding card due to style mismatch...")
+            # Stage 1: DESCRIBE - Have LLM observe the card (with style refs + rubric for comparison)
+            _log(f"[phase review] Stage 1: Describing card with {len(style_refs)} style refs + rubric...")
             try:
-                _generate_image_only(card_dir=card_dir)
+                description = describe_card(out_png, style_refs=style_refs, style_rubric=style_rubric)
+                all_descriptions.append(description)
             except Exception as e:
-                _log(f"[phase review] Rebuild failed: {e}")
+                _log(f"[phase review] Description failed: {e}")
                 return 1
-            continue  # Go to next attempt
 
-        # Print what the LLM sees
-        print("\n" + "=" * 60)
-        print(format_description_report(description))
-        print("=" * 60 + "\n")
-
-        # Stage 2: SCORE - Compare description against rubric
-        _log(f"[phase review] Stage 2: Scoring against rubric...")
-        try:
-            result = score_against_rubric(description, card_json)
-            result.passed = result.score >= 90
-        except Exception as e:
-            _log(f"[phase review] Scoring failed: {e}")
-            return 1
+            # STYLE MISMATCH CHECK - automatic fail if card doesn't match references
+            if not description.style_matches_reference:
+                style_mismatch_count += 1
+                reason = description.style_mismatch_reason or "Style does not match reference cards"
+                _log(f"[phase review] ⚠️ STYLE MISMATCH (auto-fail): {reason}")
+                print(f"\n{'='*60}")
+                print(f"⚠️ STYLE MISMATCH DETECTED - AUTOMATIC FAIL")
+                print(f"Reason: {reason}")
+                print(f"{'='*60}\n")
+
+                # If this is the last attempt, we're done
+                if attempt >= max_attempts:
+                    _log(f"[phase review] Max attempts reached with style mismatch. Failing card.")
+                    best_score = 0
+                    break
 
-        _log(f"[phase review] Score: {result.score}/100")
-
-        # Print score breakdown
-        print("\n" + "-" * 40)
-        for name, data in result.categories.items():
-            score = data.get("score", 0)
-            max_score = data.get("max", 0)
-            issues = data.get("issues", [])
-            status = "✓" if score == max_score else "⚠" if score >= max_score * 0.7 else "✗"
-            print(f"{status} {name.replace('_', ' ').title()}: {score}/{max_score}")
-            for issue in issues:
-                print(f"    - {issue}")
-        print("-" * 40 + "\n")
-
-        if result.corrections:
-            print("Corrections needed:")
-            for i, correction in enumerate(result.corrections, 1):
-                print(f"  {i}. {correction}")
-            print()
-
-        if result.score > best_score:
-            best_score = result.score
-            best_result = result
-
-        # Stage 3: DECIDE - Perfect score means we're done
-        if result.score >= 100:
-            _log(f"[phase review] Perfect score achieved!")
-            break
+                # Rebuild the card with fresh generation
+                _log(f"[phase review] Rebuilding card due to style mismatch...")
+                try:
+                    _generate_image_only(card_dir=card_dir)
+                except Exception as e:
+                    _log(f"[phase review] Rebuild failed: {e}")
+                    return 1
+                continue  # Go to next attempt
 
-        # If this is the last attempt, don't regenerate
-        if attempt >= max_attempts:
-            _log(f"[phase review] Max attempts reached. Final score: {result.score}/100")
-            break
+            # Print what the LLM sees
+            print("\n" + "=" * 60)
+            print(format_description_report(description))
+            print("=" * 60 + "\n")
 
-        # Stage 4: ITERATE based on score
-        if result.score < 90:
-            # Score < 90: full rebuild needed
-            _log(f"[phase review] Score {result.score} < 90, REBUILDING image...")
+            # Stage 2: SCORE - Compare description against rubric
+            _log(f"[phase review] Stage 2: Scoring against rubric...")
             try:
-                _generate_image_only(card_dir=card_dir)
+                result = score_against_rubric(description, card_json)
+                result.passed = result.score >= 90
             except Exception as e:
-                _log(f"[phase review] Image regeneration failed: {e}")
+                _log(f"[phase review] Scoring failed: {e}")
                 return 1
-        else:
-            # Score >= 90 but < 100: targeted revision based on corrections
-            _log(f"[phase review] Score {result.score} >= 90, attempting targeted REVISION...")
 
-            # Build revision instructions from corrections
+            _log(f"[phase review] Score: {result.score}/100")
+
+            improved = result.score > best_score
+            if improved:
+                best_score = result.score
+                best_result = result
+
+            # A rebuild that failed to beat the best score is unlikely to be
+            # followed by one that does; stop spending review calls on it.
+            stop_early = attempt > 1 and not improved and result.score < 90
+
+            # Only a score that will be acted on is worth a paid regeneration
+            if (
+                attempt < max_attempts
+                and not stop_early
+                and result.score < 100
+                and (result.score < 90 or result.corrections)
+            ):
+                pending_regen = regen_executor.submit(
+                    _render_image_only, card_dir=card_dir, out_png=staged_png
+                )
+
+            # Print score breakdown
+            print("\n" + "-" * 40)
+            for name, data in result.categories.items():
+                score = data.get("score", 0)
+                max_score = data.get("max", 0)
+                issues = data.get("issues", [])
+                status = "✓" if score == max_score else "⚠" if score >= max_score * 0.7 else "✗"
+                print(f"{status} {name.replace('_', ' ').title()}: {score}/{max_score}")
+                for issue in issues:
+                    print(f"    - {issue}")
+            print("-" * 40 + "\n")
+
             if result.corrections:
-                revision_instructions = _build_revision_from_corrections(description, result.corrections)
-                _log(f"[phase review] Auto-revision: {revision_instructions}")
-
-                # Write temporary revise instructions
-                revise_path = card_dir / "revise.txt"
-                original_revise = None
-                if revise_path.exists():
-                    with open(revise_path, "r", encoding="utf-8") as f:
-                        original_revise = f.read()
-
-                # Write auto-generated revision
-                with open(revise_path, "w", encoding="utf-8") as f:
-                    f.write(f"# Auto-generated revision from review (attempt {attempt})\n")
-                    f.write(f"General_Revision_Request:\n{revision_instructions}\n")
-
-                # Run the image regeneration (not full revise, just image)
+                print("Corrections needed:")
+                for i, correction in enumerate(result.corrections, 1):
+                    print(f"  {i}. {correction}")
+                print()
+
+            # Stage 3: DECIDE - Perfect score means we're done
+            if result.score >= 100:
+                _log(f"[phase review] Perfect score achieved!")
+                break
+
+            # If this is the last attempt, don't regenerate
+            if attempt >= max_attempts:
+                _log(f"[phase review] Max attempts reached. Final score: {result.score}/100")
+                break
+
+            if stop_early:
+                _log(f"[phase review] Score {result.score} did not improve on {best_score}, stopping early")
+                break
+
+            # Stage 4: ITERATE based on score
+            if result.score < 90:
+                # Score < 90: full rebuild needed
+                _log(f"[phase review] Score {result.score} < 90, REBUILDING image...")
                 try:
-                    _generate_image_only(card_dir=card_dir)
+                    regen, pending_regen = pending_regen, None
+                    _commit_speculative_image(regen, card_dir, staged_png, out_png)
                 except Exception as e:
-                    _log(f"[phase review] Revision image regeneration failed: {e}")
-
-                # Restore original revise.txt
-                if original_revise is not None:
-                    with open(revise_path, "w", encoding="utf-8") as f:
-                        f.write(original_revise)
+                    _log(f"[phase review] Image regeneration failed: {e}")
+                    return 1
             else:
-                # No corrections specified, we're at 90+ but not 100 with nothing specific to fix
-                _log(f"[phase review] No specific corrections, continuing to polish phase...")
+                # Score >= 90 but < 100: targeted revision based on corrections
+                _log(f"[phase review] Score {result.score} >= 90, attempting targeted REVISION...")
+
+                # Build revision instructions from corrections
+                if result.corrections:
+                    revision_instructions = _build_revision_from_corrections(description, result.corrections)
+                    _log(f"[phase review] Auto-revision: {revision_instructions}")
+
+                    # Write temporary revise instructions
+                    revise_path = card_dir / "revise.txt"
+                    original_revise = None
+                    if revise_path.exists():
+                        original_revise = _read_text(revise_path)
+
+                    # Write auto-generated revision
+                    revise_path.write_text(
+                        f"# Auto-generated revision from review (attempt {attempt})\n"
+                        f"General_Revision_Request:\n{revision_instructions}\n",
+                        encoding="utf-8",
+                    )
+
+                    # Run the image regeneration (not full revise, just image)
+                    try:
+                        regen, pending_regen = pending_regen, None
+                        _commit_speculative_image(regen, card_dir, staged_png, out_png)
+                    except Exception as e:
+                        _log(f"[phase review] Revision image regeneration failed: {e}")
+
+                    # Restore original revise.txt
+                    if original_revise is not None:
+                        revise_path.write_text(original_revise, encoding="utf-8")
+                else:
+                    # No corrections specified, we're at 90+ but not 100 with nothing specific to fix.
+                    # The image is left unchanged, so another attempt would only re-score it.
+                    _log(f"[phase review] No specific corrections, continuing to polish phase...")
+                    break
+    finally:
+        if pending_regen is not None:
+            _discard_speculative_image(pending_regen, staged_png)
+        # A render already in flight cannot be interrupted: the interpreter
+        # still joins the worker at exit, so an abandoned render delays exit
+        # (never the review result) until its request returns.
+        regen_executor.shutdown(wait=False, cancel_futures=True)
 
     # Always run polish at the end of review loop (before watermark)
     _log(f"[phase review] Running final polish pass...")
@@ -4353,13 +5042,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
 
     # Update meta.yml with review status
     meta_path = card_dir / "meta.yml"
-    if meta_path.exists():
-        with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
-        if not isinstance(meta, dict):
-            meta = {}
-    else:
-        meta = {}
+    meta = _read_meta(meta_path)
 
     meta["review_score"] = best_score
     meta["review_attempts"] = max_attempts
@@ -4406,8 +5089,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
         meta["user_action_required"] = True
         meta["user_warning"] = f"Card scored only {best_score}/100. Rebuild required."
 
-    with open(meta_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False, allow_unicode=True)
+    _write_meta(meta_path, meta)
 
     # Write grade.json with detailed results
     # Card passes if score >= 90 AND no style mismatches
@@ -4424,8 +5106,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
         "corrections": best_result.corrections if best_result else [],
         "categories": best_result.categories if best_result else {},
     }
-    with open(grade_json_path, "w", encoding="utf-8") as f:
-        json.dump(grade_data, f, indent=2)
+    write_json(grade_json_path, grade_data)
 
     # Write grade.txt with human-readable summary
     grade_txt_path = card_dir / "grade.txt"
@@ -4447,8 +5128,7 @@ def phase_review(*, card_dir: Path, max_attempts: int = 2) -> int:
         lines.append("Corrections Needed:")
         for c in best_result.corrections:
             lines.append(f"  - {c}")
-    with open(grade_txt_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    grade_txt_path.write_text("\n".join(lines), encoding="utf-8")
 
     _log(f"[phase review] Final status: {status_msg}")
     _log(f"[phase review] Wrote grade.json and grade.txt to {card_dir}")
@@ -4623,7 +5303,7 @@ def main() -> int:
         return phase_plan(series_dir=series_dir, template_path=template_path, auto=args.auto)
 
     if args.phase == "imagegen":
-        return phase_imagegen(series_dir=series_dir)
+        return phase_imagegen(series_dir=series_dir, parallel=parallel)
 
     if args.phase == "demo":
         return phase_demo(style_series_dir=style_series_dir, template_path=template_path, demo_dir=Path(args.demo_dir))
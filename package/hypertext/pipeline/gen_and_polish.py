@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Generate a card image and polish it in a single process.
+
+Accepts the same arguments as ``hypertext.gemini.style`` plus ``--polish``.
+With no ``--style`` references it falls back to plain ``hypertext.gemini.image``
+generation. Running both steps here saves the pipeline one interpreter start
+and import pass per card compared to launching generation and polish
+separately.
+
+The daily pipeline calls ``generate_card_image`` in-process; the CLI exit code
+is non-zero only if generation fails, and a polish failure is reported as a
+warning, matching the pipeline's previous behaviour.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Same default as the hypertext.gemini.style CLI
+DEFAULT_STYLE_MODEL = "gemini-3-pro-image-preview"
+
+
+def generate_card_image(
+    prompt_file: Path,
+    out_png: Path,
+    *,
+    style_refs: list[str] | None = None,
+    rarity_labels: dict[int, str] | None = None,
+    target_rarity: str | None = None,
+    fix_mode: bool = False,
+    polish: bool = False,
+    model: str = DEFAULT_STYLE_MODEL,
+    use_cache: bool = True,
+) -> None:
+    """Generate a card image from prompt_file into out_png, optionally polishing it.
+
+    Uses style-referenced generation when style_refs are given, otherwise
+    plain text-to-image generation. Pass use_cache=False when regenerating a
+    card, so HYPERTEXT_CACHE_DIR cannot hand back the image being replaced.
+
+    Raises:
+        RuntimeError: If the prompt file is missing or generation fails.
+    """
+    prompt_path = Path(prompt_file)
+    if not prompt_path.exists():
+        raise RuntimeError(f"Prompt file not found: {prompt_path}")
+    prompt_text = prompt_path.read_text(encoding="utf-8").strip()
+
+    if style_refs:
+        from hypertext.gemini.style import generate_with_styles
+
+        generate_with_styles(
+            prompt_text=prompt_text,
+            style_image_paths=list(style_refs),
+            out_path=str(out_png),
+            model=model,
+            rarity_labels=rarity_labels or None,
+            target_rarity=target_rarity,
+            fix_mode=fix_mode,
+            use_cache=use_cache,
+        )
+    else:
+        from hypertext.gemini.image import generate_image
+
+        generate_image(prompt_text, str(out_png), use_cache=use_cache)
+
+    if polish:
+        from hypertext.cards.polish import polish_image
+
+        if polish_image(str(out_png)) != 0:
+            print("Warning: Polish step failed", file=sys.stderr)
+
+
+def main() -> int:
+    """CLI entrypoint for fused image generation + polish."""
+    parser = argparse.ArgumentParser(description="Generate a card image and optionally polish it")
+    parser.add_argument("--prompt-file", required=True, help="Path to text file containing the prompt")
+    parser.add_argument("--style", action="append", default=[], help="Path to reference style image (repeatable)")
+    parser.add_argument("--out", required=True, help="Output PNG path")
+    parser.add_argument("--model", default=DEFAULT_STYLE_MODEL, help="Gemini model ID (style generation)")
+    parser.add_argument("--rarity-label", action="append", help="Rarity label for style image at position (format: POS:RARITY e.g. 2:COMMON)")
+    parser.add_argument("--target-rarity", help="Target rarity for this card (highlights matching reference)")
+    parser.add_argument("--fix-mode", action="store_true", help="Fix mode: [1]=card to fix, [2]=template, [3+]=examples")
+    parser.add_argument("--polish", action="store_true", help="Run the bracket-removal polish pass after generation")
+
+    args = parser.parse_args()
+
+    rarity_labels = None
+    if args.rarity_label:
+        rarity_labels = {}
+        for label in args.rarity_label:
+            if ":" in label:
+                pos, rarity = label.split(":", 1)
+                rarity_labels[int(pos)] = rarity.upper()
+
+    try:
+        generate_card_image(
+            Path(args.prompt_file),
+            Path(args.out),
+            style_refs=args.style,
+            rarity_labels=rarity_labels,
+            target_rarity=args.target_rarity,
+            fix_mode=args.fix_mode,
+            polish=args.polish,
+            model=args.model,
+        )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -19,27 +19,34 @@ from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml C bindings for meta.yml I/O when available.
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 def _log(msg: str) -> None:
     """Log a message with timestamp."""
     print(f"[template] {msg}", flush=True)
 
 
+# Resolved once; every template lookup is relative to the repo root
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+_PKG_TEMPLATES_DIR = _REPO_ROOT / "package" / "hypertext" / "templates"
+
+
 def _get_template_dir(template_type: str) -> Path:
     """Get the template directory for a given type."""
-    repo_root = Path(__file__).parent.parent.parent.parent
-    return repo_root / "templates" / template_type
+    return _REPO_ROOT / "templates" / template_type
 
 
 def _get_pkg_template_path(template_type: str) -> Path:
     """Get the path to the package template (used by daily.py)."""
-    repo_root = Path(__file__).parent.parent.parent.parent
-    pkg_templates = repo_root / "package" / "hypertext" / "templates"
-
     if template_type == "card":
-        return pkg_templates / "card_template.png"
+        return _PKG_TEMPLATES_DIR / "card_template.png"
     elif template_type == "lot":
-        return pkg_templates / "lot_template.png"
+        return _PKG_TEMPLATES_DIR / "lot_template.png"
     else:
         raise ValueError(f"Unknown template type: {template_type}")
 
@@ -51,7 +58,7 @@ def _get_current_version(template_dir: Path) -> int:
         return 0
 
     with open(meta_path, "r", encoding="utf-8") as f:
-        meta = yaml.safe_load(f) or {}
+        meta = yaml.load(f, Loader=_SafeLoader) or {}
 
     try:
         return int(meta.get("version", 0))
@@ -153,7 +160,6 @@ def _get_style_refs_for_template(
         subtype: The subtype being generated (used to find subtype-specific refs)
     """
     template_dir = _get_template_dir(template_type)
-    repo_root = template_dir.parent
     style_refs = []
 
     # Determine which version(s) to pull refs from
@@ -199,7 +205,7 @@ def _get_style_refs_for_template(
     # 3. Add symbol palettes if available (for card templates)
     # Only include palettes relevant to the subtype category
     if template_type == "card":
-        palettes_dir = repo_root / "palettes"
+        palettes_dir = _REPO_ROOT / "templates" / "palettes"
         category = _get_subtype_category(subtype)
 
         # Type symbols palette - only for type subtypes and base
@@ -309,7 +315,7 @@ def _update_meta(meta_path: Path, new_version: int) -> None:
     """Update the meta.yml with new version and timestamp."""
     if meta_path.exists():
         with open(meta_path, "r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
+            meta = yaml.load(f, Loader=_SafeLoader) or {}
     else:
         meta = {}
 
@@ -317,7 +323,7 @@ def _update_meta(meta_path: Path, new_version: int) -> None:
     meta["updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     with open(meta_path, "w", encoding="utf-8") as f:
-        yaml.dump(meta, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(meta, f, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True)
 
 
 def _reset_rebuild_flag(revise_path: Path) -> None:
@@ -2,7 +2,10 @@
 """Image utility functions for Hypertext."""
 
 import argparse
+import functools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -66,13 +69,22 @@ def _convert_directory(dir_path: Path, keep_original: bool = False) -> int:
         print(f"Not a directory: {dir_path}", file=sys.stderr)
         return 0
 
-    converted = 0
-    for ext in ("*.jpeg", "*.jpg", "*.JPEG", "*.JPG"):
-        for jpeg_path in dir_path.glob(ext):
-            if _convert_file(jpeg_path, keep_original):
-                converted += 1
-
-    return converted
+    # Case-insensitive filesystems match one file under several patterns;
+    # collect unique paths so no file is converted (and unlinked) twice
+    jpeg_paths = sorted({
+        jpeg_path
+        for ext in ("*.jpeg", "*.jpg", "*.JPEG", "*.JPG")
+        for jpeg_path in dir_path.glob(ext)
+    })
+    if len(jpeg_paths) <= 1:
+        return sum(1 for jpeg_path in jpeg_paths if _convert_file(jpeg_path, keep_original))
+
+    # Decoding and encoding are CPU-bound, so spread files over processes
+    with ProcessPoolExecutor(max_workers=min(len(jpeg_paths), os.cpu_count() or 1)) as executor:
+        results = executor.map(
+            functools.partial(_convert_file, keep_original=keep_original), jpeg_paths, chunksize=4
+        )
+        return sum(1 for result in results if result)
 
 
 def main() -> int:
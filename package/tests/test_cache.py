@@ -0,0 +1,51 @@
+"""On-disk image cache in hypertext.gemini.cache."""
+
+import pytest
+
+from hypertext.gemini import cache
+
+
+def test_normalize_prompt_collapses_whitespace_only():
+    assert cache.normalize_prompt("  Draw\r\n the   card\t") == "Draw the card"
+    assert cache.normalize_prompt("Draw the card") != cache.normalize_prompt("Draw the cards")
+
+
+def test_request_key_is_stable_and_length_prefixed():
+    key = cache.request_key("prompt", b"\x89PNG", "2:3")
+    assert key == cache.request_key("prompt", b"\x89PNG", "2:3")
+    assert key == cache.request_key(b"prompt", b"\x89PNG", "2:3")
+    assert cache.request_key("ab", "c") != cache.request_key("a", "bc")
+    assert cache.request_key("prompt", "2:3") != cache.request_key("prompt", "1:1")
+
+
+def test_cache_disabled_without_env(tmp_path, monkeypatch):
+    monkeypatch.delenv("HYPERTEXT_CACHE_DIR", raising=False)
+    assert cache.cache_dir() is None
+    cache.store_cached_image("k", b"png")
+    assert not cache.load_cached_image("k", str(tmp_path / "out.png"))
+    assert not (tmp_path / "out.png").exists()
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    root = tmp_path / "cache"
+    monkeypatch.setenv("HYPERTEXT_CACHE_DIR", str(root))
+    return root
+
+
+def test_store_and_load_image(tmp_path, cache_root):
+    out_path = tmp_path / "card" / "card.png"
+    assert not cache.load_cached_image("k", str(out_path))
+    cache.store_cached_image("k", b"png bytes")
+    assert cache.load_cached_image("k", str(out_path))
+    assert out_path.read_bytes() == b"png bytes"
+    assert [p.name for p in cache_root.iterdir()] == ["k.png"]
+
+
+def test_store_cached_file(tmp_path, cache_root):
+    src = tmp_path / "written.png"
+    src.write_bytes(b"from disk")
+    cache.store_cached_file("k", str(src))
+    out_path = tmp_path / "copy.png"
+    assert cache.load_cached_image("k", str(out_path))
+    assert out_path.read_bytes() == b"from disk"
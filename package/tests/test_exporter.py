@@ -0,0 +1,43 @@
+"""Tests for hypertext.lots.exporter."""
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+np = pytest.importorskip("numpy")
+
+from hypertext.lots import exporter
+
+
+def _sample(mode: str):
+    img = Image.new("RGBA", (7, 5))
+    img.putdata([(x * 30, y * 50, (x + y) * 10, 100 + x) for y in range(5) for x in range(7)])
+    if mode == "P":
+        return img.convert("RGB").quantize(colors=16)
+    return img.convert(mode)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "LA", "P"])
+def test_add_bleed_numpy_matches_pil(monkeypatch, mode):
+    img = _sample(mode)
+    fast = exporter._add_bleed(img, 3)
+    monkeypatch.setattr(exporter, "np", None)
+    slow = exporter._add_bleed(img, 3)
+
+    assert fast.mode == slow.mode == img.mode
+    assert fast.size == slow.size == (13, 11)
+    assert fast.tobytes() == slow.tobytes()
+    if mode == "P":
+        assert fast.getpalette() == slow.getpalette() == img.getpalette()
+
+
+def test_add_bleed_replicates_edges():
+    img = _sample("RGBA")
+    out = exporter._add_bleed(img, 2)
+    assert out.getpixel((0, 0)) == img.getpixel((0, 0))
+    assert out.getpixel((10, 8)) == img.getpixel((6, 4))
+    assert out.crop((2, 2, 9, 7)).tobytes() == img.tobytes()
+
+
+def test_add_bleed_zero_is_identity():
+    img = _sample("RGB")
+    assert exporter._add_bleed(img, 0) is img
@@ -0,0 +1,35 @@
+"""meta.yml serialization in hypertext.pipeline.daily."""
+
+from pathlib import Path
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+from hypertext.pipeline import daily
+
+SERIES_DIR = Path(__file__).resolve().parents[2] / "series"
+META_FILES = sorted(SERIES_DIR.rglob("meta.yml"))
+
+
+def test_series_has_meta_files():
+    assert META_FILES
+
+
+@pytest.mark.parametrize("meta_path", META_FILES, ids=lambda p: str(p.parent.relative_to(SERIES_DIR)))
+def test_dump_meta_yaml_round_trips(meta_path):
+    text = meta_path.read_text(encoding="utf-8")
+    meta = yaml.safe_load(text)
+    dumped = daily._dump_meta_yaml(meta)
+    assert yaml.safe_load(dumped) == meta
+    # Re-saving an unchanged card must not rewrite its committed meta.yml
+    assert dumped == text
+
+
+def test_write_and_read_meta(tmp_path):
+    meta = {"word": "LOGOS", "gloss": 'word: "reason"', "stats": {"lore": 3}, "trivia": ["a", "b"], "notes": None}
+    meta_path = tmp_path / "meta.yml"
+    daily._write_meta(meta_path, meta)
+    assert yaml.safe_load(meta_path.read_text(encoding="utf-8")) == meta
+    daily._META_CACHE.clear()
+    assert daily._read_meta(meta_path) == meta
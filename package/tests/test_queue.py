@@ -0,0 +1,96 @@
+"""queue.yml appends and card-dir listing in hypertext.pipeline.daily."""
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+from hypertext.pipeline import daily
+
+NEW = [{"word": "LOGOS", "card_type": "NOUN", "rarity": "RARE"}, {"word": "EAT", "card_type": "VERB"}]
+
+
+def _append_and_load(queue_path, text):
+    queue_path.write_text(text, encoding="utf-8")
+    daily.append_queue(queue_path, NEW)
+    return yaml.safe_load(queue_path.read_text(encoding="utf-8"))
+
+
+def test_append_to_block_sequence_keeps_existing_text(tmp_path):
+    queue_path = tmp_path / "queue.yml"
+    existing = "- word: GRACE\n  card_type: NOUN\n"
+    assert _append_and_load(queue_path, existing) == [{"word": "GRACE", "card_type": "NOUN"}] + NEW
+    assert queue_path.read_text(encoding="utf-8").startswith(existing)
+
+
+def test_append_without_trailing_newline(tmp_path):
+    loaded = _append_and_load(tmp_path / "queue.yml", "- word: GRACE\n  card_type: NOUN")
+    assert loaded == [{"word": "GRACE", "card_type": "NOUN"}] + NEW
+
+
+def test_append_to_empty_file(tmp_path):
+    assert _append_and_load(tmp_path / "queue.yml", "") == NEW
+
+
+def test_append_to_blank_file(tmp_path):
+    assert _append_and_load(tmp_path / "queue.yml", "\n\n") == NEW
+
+
+def test_append_to_missing_file(tmp_path):
+    queue_path = tmp_path / "deck" / "queue.yml"
+    daily.append_queue(queue_path, NEW)
+    assert yaml.safe_load(queue_path.read_text(encoding="utf-8")) == NEW
+
+
+@pytest.mark.parametrize("text", ["[]\n", "[{word: GRACE}]", "- {word: GRACE}\n"])
+def test_append_to_flow_style_list(tmp_path, text):
+    expected = yaml.safe_load(text) + NEW
+    assert _append_and_load(tmp_path / "queue.yml", text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "# upcoming cards\n- word: GRACE\n",
+        "---\n- word: GRACE\n",
+        "  - word: GRACE\n",
+    ],
+    ids=["leading-comment", "document-marker", "indented"],
+)
+def test_append_to_other_block_sequences(tmp_path, text):
+    assert _append_and_load(tmp_path / "queue.yml", text) == [{"word": "GRACE"}] + NEW
+
+
+def test_append_nothing_leaves_file_alone(tmp_path):
+    queue_path = tmp_path / "queue.yml"
+    queue_path.write_text("- word: GRACE", encoding="utf-8")
+    daily.append_queue(queue_path, [])
+    assert queue_path.read_text(encoding="utf-8") == "- word: GRACE"
+
+
+def test_repeated_appends_match_save_queue(tmp_path):
+    appended = tmp_path / "appended.yml"
+    saved = tmp_path / "saved.yml"
+    entries = [dict(entry, n=i) for i, entry in enumerate(NEW * 3)]
+    for entry in entries:
+        daily.append_queue(appended, [entry])
+    daily.save_queue(saved, entries)
+    assert appended.read_text(encoding="utf-8") == saved.read_text(encoding="utf-8")
+    assert daily.load_queue(appended) == entries
+
+
+def test_iter_card_dirs_yields_numbered_dirs_only(tmp_path):
+    for name in ("002-logos", "001-grace", "010-eat"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "003-notes.txt").write_text("not a dir", encoding="utf-8")
+    (tmp_path / "drafts").mkdir()
+    (tmp_path / "04-short").mkdir()
+
+    assert sorted(e.name for e in daily._iter_card_dirs(tmp_path)) == ["001-grace", "002-logos", "010-eat"]
+    assert daily._list_card_dirs(tmp_path) == [tmp_path / n for n in ("001-grace", "002-logos", "010-eat")]
+    assert daily.next_number(tmp_path) == 11
+
+
+def test_iter_card_dirs_missing_dir(tmp_path):
+    missing = tmp_path / "cards"
+    assert list(daily._iter_card_dirs(missing)) == []
+    assert daily.next_number(missing) == 1
@@ -0,0 +1,90 @@
+"""Rate-limit gate and token bucket in hypertext.gemini.ratelimit."""
+
+import time
+
+import pytest
+
+from hypertext.gemini import ratelimit
+
+
+@pytest.fixture(autouse=True)
+def gate_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HYPERTEXT_RATELIMIT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_gate_key_is_per_key_and_model_and_hides_the_key():
+    key = ratelimit.gate_key("image", "secret-key", "model-a")
+    assert key.startswith("image-")
+    assert "secret-key" not in key
+    assert key == ratelimit.gate_key("image", "secret-key", "model-a")
+    assert key != ratelimit.gate_key("image", "other-key", "model-a")
+    assert key != ratelimit.gate_key("image", "secret-key", "model-b")
+
+
+def test_gate_starts_open():
+    assert ratelimit.check_gate("image-x") == 0.0
+    ratelimit.wait_for_gate("image-x", max_wait_s=1.0)
+
+
+def test_close_gate_writes_under_ratelimit_dir(gate_dir):
+    ratelimit.close_gate("image-x", 30)
+    assert [p.name for p in gate_dir.iterdir()] == ["image-x.json"]
+    assert 29.0 < ratelimit.check_gate("image-x") <= 30.0
+    assert ratelimit.check_gate("image-y") == 0.0
+
+
+def test_close_gate_never_shortens_a_longer_wait():
+    ratelimit.close_gate("image-x", 30)
+    ratelimit.close_gate("image-x", 5)
+    assert ratelimit.check_gate("image-x") > 29.0
+
+
+def test_wait_for_gate_raises_past_max_wait():
+    ratelimit.close_gate("image-x", 30)
+    with pytest.raises(RuntimeError, match="rate-limited"):
+        ratelimit.wait_for_gate("image-x", max_wait_s=10.0)
+
+
+def test_corrupt_gate_reads_as_open(gate_dir):
+    (gate_dir / "image-x.json").write_text("not json", encoding="utf-8")
+    assert ratelimit.check_gate("image-x") == 0.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    sleeps = clock.sleeps
+
+    bucket = ratelimit.TokenBucket(rpm=60, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+    bucket.acquire()
+    assert sleeps == [pytest.approx(1.0)]
+
+    bucket.drain()
+    bucket.acquire()
+    assert sleeps[-1] == pytest.approx(1.0)
+
+
+def test_token_bucket_disabled():
+    bucket = ratelimit.TokenBucket(rpm=0)
+    start = time.monotonic()
+    for _ in range(100):
+        bucket.acquire()
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,71 @@
+"""Helpers in hypertext.gemini.transport that need no network."""
+
+import base64
+import io
+import os
+import urllib.error
+
+import pytest
+
+from hypertext.gemini import transport
+
+
+def test_json_round_trip():
+    payload = {"contents": [{"parts": [{"text": "é ✓"}, {"inline_data": {"data": "QUJD"}}]}], "n": 3}
+    raw = transport.encode_json(payload)
+    assert isinstance(raw, bytes)
+    assert transport.decode_json(raw) == payload
+    assert transport.decode_json(raw.decode("utf-8")) == payload
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        (None, None),
+        ({}, None),
+        ({"Retry-After": "17"}, 17),
+        ({"Retry-After": ""}, None),
+        ({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, None),
+    ],
+)
+def test_parse_retry_after_seconds(headers, expected):
+    assert transport.parse_retry_after_seconds(headers) == expected
+
+
+def test_read_http_error_body():
+    err = urllib.error.HTTPError("https://example", 429, "Too Many", {}, io.BytesIO(b'{"error": "quota \xff"}'))
+    assert transport.read_http_error_body(err) == '{"error": "quota �"}'
+
+
+def test_backoff_delay_honours_retry_after():
+    assert 30.0 <= transport.backoff_delay(1, 2.0, retry_after=30) < 31.0
+
+
+def test_backoff_delay_doubles_up_to_cap():
+    for attempt, base in ((1, 2.0), (2, 4.0), (3, 8.0), (10, 60.0)):
+        assert base <= transport.backoff_delay(attempt, 2.0) < base + 1.0
+    assert 5.0 <= transport.backoff_delay(10, 2.0, cap_s=5.0) < 6.0
+
+
+@pytest.mark.parametrize("as_type", [bytes, str, memoryview])
+def test_write_image_atomic(tmp_path, as_type):
+    image = os.urandom(700_000)  # spans several base64 chunks
+    if as_type is bytes:
+        data = image
+    elif as_type is str:
+        data = base64.b64encode(image).decode("ascii")
+    else:
+        data = memoryview(base64.b64encode(image))
+    out_path = tmp_path / "card" / "card.png"
+    transport.write_image_atomic(data, str(out_path))
+    assert out_path.read_bytes() == image
+    assert os.listdir(out_path.parent) == ["card.png"]
+
+
+def test_write_image_atomic_leaves_target_on_bad_data(tmp_path):
+    out_path = tmp_path / "card.png"
+    out_path.write_bytes(b"previous")
+    with pytest.raises(ValueError):
+        transport.write_image_atomic("not base64!", str(out_path))
+    assert out_path.read_bytes() == b"previous"
+    assert os.listdir(tmp_path) == ["card.png"]
@@ -4,12 +4,8 @@ Debug script to ask Gemini what it sees in the style reference image.
 """
 import os
 import sys
-from gemini_text import generate_text_with_grounding
-# We need to send the image to Gemini Vision model (e.g. gemini-1.5-flash) to describe it.
-# But gemini_text.py uses text-only model by default? No, 1.5-flash is multimodal.
-# However, gemini_text.py implementation only accepts text prompts.
-
-# I'll use gemini_style.py imports to send an image + prompt to describe it.
+# hypertext.gemini.text only accepts text prompts, so send the image + prompt
+# through the SDK directly.
 try:
     from google import genai
     from google.genai import types